@@ -0,0 +1,21 @@
+"""
+Gunicorn configuration, read from the working directory (``backend/``).
+
+The app is served through ASGI on uvicorn workers: the session event stream
+(interview/session_events.py) is async and waits on the event loop, whereas a
+sync WSGI worker would be held for as long as a stream stays open. Sync views
+are run by Django's ASGI handler thread-sensitively, i.e. one at a time on a
+single thread per worker process, so size GUNICORN_WORKERS for the sync
+request load, not for the number of open streams.
+"""
+
+import multiprocessing
+import os
+
+wsgi_app = "jobify_backend.asgi:application"
+worker_class = "uvicorn_worker.UvicornWorker"
+bind = os.getenv("GUNICORN_BIND", default="127.0.0.1:8000")
+workers = int(os.getenv("GUNICORN_WORKERS", default=multiprocessing.cpu_count() * 2 + 1))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", default=120))  # seconds
+# Event streams end on their own after SESSION_EVENTS_MAX_SECONDS; give them time on restart
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", default=30))
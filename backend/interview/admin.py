@@ -1,6 +1,16 @@
 from django.contrib import admin
 
 from .models.interview_session import InterviewSession
+from .models.job import Job
+from .models.parsed_resume import ParsedResume
+from .models.question_answer import QuestionAnswer
+
+
+class QuestionAnswerInline(admin.TabularInline):
+    model = QuestionAnswer
+    fields = ('kind', 'index', 'question', 'answer', 'answered_at', 'evaluated_at')
+    readonly_fields = ('answered_at', 'evaluated_at')
+    extra = 0
 
 
 @admin.register(InterviewSession)
@@ -9,24 +19,40 @@ class InterviewSessionAdmin(admin.ModelAdmin):
     list_filter = ('resume_status', 'answer_type', 'is_completed', 'uploaded_at', 'created_at')
     search_fields = ('id', 'target_job', 'resume_local_path')
     readonly_fields = ('id', 'uploaded_at', 'created_at', 'updated_at', 'progress', 'completion_percentage', 'tech_progress', 'tech_completion_percentage')
+    inlines = [QuestionAnswerInline]
 
     fieldsets = (
         ('Basic Information', {
             'fields': ('id', 'target_job', 'answer_type', 'resume_status', 'question_status', 'is_completed')
         }),
         ('Resume Fields', {
-            'fields': ('resume_local_path', 'keywords', 'grammar_results')
+            'fields': ('resume_local_path', 'resume_hash', 'keywords', 'keywords_status', 'grammar_results', 'grammar_status')
         }),
         ('Technical Interview', {
-            'fields': ('tech_questions', 'tech_answers', 'tech_feedback')
+            'fields': ('tech_questions',)
         }),
         ('General Interview', {
-            'fields': ('questions', 'answers', 'feedback')
+            'fields': ('questions', 'feedback', 'speculative_questions')
         }),
         ('Progress Tracking', {
             'fields': ('progress', 'completion_percentage', 'tech_progress', 'tech_completion_percentage')
         }),
         ('Metadata', {
-            'fields': ('uploaded_at', 'created_at', 'updated_at')
+            'fields': ('uploaded_at', 'created_at', 'updated_at', 'feedback_started', 'feedback_completed', 'stage_timings')
         }),
     )
+
+
+@admin.register(ParsedResume)
+class ParsedResumeAdmin(admin.ModelAdmin):
+    list_display = ('content_hash', 'hit_count', 'created_at', 'last_used_at')
+    search_fields = ('content_hash',)
+    readonly_fields = ('content_hash', 'created_at', 'last_used_at')
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ('id', 'task', 'status', 'priority', 'attempts', 'max_attempts', 'session_id', 'locked_by', 'run_after', 'created_at')
+    list_filter = ('status', 'task')
+    search_fields = ('id', 'session_id', 'locked_by')
+    readonly_fields = ('created_at', 'started_at', 'finished_at')
@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class InterviewConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'interview'
+
+    def ready(self):
+        # Connect the receivers that count video answers, invalidate cached statuses
+        # and wake session event streams
+        from . import completion, session_cache, session_events  # noqa: F401
@@ -0,0 +1,79 @@
+"""
+Completion tracking for interview sessions.
+
+Instead of recounting answers (and videos) on every submission, each session
+keeps answered/total counters:
+
+    tech_answered / tech_total
+    interview_answered / interview_total
+    video_answered / VIDEO_ANSWERS_REQUIRED
+
+Totals are written with the questions (``InterviewSession.set_questions``).
+Answered counters move by one with ``F()`` updates, in the same transaction
+as the change that caused them:
+
+    - ``store_answer`` when a QuestionAnswer goes from blank to answered or back
+    - ``post_save``/``post_delete`` of a ``Video``
+
+so checking completion is a comparison of a few integers. ``claim_completion``
+then sets ``is_completed`` with a conditional ``UPDATE``; exactly one caller
+can win it, so feedback is queued once per session however many final
+submissions race. The caller queues feedback in the same transaction, so a
+failed enqueue rolls the claim back.
+"""
+
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from jobify_backend.logger import logger
+
+from .models.interview_session import InterviewSession
+from .models.video import Video
+
+VIDEO_ANSWERS_REQUIRED = 3
+
+ANSWERED_FIELDS = {"tech": "tech_answered", "interview": "interview_answered", "video": "video_answered"}
+COUNTER_FIELDS = ("tech_total", "tech_answered", "interview_total", "interview_answered", "video_answered")
+
+
+def adjust_answered(session_id, kind: str, delta: int):
+    """Move one of a session's answered counters by ``delta``."""
+    field = ANSWERED_FIELDS[kind]
+    sessions = InterviewSession.objects.filter(id=session_id)
+    if delta < 0:
+        sessions = sessions.filter(**{f"{field}__gte": -delta})  # never below zero
+    sessions.update(**{field: F(field) + delta})
+
+
+def is_complete(counts: dict) -> bool:
+    """Whether counters (``COUNTER_FIELDS``) show every required answer submitted."""
+    tech_completed = counts["tech_answered"] >= counts["tech_total"]
+    interview_completed = counts["interview_answered"] >= counts["interview_total"]
+    video_completed = counts["video_answered"] >= VIDEO_ANSWERS_REQUIRED
+    return tech_completed and (interview_completed or video_completed)
+
+
+def claim_completion(session_id) -> bool:
+    """
+    Mark the session completed if its counters say so.
+    Returns True only for the call that marked it, which should start feedback.
+    """
+    counts = InterviewSession.objects.filter(id=session_id).values(*COUNTER_FIELDS).first()
+    if counts is None or not is_complete(counts):
+        return False
+    claimed = bool(InterviewSession.objects.filter(id=session_id, is_completed=False).update(is_completed=True))
+    if claimed:
+        logger.info(f"Interview session {session_id} completed: {counts}")
+    return claimed
+
+
+@receiver(post_save, sender=Video)
+def _count_video(sender, instance, created, **kwargs):
+    if created:
+        adjust_answered(instance.interview_session_id, "video", 1)
+
+
+@receiver(post_delete, sender=Video)
+def _uncount_video(sender, instance, **kwargs):
+    adjust_answered(instance.interview_session_id, "video", -1)
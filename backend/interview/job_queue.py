@@ -0,0 +1,338 @@
+"""
+Durable, database-backed job queue for background work.
+
+Resume parsing, question generation, answer evaluation and feedback generation
+are stored as ``Job`` rows instead of running on bare threads, so a gunicorn
+restart or OOM no longer loses work: a job whose worker dies keeps its row and
+is claimed again once its lease expires.
+
+Workers claim jobs with ``SELECT ... FOR UPDATE SKIP LOCKED`` where the database
+supports it (Postgres), so any number of worker processes on any number of
+nodes can share one table. On SQLite a job is claimed with a conditional
+``UPDATE`` that only one worker can win.
+
+Tasks are registered with ``@task`` in each app's ``tasks.py``:
+
+    from interview.job_queue import task
+
+    @task("parse_resume", on_failure=mark_resume_failed)
+    def parse_resume_task(session_id): ...
+
+and enqueued by name:
+
+    from interview.job_queue import enqueue
+
+    enqueue("parse_resume", session_id, session_id=session_id, dedupe_key=f"parse_resume:{session_id}")
+
+A ``dedupe_key`` makes a pipeline single-flight: a partial unique index allows
+only one queued or running job per key (across threads, processes and nodes),
+and a duplicate ``enqueue`` returns the job already in flight instead. A
+caller that has just changed the state a running job reads passes
+``rerun=True``: the running job is then queued again when it finishes instead
+of being marked done, so the change is never lost to a job that read the old
+state.
+
+Run workers with ``python manage.py run_workers --concurrency 4``. With
+``JOB_QUEUE_EMBEDDED_WORKERS`` > 0 (off by default) each web process also runs
+that many worker threads, so a single ``runserver`` keeps working without a
+separate command. A ``run_workers`` process never starts embedded workers, so
+jobs it enqueues itself do not add threads beyond ``--concurrency``.
+"""
+
+import os
+import socket
+import threading
+import traceback
+import uuid
+
+from django.conf import settings
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.module_loading import autodiscover_modules
+
+from jobify_backend.db_connections import managed, managed_connection
+from jobify_backend.logger import logger
+
+from .models.job import Job
+
+_tasks = {}
+_tasks_discovered = False
+_wakeup = threading.Event()
+_embedded_lock = threading.Lock()
+_embedded_pid = None
+
+
+def task(name: str, on_failure=None, max_attempts: int = None):
+    """
+    Register a function as a queue task.
+
+    ``on_failure(*args)`` runs once the job has used all of its attempts, so a
+    task can mark its session FAILED instead of leaving it in PROCESSING.
+    """
+
+    def register(func):
+        _tasks[name] = {"func": func, "on_failure": on_failure, "max_attempts": max_attempts}
+        return func
+
+    return register
+
+
+def _discover_tasks():
+    """Import every installed app's ``tasks`` module so its tasks are registered."""
+    global _tasks_discovered
+    if not _tasks_discovered:
+        autodiscover_modules("tasks")
+        _tasks_discovered = True
+
+
+def enqueue(
+    task_name: str,
+    *args,
+    session_id=None,
+    priority: int = 0,
+    max_attempts: int = None,
+    dedupe_key: str = "",
+    rerun: bool = False,
+) -> Job:
+    """
+    Persist a job for ``task_name(*args)`` and wake local workers.
+
+    If a job with the same ``dedupe_key`` is already queued or running, no new
+    job is created and that job is returned. With ``rerun``, a job that is
+    already running (and may have read the state before the caller changed it)
+    runs again once it finishes.
+    """
+    _discover_tasks()
+    if task_name not in _tasks:
+        raise ValueError(f"Unknown task: {task_name}")
+    max_attempts = max_attempts or _tasks[task_name]["max_attempts"] or settings.JOB_MAX_ATTEMPTS
+    fields = {
+        "task": task_name,
+        "args": [str(arg) if isinstance(arg, uuid.UUID) else arg for arg in args],
+        "session_id": session_id,
+        "priority": priority,
+        "max_attempts": max_attempts,
+        "dedupe_key": dedupe_key,
+    }
+    # A duplicate can finish between the failed insert and the lookup, so try again
+    for _ in range(3):
+        try:
+            with transaction.atomic():
+                job = Job.objects.create(**fields)
+            break
+        except IntegrityError:
+            if not dedupe_key:
+                raise
+            existing = Job.objects.filter(dedupe_key=dedupe_key, status__in=Job.ACTIVE_STATUSES).first()
+            if existing is None:
+                continue
+            if rerun and existing.status == Job.Status.RUNNING:
+                marked = Job.objects.filter(id=existing.id, status=Job.Status.RUNNING).update(rerun=True)
+                if not marked:
+                    # It finished meanwhile: its key is free for a new job
+                    continue
+                logger.info(f"Job {existing.id} for {dedupe_key} will run again when it finishes")
+            else:
+                logger.info(f"Attached to in-flight job {existing.id} for {dedupe_key}")
+            return existing
+    else:
+        raise IntegrityError(f"Could not enqueue {task_name} for {dedupe_key}")
+    logger.info(f"Enqueued job {job.id} {task_name} for session {session_id}")
+    # Inside a caller's transaction, workers can only see the job once it commits
+    transaction.on_commit(_wakeup.set)
+    start_embedded_workers()
+    return job
+
+
+def _claimable(now):
+    """Queued jobs that are due, plus running jobs whose worker lost its lease."""
+    return Job.objects.filter(
+        Q(status=Job.Status.QUEUED, run_after__lte=now)
+        | Q(status=Job.Status.RUNNING, lease_expires_at__lt=now)
+    ).order_by("-priority", "run_after", "id")
+
+
+def claim_job(worker_id: str):
+    """Claim the next due job for ``worker_id`` and return it, or None if there is none."""
+    now = timezone.now()
+    lease = now + timezone.timedelta(seconds=settings.JOB_LEASE_SECONDS)
+    claimed = {
+        "status": Job.Status.RUNNING,
+        "locked_by": worker_id,
+        "lease_expires_at": lease,
+        "started_at": now,
+    }
+
+    if connection.features.has_select_for_update_skip_locked:
+        with transaction.atomic():
+            job = _claimable(now).select_for_update(skip_locked=True).first()
+            if job is None:
+                return None
+            for field, value in claimed.items():
+                setattr(job, field, value)
+            job.attempts += 1
+            job.save(update_fields=[*claimed, "attempts"])
+            return job
+
+    # No SKIP LOCKED (SQLite): the conditional update only succeeds for one worker
+    for job in _claimable(now)[:10]:
+        won = Job.objects.filter(
+            id=job.id, status=job.status, lease_expires_at=job.lease_expires_at, attempts=job.attempts
+        ).update(attempts=job.attempts + 1, **claimed)
+        if won:
+            job.refresh_from_db()
+            return job
+    return None
+
+
+def _heartbeat(job: Job, worker_id: str, stop: threading.Event):
+    """Extend the job's lease while it runs, so slow jobs are not reclaimed."""
+    interval = max(settings.JOB_LEASE_SECONDS / 3, 1)
+    while not stop.wait(interval):
+        # Hold a connection only for the update, not for the whole wait
+        with managed_connection("heartbeat"):
+            try:
+                Job.objects.filter(id=job.id, locked_by=worker_id, status=Job.Status.RUNNING).update(
+                    lease_expires_at=timezone.now() + timezone.timedelta(seconds=settings.JOB_LEASE_SECONDS)
+                )
+            except Exception as e:
+                logger.error(f"Heartbeat failed for job {job.id}: {e}")
+
+
+def _finish(job: Job, worker_id: str, status: str, **fields) -> bool:
+    """
+    Record a run's final ``status``, unless ``enqueue(rerun=True)`` asked for
+    another run meanwhile: then queue the job again and return False.
+    """
+    # Both updates are conditional on the flag, so a concurrent enqueue either
+    # sets it before the job leaves RUNNING or finds the key free
+    if Job.objects.filter(id=job.id, locked_by=worker_id, rerun=False).update(
+        status=status, finished_at=timezone.now(), lease_expires_at=None, **fields
+    ):
+        return True
+    requeued = Job.objects.filter(id=job.id, locked_by=worker_id, rerun=True).update(
+        status=Job.Status.QUEUED,
+        rerun=False,
+        attempts=0,
+        run_after=timezone.now(),
+        locked_by="",
+        lease_expires_at=None,
+    )
+    if not requeued:
+        # Another worker reclaimed the job after our lease expired
+        return True
+    logger.info(f"Job {job.id} {job.task} queued again: its state changed while it ran")
+    _wakeup.set()
+    return False
+
+
+def run_job(job: Job, worker_id: str):
+    """Run a claimed job and record its outcome (success, retry or final failure)."""
+    _discover_tasks()
+    registered = _tasks.get(job.task)
+    stop = threading.Event()
+    heartbeat = threading.Thread(target=_heartbeat, args=(job, worker_id, stop), daemon=True)
+    heartbeat.start()
+    try:
+        if job.attempts > job.max_attempts:
+            # Reclaimed after its worker died on the last attempt
+            job.attempts = job.max_attempts
+            raise RuntimeError("Worker lost the job on its final attempt")
+        if registered is None:
+            raise ValueError(f"Unknown task: {job.task}")
+        registered["func"](*job.args)
+    except Exception as e:
+        error = f"{e}\n{traceback.format_exc()}"
+        if job.attempts < job.max_attempts:
+            delay = settings.JOB_RETRY_BASE_SECONDS * 2 ** (job.attempts - 1)
+            logger.warning(f"Job {job.id} {job.task} failed (attempt {job.attempts}), retrying in {delay}s: {e}")
+            Job.objects.filter(id=job.id, locked_by=worker_id).update(
+                status=Job.Status.QUEUED,
+                run_after=timezone.now() + timezone.timedelta(seconds=delay),
+                last_error=error,
+                rerun=False,  # the retry reads the state afresh
+                locked_by="",
+                lease_expires_at=None,
+            )
+        elif _finish(job, worker_id, Job.Status.FAILED, last_error=error):
+            logger.error(f"Job {job.id} {job.task} failed after {job.attempts} attempts: {e}")
+            if registered and registered["on_failure"]:
+                try:
+                    registered["on_failure"](*job.args)
+                except Exception as hook_error:
+                    logger.error(f"on_failure hook for job {job.id} {job.task} failed: {hook_error}")
+    else:
+        if _finish(job, worker_id, Job.Status.SUCCEEDED):
+            logger.info(f"Job {job.id} {job.task} succeeded")
+    finally:
+        stop.set()
+
+
+def make_worker_id(suffix: str = "") -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{suffix or uuid.uuid4().hex[:8]}"
+
+
+def work(worker_id: str, stop: threading.Event, poll_interval: float = None, burst: bool = False):
+    """
+    Claim and run jobs until ``stop`` is set.
+
+    With ``burst`` the loop returns as soon as no job is due.
+    """
+    poll_interval = poll_interval or settings.JOB_POLL_INTERVAL
+    _discover_tasks()
+    while not stop.is_set():
+        # Each claim and each job checks out a connection and releases it when done,
+        # so idle workers hold none
+        try:
+            with managed_connection("claim"):
+                job = claim_job(worker_id)
+        except Exception as e:
+            logger.error(f"Worker {worker_id} failed to claim a job: {e}")
+            job = None
+        if job is not None:
+            with managed_connection("job"):
+                run_job(job, worker_id)
+            continue
+        if burst:
+            return
+        _wakeup.wait(poll_interval)
+        _wakeup.clear()
+
+
+def worker_thread(worker_id: str, stop: threading.Event, **kwargs) -> threading.Thread:
+    """Return a started daemon thread running ``work``; it releases its DB connection on exit."""
+
+    @managed(label="worker")
+    def run():
+        try:
+            work(worker_id, stop, **kwargs)
+        except Exception as e:
+            logger.error(f"Worker {worker_id} crashed: {e}")
+
+    thread = threading.Thread(target=run, name=f"job-worker-{worker_id.rsplit(':', 1)[-1]}", daemon=True)
+    thread.start()
+    return thread
+
+
+def mark_dedicated_worker():
+    """Never start embedded workers in this process: it runs its own (``run_workers``)."""
+    global _embedded_pid
+    with _embedded_lock:
+        _embedded_pid = os.getpid()
+
+
+def start_embedded_workers():
+    """Start ``JOB_QUEUE_EMBEDDED_WORKERS`` worker threads in this process, once per process."""
+    global _embedded_pid
+    count = settings.JOB_QUEUE_EMBEDDED_WORKERS
+    if count <= 0 or _embedded_pid == os.getpid():
+        return
+    with _embedded_lock:
+        if _embedded_pid == os.getpid():
+            return
+        _embedded_pid = os.getpid()
+        stop = threading.Event()
+        for index in range(count):
+            worker_thread(make_worker_id(f"embedded-{index}"), stop)
+        logger.info(f"Started {count} embedded job workers in pid {_embedded_pid}")
@@ -0,0 +1,48 @@
+import signal
+import threading
+
+from django.core.management.base import BaseCommand
+
+from interview.job_queue import make_worker_id, mark_dedicated_worker, worker_thread
+
+
+class Command(BaseCommand):
+    help = "Run background job workers (resume parsing, question and feedback generation)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--concurrency", type=int, default=4, help="Number of worker threads")
+        parser.add_argument(
+            "--poll-interval", type=float, default=None, help="Seconds between polls when idle"
+        )
+        parser.add_argument(
+            "--burst", action="store_true", help="Exit once there are no due jobs left"
+        )
+
+    def handle(self, *args, **options):
+        # Jobs enqueued by these workers must not start embedded workers on top of them
+        mark_dedicated_worker()
+        stop = threading.Event()
+
+        def shutdown(signum, frame):
+            self.stdout.write("Shutting down after running jobs finish...")
+            stop.set()
+
+        signal.signal(signal.SIGTERM, shutdown)
+        signal.signal(signal.SIGINT, shutdown)
+
+        threads = [
+            worker_thread(
+                make_worker_id(f"worker-{index}"),
+                stop,
+                poll_interval=options["poll_interval"],
+                burst=options["burst"],
+            )
+            for index in range(options["concurrency"])
+        ]
+        self.stdout.write(f"Started {len(threads)} job workers")
+
+        # Join with a timeout so the main thread keeps handling signals
+        while any(thread.is_alive() for thread in threads):
+            for thread in threads:
+                thread.join(timeout=1)
+        self.stdout.write(self.style.SUCCESS("Job workers stopped"))
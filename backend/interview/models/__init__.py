@@ -1,2 +1,6 @@
+from .banked_question import BankedQuestion
 from .interview_session import InterviewSession
-from .video import Video
\ No newline at end of file
+from .job import Job
+from .parsed_resume import ParsedResume
+from .question_answer import QuestionAnswer
+from .video import Video
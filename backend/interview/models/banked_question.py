@@ -0,0 +1,37 @@
+from django.db import models
+
+
+class BankedQuestion(models.Model):
+    """A generated interview question kept for reuse across sessions."""
+
+    class Kind(models.TextChoices):
+        TECH = "tech", "Technical"
+        INTERVIEW = "interview", "Interview"
+
+    kind = models.CharField(max_length=10, choices=Kind.choices)
+    question = models.TextField()
+
+    # Lookup keys, see interview/question_bank.py
+    job_title = models.CharField(max_length=255)  # canonical, e.g. "software engineer"
+    keywords = models.JSONField(default=list)  # normalized and sorted, e.g. ["django", "python"]
+    keyword_signature = models.CharField(max_length=64)  # sha1 of the normalized keywords
+
+    # Generation metadata from the agents (empty for single-call generation)
+    interviewer_role = models.CharField(max_length=50, blank=True, default="")
+    focus_area = models.CharField(max_length=255, blank=True, default="")
+    difficulty = models.PositiveSmallIntegerField(default=3)
+
+    # Freshness/diversity tracking
+    times_served = models.PositiveIntegerField(default=0)
+    last_served_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.get_kind_display()} question for {self.job_title}: {self.question[:50]}"
+
+    class Meta:
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["job_title", "kind", "created_at"]),
+            models.Index(fields=["keyword_signature"]),
+        ]
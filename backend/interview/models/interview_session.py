@@ -1,6 +1,8 @@
 import uuid
 
-from django.db import models
+from django.db import models, transaction
+
+from .question_answer import QuestionAnswer
 
 
 class InterviewSession(models.Model):
@@ -14,6 +16,9 @@ class InterviewSession(models.Model):
         TEXT = "text", "Text"
         VIDEO = "video", "Video"
 
+    # Light columns polling endpoints need before deciding whether to load any results
+    STATUS_FIELDS = ("resume_status", "keywords_status", "grammar_status", "question_status", "feedback_status")
+
     # Primary key - using doc_id as the primary identifier
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
 
@@ -21,6 +26,9 @@ class InterviewSession(models.Model):
     resume_local_path = models.CharField(
         max_length=512, default=""
     )  # e.g. "resumes/123e4567-e89b-12d3-a456-426614174000.pdf"
+    resume_hash = models.CharField(
+        max_length=64, blank=True, default="", db_index=True
+    )  # sha256 of the PDF bytes, see ParsedResume
     keywords = models.JSONField(default=list)  # stores like ["python", "django"]
     target_job = models.CharField(max_length=255, blank=True, null=True)
     answer_type = models.CharField(
@@ -29,28 +37,41 @@ class InterviewSession(models.Model):
     resume_status = models.CharField(
         max_length=20, choices=Status.choices, default=Status.PROCESSING
     )
+    # Per-stage status of the resume pipeline (parse -> {keywords, grammar})
+    keywords_status = models.CharField(
+        max_length=20, choices=Status.choices, default=Status.PROCESSING
+    )
     grammar_results = models.JSONField(blank=True, null=True)
+    grammar_status = models.CharField(
+        max_length=20, choices=Status.choices, default=Status.PROCESSING
+    )
 
     question_status = models.CharField(
         max_length=20, choices=Status.choices, default=Status.PROCESSING
     )
+    speculative_questions = models.JSONField(
+        default=dict
+    )  # Pre-generated before target_job, by canonical title: {"software engineer": {"title": ..., "tech_questions": [...], "questions": [...]}}
 
-    # Technical interview fields
+    # Question lists as served to the client; answers and their evaluations
+    # live in one QuestionAnswer row per question (see set_questions)
     tech_questions = models.JSONField(
         default=list
     )  # ["Tech Question 1?", "Tech Question 2?", "Tech Question 3?"]
-    tech_answers = models.JSONField(
-        default=list
-    )  # ["Tech Answer 1", "Tech Answer 2", "Tech Answer 3"]
-
-    # General interview fields
     questions = models.JSONField(
         default=list
     )  # ["Question 1?", "Question 2?", "Question 3?"]
-    answers = models.JSONField(default=list)  # ["Answer 1", "Answer 2", "Answer 3"]
     is_completed = models.BooleanField(
         default=False
-    )  # Track if all questions are answered
+    )  # Set once when all questions are answered, see interview/completion.py
+
+    # Completion counters; totals are set with the questions, answered counts
+    # move with F() updates as answers and videos change
+    tech_total = models.PositiveSmallIntegerField(default=0)
+    tech_answered = models.PositiveSmallIntegerField(default=0)
+    interview_total = models.PositiveSmallIntegerField(default=0)
+    interview_answered = models.PositiveSmallIntegerField(default=0)
+    video_answered = models.PositiveSmallIntegerField(default=0)
 
     # feedback
     feedback = models.JSONField(default=dict)   # All feedbacks in one JSON object
@@ -61,6 +82,9 @@ class InterviewSession(models.Model):
     feedback_completed = models.DateTimeField(
         null=True, blank=True, help_text="When feedback generation was completed"
     )
+    stage_timings = models.JSONField(
+        default=dict
+    )  # Seconds spent per pipeline stage, e.g. {"llamaparse": 4.2, "keywords": 1.3, "synthesis": 6.8}
 
     # Timestamps
     uploaded_at = models.DateTimeField(
@@ -70,46 +94,95 @@ class InterviewSession(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
 
+    @classmethod
+    def record_stage_timings(cls, session_id, timings: dict):
+        """Add stage durations to a session's ``stage_timings`` without touching other fields"""
+        if not timings:
+            return
+        with transaction.atomic():
+            session = cls.objects.select_for_update().only("stage_timings").get(id=session_id)
+            for stage, seconds in timings.items():
+                session.stage_timings[stage] = round(session.stage_timings.get(stage, 0) + seconds, 3)
+            session.save(update_fields=["stage_timings"])
+
+    def set_questions(self, tech_questions: list, questions: list, update_fields=()):
+        """
+        Store the session's questions as COMPLETE together with one empty
+        QuestionAnswer row per question, and reset the answer counters. Only
+        those columns (and any ``update_fields``) are written, so concurrent
+        writers are not overwritten.
+        """
+        self.tech_questions = tech_questions
+        self.questions = questions
+        self.question_status = self.Status.COMPLETE
+        self.tech_total, self.interview_total = len(tech_questions), len(questions)
+        self.tech_answered = self.interview_answered = 0
+        self.is_completed = False
+        with transaction.atomic():
+            self.save(
+                update_fields=[
+                    "tech_questions",
+                    "questions",
+                    "question_status",
+                    "tech_total",
+                    "interview_total",
+                    "tech_answered",
+                    "interview_answered",
+                    "is_completed",
+                    *update_fields,
+                ]
+            )
+            self.question_answers.all().delete()
+            QuestionAnswer.objects.bulk_create(
+                [
+                    QuestionAnswer(session=self, kind=kind, index=index, question=question)
+                    for kind, kind_questions in (
+                        (QuestionAnswer.Kind.TECH, tech_questions),
+                        (QuestionAnswer.Kind.INTERVIEW, questions),
+                    )
+                    for index, question in enumerate(kind_questions)
+                ]
+            )
+
+    def answer_list(self, kind: str) -> list:
+        """Answers of one kind in question order, "" where unanswered."""
+        stored = dict(self.question_answers.filter(kind=kind).values_list("index", "answer"))
+        return [stored.get(index, "") for index in range(max(stored, default=-1) + 1)]
+
+    @property
+    def answers(self):
+        return self.answer_list("interview")
+
+    @property
+    def tech_answers(self):
+        return self.answer_list("tech")
+
     def __str__(self):
         return f"Interview Session {self.id} ({self.resume_status})"
 
     @property
     def progress(self):
         """Return the number of answered questions out of total questions"""
-        answered_count = len(
-            [answer for answer in self.answers if answer and answer.strip()]
-        )
-        total_count = len(self.questions)
-        return f"{answered_count}/{total_count}"
+        return f"{self.interview_answered}/{self.interview_total}"
 
     @property
     def completion_percentage(self):
         """Return completion percentage"""
-        if not self.questions:
+        if not self.interview_total:
             return 0
-        answered_count = len(
-            [answer for answer in self.answers if answer and answer.strip()]
-        )
-        return round((answered_count / len(self.questions)) * 100, 1)
+        return round((self.interview_answered / self.interview_total) * 100, 1)
 
     @property
     def tech_progress(self):
         """Return the number of answered technical questions out of total technical questions"""
-        answered_count = len(
-            [answer for answer in self.tech_answers if answer and answer.strip()]
-        )
-        total_count = len(self.tech_questions)
-        return f"{answered_count}/{total_count}"
+        return f"{self.tech_answered}/{self.tech_total}"
 
     @property
     def tech_completion_percentage(self):
         """Return technical questions completion percentage"""
-        if not self.tech_questions:
+        if not self.tech_total:
             return 0
-        answered_count = len(
-            [answer for answer in self.tech_answers if answer and answer.strip()]
-        )
-        return round((answered_count / len(self.tech_questions)) * 100, 1)
+        return round((self.tech_answered / self.tech_total) * 100, 1)
 
     class Meta:
         ordering = ["-created_at"]
@@ -0,0 +1,57 @@
+from django.db import models
+from django.utils import timezone
+
+
+class Job(models.Model):
+    """A unit of background work, claimed and run by a worker (see interview/job_queue.py)."""
+
+    class Status(models.TextChoices):
+        QUEUED = "queued", "Queued"
+        RUNNING = "running", "Running"
+        SUCCEEDED = "succeeded", "Succeeded"
+        FAILED = "failed", "Failed"
+
+    ACTIVE_STATUSES = (Status.QUEUED, Status.RUNNING)
+
+    task = models.CharField(max_length=100)  # registered task name, e.g. "parse_resume"
+    args = models.JSONField(default=list)  # JSON-serializable positional arguments
+    session_id = models.UUIDField(null=True, blank=True, db_index=True)  # InterviewSession the job works on
+    dedupe_key = models.CharField(
+        max_length=255, blank=True, default=""
+    )  # e.g. "parse_resume:<session id>"; at most one queued/running job per key
+
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.QUEUED)
+    priority = models.SmallIntegerField(default=0)  # higher runs first
+    run_after = models.DateTimeField(default=timezone.now)  # not claimed before this (retry backoff)
+
+    # Retries
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=3)
+    last_error = models.TextField(blank=True, default="")
+    rerun = models.BooleanField(default=False)  # run again once the current run ends (see enqueue)
+
+    # Lease held by the worker running the job; an expired lease means the worker died
+    locked_by = models.CharField(max_length=255, blank=True, default="")
+    lease_expires_at = models.DateTimeField(null=True, blank=True)
+
+    # Timestamps
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"Job {self.id} {self.task} ({self.status})"
+
+    class Meta:
+        ordering = ["-created_at"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["dedupe_key"],
+                condition=models.Q(status__in=["queued", "running"]) & ~models.Q(dedupe_key=""),
+                name="unique_active_job_dedupe_key",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["status", "run_after", "priority"]),
+            models.Index(fields=["status", "lease_expires_at"]),
+        ]
@@ -0,0 +1,24 @@
+from django.db import models
+
+
+class ParsedResume(models.Model):
+    """Parse results for a resume PDF, keyed by the SHA-256 of its bytes."""
+
+    content_hash = models.CharField(
+        max_length=64, primary_key=True
+    )  # sha256 hex digest of the uploaded PDF
+    parsed_text = models.TextField(blank=True, default="")
+    keywords = models.JSONField(default=list)  # stores like ["python", "django"]
+    grammar_results = models.JSONField(blank=True, null=True)
+
+    hit_count = models.PositiveIntegerField(default=0)  # Uploads served from this entry
+
+    # Timestamps
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_used_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Parsed Resume {self.content_hash[:12]} ({len(self.keywords)} keywords)"
+
+    class Meta:
+        ordering = ["-last_used_at"]
@@ -0,0 +1,36 @@
+from django.db import models
+
+
+class QuestionAnswer(models.Model):
+    """One question of an interview session, with its answer and reviewer evaluations."""
+
+    class Kind(models.TextChoices):
+        TECH = "tech", "Technical"
+        INTERVIEW = "interview", "Interview"
+
+    session = models.ForeignKey(
+        "interview.InterviewSession", on_delete=models.CASCADE, related_name="question_answers"
+    )
+    kind = models.CharField(max_length=10, choices=Kind.choices)
+    index = models.PositiveSmallIntegerField()  # position among the session's questions of this kind (0-based)
+    question = models.TextField()
+    answer = models.TextField(blank=True, default="")
+
+    # Reviewer agent output for this answer, see interview/utils.py evaluate_answer_background
+    evaluation = models.JSONField(
+        blank=True, null=True
+    )  # {"answer_hash": "...", "evaluations": [...]}
+
+    answered_at = models.DateTimeField(null=True, blank=True)  # set while the answer is non-blank
+    evaluated_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.get_kind_display()} question {self.index} of session {self.session_id}"
+
+    class Meta:
+        ordering = ["kind", "index"]
+        constraints = [
+            models.UniqueConstraint(fields=["session", "kind", "index"], name="unique_question_answer_slot"),
+        ]
@@ -1,10 +1,12 @@
+import asyncio
 import json
 import re
 from enum import Enum
+from functools import partial
 from typing import List, Dict, Any
 
-import requests
-
+from jobify_backend.llm_client import llm_client
+from jobify_backend.llm_engine import llm_engine
 from jobify_backend.logger import logger
 
 
@@ -64,9 +66,9 @@ class BaseAgent:
         }
         return personalities.get(self.role, "You are a professional interviewer.")
 
-    def generate_question_sync(self, target_job: str, keywords: List[str]) -> Dict[str, Any]:
-        """Synchronous version of question generation"""
-        prompt = f"""{self.personality}
+    def _question_prompt(self, target_job: str, keywords: List[str]) -> str:
+        """Build the question generation prompt for this agent"""
+        return f"""{self.personality}
         
         You're interviewing for: {target_job}
         Key skills/keywords: {', '.join(keywords)}
@@ -86,42 +88,54 @@ class BaseAgent:
         Do not include any explanation or markdown, just the JSON.
         """
 
+    def _parse_question(self, response_text: str) -> Dict[str, Any]:
+        """Parse a question generation response"""
+        cleaned_text = clean_json_response(response_text)
+        question_data = json.loads(cleaned_text)
+
+        return {
+            "question": question_data["question"],
+            "interviewer_role": self.role.value,
+            "focus_area": question_data.get("focus_area", "General"),
+            "difficulty": question_data.get("difficulty", 3)
+        }
+
+    def _fallback_question(self, keywords: List[str], error: Exception) -> Dict[str, Any]:
+        """Fallback question used when generation fails"""
+        logger.error(f"Error generating question for {self.role.value}: {error}")
+        return {
+            "question": f"Tell me about your experience with {keywords[0] if keywords else 'this role'}.",
+            "interviewer_role": self.role.value,
+            "focus_area": "General Experience",
+            "difficulty": 2,
+            "fallback": True
+        }
+
+    def generate_question_sync(self, target_job: str, keywords: List[str]) -> Dict[str, Any]:
+        """Synchronous version of question generation"""
+        prompt = self._question_prompt(target_job, keywords)
         try:
-            response = requests.post(
-                "https://openrouter.ai/api/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": "openai/gpt-4o",
-                    "messages": [{"role": "user", "content": prompt}]
-                }
+            response_text = llm_client.chat_completion(
+                prompt, api_key=self.api_key, call_type="question", validate=self._parse_question
             )
+            return self._parse_question(response_text)
+        except Exception as e:
+            return self._fallback_question(keywords, e)
 
-            response_text = response.json()["choices"][0]["message"]["content"]
-            # Clean and parse the response
-            cleaned_text = clean_json_response(response_text)
-            question_data = json.loads(cleaned_text)
-
-            return {
-                "question": question_data["question"],
-                "interviewer_role": self.role.value,
-                "focus_area": question_data.get("focus_area", "General"),
-                "difficulty": question_data.get("difficulty", 3)
-            }
+    async def generate_question(self, target_job: str, keywords: List[str]) -> Dict[str, Any]:
+        """Async version of question generation, run on the LLM engine loop"""
+        prompt = self._question_prompt(target_job, keywords)
+        try:
+            response_text = await llm_engine.chat_completion(
+                prompt, api_key=self.api_key, call_type="question", validate=self._parse_question
+            )
+            return self._parse_question(response_text)
         except Exception as e:
-            logger.error(f"Error generating question for {self.role.value}: {e}")
-            return {
-                "question": f"Tell me about your experience with {keywords[0] if keywords else 'this role'}.",
-                "interviewer_role": self.role.value,
-                "focus_area": "General Experience",
-                "difficulty": 2
-            }
+            return self._fallback_question(keywords, e)
 
-    def evaluate_answer_sync(self, question: str, answer: str, target_job: str, keywords: List[str]) -> Dict[str, Any]:
-        """Synchronous version of answer evaluation"""
-        prompt = f"""{self.personality}
+    def _evaluation_prompt(self, question: str, answer: str, target_job: str, keywords: List[str]) -> str:
+        """Build the answer evaluation prompt for this agent"""
+        return f"""{self.personality}
         
         Job: {target_job}
         Required skills: {', '.join(keywords)}
@@ -143,31 +157,133 @@ class BaseAgent:
         Score should be out of 10. Do not include any explanation or markdown, just the JSON.
         """
 
+    def _fallback_evaluation(self, error: Exception) -> Dict[str, Any]:
+        """Fallback evaluation used when the evaluation call fails"""
+        logger.error(f"Error evaluating answer for {self.role.value}: {error}")
+        return {
+            "score": 5,
+            "strengths": ["Attempted to answer"],
+            "weaknesses": ["Could not evaluate properly"],
+            "specific_feedback": "Error in evaluation",
+            "improvement_tips": ["Try to provide more specific examples"]
+        }
+
+    def evaluate_answer_sync(self, question: str, answer: str, target_job: str, keywords: List[str]) -> Dict[str, Any]:
+        """Synchronous version of answer evaluation"""
+        prompt = self._evaluation_prompt(question, answer, target_job, keywords)
+        try:
+            response_text = llm_client.chat_completion(
+                prompt, api_key=self.api_key, call_type="evaluation", validate=parse_evaluation
+            )
+            return parse_evaluation(response_text)
+        except Exception as e:
+            return self._fallback_evaluation(e)
+
+    async def evaluate_answer(self, question: str, answer: str, target_job: str, keywords: List[str]) -> Dict[str, Any]:
+        """Async version of answer evaluation, run on the LLM engine loop"""
+        prompt = self._evaluation_prompt(question, answer, target_job, keywords)
+        try:
+            response_text = await llm_engine.chat_completion(
+                prompt, api_key=self.api_key, call_type="evaluation", validate=parse_evaluation
+            )
+            return parse_evaluation(response_text)
+        except Exception as e:
+            return self._fallback_evaluation(e)
+
+    def _batch_evaluation_prompt(self, items: List[tuple], target_job: str, keywords: List[str]) -> str:
+        """Build a prompt evaluating several (question, answer) pairs in one call"""
+        answers = "\n".join(
+            f'{index}. Question asked: "{question}"\n   Candidate\'s answer: "{answer}"'
+            for index, (question, answer) in enumerate(items)
+        )
+        return f"""{self.personality}
+        
+        Job: {target_job}
+        Required skills: {', '.join(keywords)}
+        
+        Interview answers to evaluate:
+        {answers}
+        
+        Evaluate each answer separately from your specific perspective as a {self.role.value}.
+        
+        Return ONLY a valid JSON object with one evaluation per answer, in the same order:
+        {{
+            "evaluations": [
+                {{
+                    "index": 0,
+                    "score": 7,
+                    "strengths": ["strength1", "strength2"],
+                    "weaknesses": ["weakness1", "weakness2"],
+                    "specific_feedback": "Detailed feedback from your role's perspective",
+                    "improvement_tips": ["tip1", "tip2"]
+                }}
+            ]
+        }}
+        
+        Scores should be out of 10. Do not include any explanation or markdown, just the JSON.
+        """
+
+    @staticmethod
+    def _parse_batch_evaluations(response_text: str, count: int) -> List[Any]:
+        """Parse a batched evaluation response; unusable items are returned as None"""
+        try:
+            data = json.loads(clean_json_response(response_text))
+            evaluations = data["evaluations"] if isinstance(data, dict) else data
+        except (ValueError, KeyError, TypeError):
+            return [None] * count
+
+        parsed = [None] * count
+        for position, evaluation in enumerate(evaluations if isinstance(evaluations, list) else []):
+            if not isinstance(evaluation, dict) or "score" not in evaluation:
+                continue
+            index = evaluation.pop("index", position)
+            if isinstance(index, int) and 0 <= index < count and parsed[index] is None:
+                parsed[index] = evaluation
+        return parsed
+
+    @classmethod
+    def _validate_batch_evaluations(cls, response_text: str, count: int):
+        """Reject batched responses that miss any answer, so they are not cached"""
+        if None in cls._parse_batch_evaluations(response_text, count):
+            raise ValueError("Batched evaluation response is incomplete")
+
+    async def evaluate_answers(self, items: List[tuple], target_job: str, keywords: List[str]) -> List[Dict[str, Any]]:
+        """
+        Evaluate several (question, answer) pairs in a single call.
+        Items missing from the response fall back to one evaluate_answer call each.
+        """
+        if len(items) == 1:
+            question, answer = items[0]
+            return [await self.evaluate_answer(question, answer, target_job, keywords)]
+
+        prompt = self._batch_evaluation_prompt(items, target_job, keywords)
         try:
-            response = requests.post(
-                "https://openrouter.ai/api/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": "openai/gpt-4o",
-                    "messages": [{"role": "user", "content": prompt}],
-
-                }
+            response_text = await llm_engine.chat_completion(
+                prompt,
+                api_key=self.api_key,
+                call_type="evaluation",
+                validate=partial(self._validate_batch_evaluations, count=len(items)),
             )
-            response_text = response.json()["choices"][0]["message"]["content"]
-            cleaned_text = clean_json_response(response_text)
-            return json.loads(cleaned_text)
+            parsed = self._parse_batch_evaluations(response_text, len(items))
         except Exception as e:
-            logger.error(f"Error evaluating answer for {self.role.value}: {e}")
-            return {
-                "score": 5,
-                "strengths": ["Attempted to answer"],
-                "weaknesses": ["Could not evaluate properly"],
-                "specific_feedback": "Error in evaluation",
-                "improvement_tips": ["Try to provide more specific examples"]
-            }
+            logger.error(f"Error in batched evaluation for {self.role.value}: {e}")
+            parsed = [None] * len(items)
+
+        missing = [index for index, evaluation in enumerate(parsed) if evaluation is None]
+        if missing:
+            logger.warning(f"Batched evaluation for {self.role.value} missed {len(missing)} of {len(items)} answers")
+            retried = await asyncio.gather(*(
+                self.evaluate_answer(items[index][0], items[index][1], target_job, keywords)
+                for index in missing
+            ))
+            for index, evaluation in zip(missing, retried):
+                parsed[index] = evaluation
+        return parsed
+
+
+def parse_evaluation(response_text: str) -> Dict[str, Any]:
+    """Parse a single answer evaluation response"""
+    return json.loads(clean_json_response(response_text))
 
 
 def clean_json_response(response_text):
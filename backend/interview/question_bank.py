@@ -0,0 +1,207 @@
+"""
+Persisted question bank shared across interview sessions.
+
+Many sessions target the same job ("Software Engineer") with overlapping
+resume keywords, so generated questions are deposited here and drawn again
+for similar sessions instead of calling the LLM every time.
+
+Lookup is by canonical job title, then keyword similarity (Jaccard over the
+normalized keyword sets). The draw policy is controlled by settings:
+    QUESTION_BANK_REUSE_RATIO       share of sessions served from the bank when a match exists
+    QUESTION_BANK_MIN_SIMILARITY    minimum keyword similarity for a question to match
+    QUESTION_BANK_MAX_AGE_DAYS      questions older than this are not served (freshness)
+    QUESTION_BANK_MAX_SERVES        questions served this many times are retired (diversity)
+"""
+
+import hashlib
+import random
+import re
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+
+from jobify_backend.logger import logger
+
+from .models.banked_question import BankedQuestion
+
+# Seniority and filler words that do not change which questions fit a role
+_TITLE_STOPWORDS = {
+    "senior", "sr", "junior", "jr", "principal", "staff", "lead", "intern", "internship",
+    "entry", "level", "mid", "i", "ii", "iii", "iv", "1", "2", "3", "the", "a", "an",
+}
+
+_TITLE_ALIASES = {
+    "swe": "software engineer",
+    "sde": "software engineer",
+    "software developer": "software engineer",
+    "software development engineer": "software engineer",
+    "programmer": "software engineer",
+    "front end": "frontend",
+    "front-end": "frontend",
+    "back end": "backend",
+    "back-end": "backend",
+    "full stack": "fullstack",
+    "full-stack": "fullstack",
+    "ml": "machine learning",
+    "pm": "product manager",
+}
+
+# Number of questions a session needs from the bank
+TECH_QUESTION_COUNT = 1
+INTERVIEW_QUESTION_COUNT = 3
+
+
+def canonical_job_title(title: str) -> str:
+    """Normalize a free-form job title, e.g. "Sr. Software Developer II" -> "software engineer"."""
+    text = (title or "").lower()
+    for alias, canonical in sorted(_TITLE_ALIASES.items(), key=lambda item: -len(item[0])):
+        text = re.sub(rf"(?<![\w-]){re.escape(alias)}(?![\w-])", canonical, text)
+    words = [word for word in re.findall(r"[a-z0-9+#]+", text) if word not in _TITLE_STOPWORDS]
+    return " ".join(words)
+
+
+def normalize_keywords(keywords: List[str]) -> List[str]:
+    """Lowercase, strip and deduplicate keywords into a sorted list."""
+    return sorted({keyword.strip().lower() for keyword in keywords or [] if keyword and keyword.strip()})
+
+
+def keyword_signature(keywords: List[str]) -> str:
+    """Stable signature of a keyword set."""
+    return hashlib.sha1("|".join(normalize_keywords(keywords)).encode("utf-8")).hexdigest()
+
+
+def keyword_similarity(first: List[str], second: List[str]) -> float:
+    """Jaccard similarity of two keyword sets."""
+    a, b = set(normalize_keywords(first)), set(normalize_keywords(second))
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def _pick_diverse(candidates: List[tuple], count: int) -> List[BankedQuestion]:
+    """Pick ``count`` questions, best match first, without repeating an interviewer role."""
+    picked, roles = [], set()
+    for _, question in candidates:
+        if question.interviewer_role and question.interviewer_role in roles:
+            continue
+        picked.append(question)
+        roles.add(question.interviewer_role)
+        if len(picked) == count:
+            return picked
+    # Not enough distinct roles: fill with the remaining best matches
+    for _, question in candidates:
+        if question not in picked:
+            picked.append(question)
+            if len(picked) == count:
+                break
+    return picked
+
+
+def _matching_questions(kind: str, job_title: str, keywords: List[str]) -> List[tuple]:
+    """Return ``(similarity, question)`` pairs eligible to be served, best first."""
+    oldest = timezone.now() - timezone.timedelta(days=settings.QUESTION_BANK_MAX_AGE_DAYS)
+    candidates = BankedQuestion.objects.filter(
+        kind=kind,
+        job_title=job_title,
+        created_at__gte=oldest,
+        times_served__lt=settings.QUESTION_BANK_MAX_SERVES,
+    )[: settings.QUESTION_BANK_CANDIDATE_LIMIT]
+
+    scored = []
+    for question in candidates:
+        similarity = keyword_similarity(keywords, question.keywords)
+        if similarity >= settings.QUESTION_BANK_MIN_SIMILARITY:
+            scored.append((similarity, question))
+    # Best match first; least served first among equals, random among the rest
+    random.shuffle(scored)
+    scored.sort(key=lambda item: (-item[0], item[1].times_served))
+    return scored
+
+
+def draw_questions(target_job: str, keywords: List[str]) -> Optional[Dict[str, List[str]]]:
+    """
+    Draw a full question set for a session from the bank.
+
+    Returns ``{"tech_questions": [...], "questions": [...]}`` or None when the
+    bank has no good match (or this session was picked to get fresh questions).
+    """
+    if not settings.QUESTION_BANK_ENABLED:
+        return None
+    if random.random() >= settings.QUESTION_BANK_REUSE_RATIO:
+        return None
+
+    job_title = canonical_job_title(target_job)
+    if not job_title:
+        return None
+
+    tech = _pick_diverse(
+        _matching_questions(BankedQuestion.Kind.TECH, job_title, keywords), TECH_QUESTION_COUNT
+    )
+    interview = _pick_diverse(
+        _matching_questions(BankedQuestion.Kind.INTERVIEW, job_title, keywords), INTERVIEW_QUESTION_COUNT
+    )
+    if len(tech) < TECH_QUESTION_COUNT or len(interview) < INTERVIEW_QUESTION_COUNT:
+        return None
+
+    # Keep the easier-first ordering used by multi-agent generation
+    interview.sort(key=lambda q: q.difficulty)
+    BankedQuestion.objects.filter(id__in=[q.id for q in tech + interview]).update(
+        times_served=F("times_served") + 1, last_served_at=timezone.now()
+    )
+    logger.info(f"Drew {len(tech)} tech and {len(interview)} interview questions from bank for '{job_title}'")
+    return {
+        "tech_questions": [q.question for q in tech],
+        "questions": [q.question for q in interview],
+    }
+
+
+def _difficulty(value) -> int:
+    """Coerce an LLM-provided difficulty into the 1-5 scale."""
+    try:
+        return min(max(int(value), 1), 5)
+    except (TypeError, ValueError):
+        return 3
+
+
+def deposit_questions(target_job: str, keywords: List[str], kind: str, questions: List[Any]):
+    """
+    Add generated questions to the bank.
+
+    ``questions`` may be plain strings or the agents' question dicts
+    (``question``, ``interviewer_role``, ``focus_area``, ``difficulty``).
+    """
+    if not settings.QUESTION_BANK_ENABLED:
+        return
+
+    job_title = canonical_job_title(target_job)
+    if not job_title:
+        return
+    normalized = normalize_keywords(keywords)
+    signature = keyword_signature(normalized)
+
+    existing = set(
+        BankedQuestion.objects.filter(kind=kind, job_title=job_title).values_list("question", flat=True)
+    )
+    entries = []
+    for item in questions:
+        data = item if isinstance(item, dict) else {"question": item}
+        text = (data.get("question") or "").strip()
+        if not text or text in existing or data.get("fallback"):
+            continue
+        existing.add(text)
+        entries.append(
+            BankedQuestion(
+                kind=kind,
+                question=text,
+                job_title=job_title,
+                keywords=normalized,
+                keyword_signature=signature,
+                interviewer_role=data.get("interviewer_role", ""),
+                focus_area=data.get("focus_area", ""),
+                difficulty=_difficulty(data.get("difficulty")),
+            )
+        )
+    if entries:
+        BankedQuestion.objects.bulk_create(entries)
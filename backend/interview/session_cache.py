@@ -0,0 +1,125 @@
+"""
+Read-through cache for the status columns of interview sessions.
+
+Polling endpoints only need ``InterviewSession.STATUS_FIELDS`` (plus the
+feedback timestamps) until a stage finishes, so that projection is cached per
+session in the ``"sessions"`` Django cache. ``get_session_by_id(id, only=...)``
+serves it from the cache when ``only`` is covered, and builds an instance whose
+other columns are deferred, so a "finished" branch still loads its results
+from the database.
+
+Each session has a generation token in the cache, and an entry is stored
+with the token that was current *before* its row was read. Writers replace the
+token (``post_save``/``post_delete``, and ``invalidate_session``, which writers
+call after ``QuerySet.update()``), again when their transaction commits. A
+poller that read the row before a write can still store its snapshot, but
+under the old token, so it is never served. ``SESSION_CACHE_TTL`` bounds
+staleness if an invalidation is ever missed.
+
+The default file-based backend is shared by every process on a node; with
+workers on several nodes, point ``SESSION_CACHE_BACKEND`` at Redis.
+"""
+
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from jobify_backend.logger import logger
+
+from .models.interview_session import InterviewSession
+
+CACHED_FIELDS = (*InterviewSession.STATUS_FIELDS, "feedback_started", "feedback_completed")
+
+
+def _key(session_id) -> str:
+    return f"session-status:{session_id}"
+
+
+def _generation_key(session_id) -> str:
+    return f"session-status-generation:{session_id}"
+
+
+def _current_generation(cache, session_id, cached: dict):
+    """The session's generation token (started if missing), or None if the cache can't hold one."""
+    generation = cached.get(_generation_key(session_id))
+    if generation is None:
+        # A fresh token never matches an entry stored under an evicted one
+        cache.add(_generation_key(session_id), uuid.uuid4().hex, timeout=settings.SESSION_CACHE_TTL)
+        generation = cache.get(_generation_key(session_id))
+    return generation
+
+
+def _load_statuses(session_id) -> dict:
+    values = InterviewSession.objects.filter(id=session_id).values(*CACHED_FIELDS).first()
+    if values is None:
+        raise InterviewSession.DoesNotExist(f"InterviewSession {session_id} does not exist")
+    return values
+
+
+def cached_session(session_id, fields) -> InterviewSession:
+    """
+    Return the session with only ``fields`` loaded, served from the cache when
+    possible. Raises ``InterviewSession.DoesNotExist`` like ``objects.get``.
+    """
+    if settings.SESSION_CACHE_TTL <= 0 or not set(fields) <= set(CACHED_FIELDS):
+        return InterviewSession.objects.only(*fields).get(id=session_id)
+
+    cache = caches["sessions"]
+    try:
+        cached = cache.get_many([_key(session_id), _generation_key(session_id)])
+        generation = _current_generation(cache, session_id, cached)
+    except Exception as e:
+        logger.error(f"Session cache read failed for {session_id}: {e}")
+        cached, generation = {}, None
+    entry = cached.get(_key(session_id))
+    if generation is not None and entry is not None and entry["generation"] == generation:
+        values = entry["values"]
+    else:
+        # The token was read first: a write landing after this read replaces it
+        values = _load_statuses(session_id)
+        if generation is not None:
+            try:
+                cache.set(
+                    _key(session_id),
+                    {"generation": generation, "values": values},
+                    timeout=settings.SESSION_CACHE_TTL,
+                )
+            except Exception as e:
+                logger.error(f"Session cache write failed for {session_id}: {e}")
+
+    return InterviewSession.from_db("default", ["id", *CACHED_FIELDS], [session_id, *(values[f] for f in CACHED_FIELDS)])
+
+
+def invalidate_session(session_id):
+    """
+    Start a new generation of a session's cached statuses, now and again once
+    the current transaction commits (a reader inside the transaction window
+    still sees the old row).
+    """
+
+    def bump():
+        try:
+            caches["sessions"].set(
+                _generation_key(session_id), uuid.uuid4().hex, timeout=settings.SESSION_CACHE_TTL
+            )
+        except Exception as e:
+            logger.error(f"Session cache invalidation failed for {session_id}: {e}")
+
+    bump()
+    transaction.on_commit(bump)
+
+
+@receiver(post_save, sender=InterviewSession)
+def _invalidate_on_save(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not set(update_fields) & set(CACHED_FIELDS):
+        return
+    invalidate_session(instance.id)
+
+
+@receiver(post_delete, sender=InterviewSession)
+def _invalidate_on_delete(sender, instance, **kwargs):
+    invalidate_session(instance.id)
@@ -0,0 +1,297 @@
+"""
+Push notifications for interview session state.
+
+Clients used to poll ``get-keywords``, ``get-grammar-results``,
+``get-all-questions`` and ``feedback`` in tight loops, each poll loading the
+whole session row. ``GET /api/v1/sessions/<id>/events`` instead streams
+Server-Sent Events: the current state of every stage on connect, then one
+event whenever a stage changes.
+
+The view and its stream are async, so an open stream waits on the event loop
+instead of holding a worker thread. Serve the project through ASGI
+(``gunicorn.conf.py`` runs uvicorn workers); under WSGI every stream would
+hold a whole sync worker for up to ``SESSION_EVENTS_MAX_SECONDS``.
+
+Writers call ``notify_session(session_id)`` after changing a session (saves do
+it automatically through ``post_save``). Streams sleep until notified:
+
+    - on PostgreSQL, ``notify_session`` runs ``pg_notify`` when the transaction
+      commits, and one listener thread per process (``LISTEN``) wakes the
+      streams it serves, so a change made by a worker on any node reaches every
+      web process
+    - on other databases the notification is delivered in-process
+
+A stream also re-reads the session every ``SESSION_EVENTS_POLL_SECONDS``, which
+covers writers that cannot notify it (e.g. ``run_workers`` in another process
+on SQLite). Streams close after ``SESSION_EVENTS_MAX_SECONDS``; ``EventSource``
+reconnects on its own and receives the current state again.
+
+Events (``data`` is JSON):
+
+    resume     {"status"}
+    keywords   {"status", "keywords"}
+    grammar    {"status", "grammar_check"}  first page only, like get-grammar-results
+    questions  {"status", "tech_questions", "interview_questions"}
+    feedback   {"status", "feedbacks"}
+    done       {}  sent once feedback is complete, then the stream closes
+"""
+
+import asyncio
+import json
+import os
+import select
+import threading
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from jobify_backend.db_connections import managed_connection
+from jobify_backend.logger import logger
+
+from resume.grammar import page_grammar_results
+
+from .models.interview_session import InterviewSession
+
+CHANNEL = "jobify_session_events"
+
+# Columns a stream reads; saves that touch none of them do not notify
+STREAMED_FIELDS = (
+    "resume_status",
+    "keywords_status",
+    "keywords",
+    "grammar_status",
+    "grammar_results",
+    "question_status",
+    "tech_questions",
+    "questions",
+    "feedback_status",
+    "feedback",
+)
+
+
+class SessionEventHub:
+    """
+    Singleton that wakes the streams of this process.
+
+    Only sessions with an open stream are tracked, so notifications for
+    everyone else are dropped without growing any state.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = super(SessionEventHub, cls).__new__(cls)
+                    cls._instance._lock = threading.Lock()
+                    cls._instance._versions = {}
+                    cls._instance._subscribers = {}
+                    cls._instance._waiters = {}
+                    cls._instance._listener_pid = None
+        return cls._instance
+
+    def subscribe(self, session_id) -> int:
+        """Start tracking a session for a new stream; return its current version."""
+        key = str(session_id)
+        with self._lock:
+            self._subscribers[key] = self._subscribers.get(key, 0) + 1
+            self._versions.setdefault(key, 0)
+            return self._versions[key]
+
+    def unsubscribe(self, session_id):
+        key = str(session_id)
+        with self._lock:
+            remaining = self._subscribers.get(key, 0) - 1
+            if remaining > 0:
+                self._subscribers[key] = remaining
+            else:
+                self._subscribers.pop(key, None)
+                self._versions.pop(key, None)
+
+    def signal(self, session_id):
+        """Wake every stream of ``session_id`` in this process."""
+        key = str(session_id)
+        with self._lock:
+            if key not in self._subscribers:
+                return
+            self._versions[key] += 1
+            for loop, event in self._waiters.get(key, ()):
+                loop.call_soon_threadsafe(event.set)
+
+    async def wait_async(self, session_id, version: int, timeout: float) -> int:
+        """
+        Wait on the running event loop until the session moves past ``version``
+        or ``timeout`` passes; return the version.
+        """
+        key = str(session_id)
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._lock:
+            if self._versions.get(key, 0) != version:
+                return self._versions.get(key, 0)
+            self._waiters.setdefault(key, set()).add(waiter)
+        try:
+            await asyncio.wait_for(waiter[1].wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            with self._lock:
+                waiters = self._waiters.get(key, set())
+                waiters.discard(waiter)
+                if not waiters:
+                    self._waiters.pop(key, None)
+        with self._lock:
+            return self._versions.get(key, 0)
+
+    def ensure_listener(self):
+        """On PostgreSQL, start this process's LISTEN thread (once per process, also after a fork)."""
+        if connection.vendor != "postgresql" or self._listener_pid == os.getpid():
+            return
+        with self._instance_lock:
+            if self._listener_pid == os.getpid():
+                return
+            self._listener_pid = os.getpid()
+            threading.Thread(target=self._listen, name="session-events-listener", daemon=True).start()
+
+    def _listen(self):
+        """Forward ``pg_notify`` payloads (session ids) to ``signal``, reconnecting on errors."""
+        delay = 1
+        while True:
+            listener = None
+            try:
+                listener = connection.Database.connect(**connection.get_connection_params())
+                listener.autocommit = True
+                with listener.cursor() as cursor:
+                    cursor.execute(f"LISTEN {CHANNEL}")
+                delay = 1
+                if not hasattr(listener, "poll"):
+                    # psycopg 3
+                    while True:
+                        for notify in listener.notifies(timeout=30):
+                            self.signal(notify.payload)
+                while True:
+                    if select.select([listener], [], [], 30) == ([], [], []):
+                        continue
+                    listener.poll()
+                    while listener.notifies:
+                        self.signal(listener.notifies.pop(0).payload)
+            except Exception as e:
+                logger.error(f"Session event listener failed, reconnecting in {delay}s: {e}")
+                time.sleep(delay)
+                delay = min(delay * 2, 30)
+            finally:
+                if listener is not None:
+                    listener.close()
+
+
+# Create a singleton instance and expose the hub
+session_event_hub = SessionEventHub()
+
+
+def notify_session(session_id):
+    """Tell open streams that ``session_id`` changed, once the current transaction commits."""
+
+    def send():
+        try:
+            if connection.vendor == "postgresql":
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT pg_notify(%s, %s)", [CHANNEL, str(session_id)])
+            else:
+                session_event_hub.signal(session_id)
+        except Exception as e:
+            # A lost notification only delays streams until their next re-read
+            logger.error(f"Failed to notify session {session_id}: {e}")
+
+    transaction.on_commit(send)
+
+
+@receiver(post_save, sender=InterviewSession)
+def _notify_on_save(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not set(update_fields) & set(STREAMED_FIELDS):
+        return
+    notify_session(instance.id)
+
+
+def session_snapshot(session_id):
+    """The streamed columns of a session, or None if it does not exist."""
+    return InterviewSession.objects.filter(id=session_id).values(*STREAMED_FIELDS).first()
+
+
+@sync_to_async
+def _read_snapshot(session_id):
+    # Streams stay open for minutes: hold a DB connection only while reading
+    with managed_connection("session_events"):
+        return session_snapshot(session_id)
+
+
+def snapshot_events(row: dict) -> dict:
+    """Event payloads for a snapshot, keyed by event name."""
+    complete = InterviewSession.Status.COMPLETE
+    questions_ready = row["question_status"] == complete
+    return {
+        "resume": {"status": row["resume_status"]},
+        "keywords": {
+            "status": row["keywords_status"],
+            "keywords": (row["keywords"] or []) if row["keywords_status"] == complete else [],
+        },
+        "grammar": {
+            "status": row["grammar_status"],
+            "grammar_check": (
+                page_grammar_results(row["grammar_results"]) if row["grammar_status"] == complete else None
+            ),
+        },
+        "questions": {
+            "status": row["question_status"],
+            "tech_questions": (row["tech_questions"] or []) if questions_ready else [],
+            "interview_questions": (row["questions"] or []) if questions_ready else [],
+        },
+        "feedback": {
+            "status": row["feedback_status"],
+            "feedbacks": row["feedback"] if row["feedback_status"] == complete else None,
+        },
+    }
+
+
+def format_event(name: str, data: dict) -> str:
+    return f"event: {name}\ndata: {json.dumps(data)}\n\n"
+
+
+async def stream_session_events(session_id):
+    """
+    Generate the SSE stream for a session: changed stage events, keep-alive
+    comments while idle, and ``done`` once feedback is complete.
+    """
+    version = session_event_hub.subscribe(session_id)
+    session_event_hub.ensure_listener()
+    deadline = time.monotonic() + settings.SESSION_EVENTS_MAX_SECONDS
+    sent = {}
+    try:
+        yield f"retry: {settings.SESSION_EVENTS_RETRY_MS}\n\n"
+        while True:
+            row = await _read_snapshot(session_id)
+            if row is None:
+                yield format_event("error", {"error": "Resume not found"})
+                return
+            for name, data in snapshot_events(row).items():
+                if sent.get(name) != data:
+                    sent[name] = data
+                    yield format_event(name, data)
+            if row["feedback_status"] == InterviewSession.Status.COMPLETE:
+                yield format_event("done", {})
+                return
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            timeout = min(settings.SESSION_EVENTS_POLL_SECONDS, remaining)
+            new_version = await session_event_hub.wait_async(session_id, version, timeout)
+            if new_version == version:
+                yield ": keep-alive\n\n"
+            version = new_version
+    finally:
+        session_event_hub.unsubscribe(session_id)
@@ -0,0 +1,54 @@
+"""Queue tasks for the interview app (see interview/job_queue.py)."""
+
+from .job_queue import task
+from .models.interview_session import InterviewSession
+from .session_cache import invalidate_session
+from .session_events import notify_session
+from .utils import evaluate_answer_background, get_questions_using_openai, pregenerate_questions
+from .views import generate_feedback_background
+
+
+def _mark_failed(session_id, status_field: str):
+    InterviewSession.objects.filter(id=session_id).update(**{status_field: InterviewSession.Status.FAILED})
+    invalidate_session(session_id)
+    notify_session(session_id)
+
+
+def mark_questions_failed(session_id):
+    _mark_failed(session_id, "question_status")
+
+
+def mark_feedback_failed(session_id):
+    _mark_failed(session_id, "feedback_status")
+
+
+@task("generate_questions", on_failure=mark_questions_failed)
+def generate_questions_task(session_id):
+    interview_session = InterviewSession.objects.get(id=session_id)
+    if interview_session.question_status == InterviewSession.Status.COMPLETE:
+        # Pre-generated questions were promoted while this job was queued
+        return
+    title = interview_session.target_job
+    get_questions_using_openai(interview_session)
+    interview_session.refresh_from_db(fields=["question_status", "target_job"])
+    if interview_session.target_job != title:
+        # Superseded by a new title; target_job asked for this job to run again
+        return
+    if interview_session.question_status != InterviewSession.Status.COMPLETE:
+        # The LLM returned something unusable; let the queue retry
+        raise RuntimeError(f"Questions not generated for session {session_id}")
+
+
+@task("pregenerate_questions", max_attempts=1)
+def pregenerate_questions_task(session_id):
+    pregenerate_questions(session_id)
+
+
+@task("evaluate_answer", max_attempts=1)
+def evaluate_answer_task(session_id, kind, index):
+    evaluate_answer_background(session_id, kind, index)
+
+
+@task("generate_feedback", on_failure=mark_feedback_failed)
+def generate_feedback_task(session_id):
+    generate_feedback_background(InterviewSession.objects.get(id=session_id))
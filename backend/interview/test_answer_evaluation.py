@@ -0,0 +1,115 @@
+import json
+from unittest.mock import AsyncMock, patch
+
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from jobify_backend.llm_engine import llm_engine
+
+from .models.interview_session import InterviewSession
+from .models.question_answer import QuestionAnswer
+from .utils import (
+    answer_hash,
+    evaluate_answer_background,
+    get_feedback_using_openai_multi_agent,
+    store_answer,
+)
+
+EVALUATION = json.dumps({"score": 8, "strengths": ["s"], "weaknesses": ["w"], "improvement_tips": ["t"]})
+SYNTHESIS = json.dumps({"question_feedback": ["f0", "f1", "f2", "f3"], "summary": "done"})
+
+
+def _create_answered_session(**fields):
+    """A session with stored questions and every answer submitted."""
+    session = InterviewSession.objects.create(**fields)
+    session.set_questions(["TQ?"], ["Q1?", "Q2?", "Q3?"])
+    store_answer(session.id, "tech", 0, "TQ?", "TA")
+    for index, answer in enumerate(["A1", "A2", "A3"]):
+        store_answer(session.id, "interview", index, f"Q{index + 1}?", answer)
+    return session
+
+
+class AnswerEvaluationTest(TestCase):
+    """Tests for evaluating answers as they are submitted"""
+
+    def setUp(self):
+        self.session = _create_answered_session(
+            keywords=["python", "django"],
+            target_job="Software Engineer",
+        )
+
+    @patch.object(llm_engine, "chat_completion", new_callable=AsyncMock, return_value=EVALUATION)
+    def test_evaluation_stored_per_answer(self, chat_completion):
+        """Test that one answer's reviewer evaluations are stored with its hash"""
+        evaluate_answer_background(self.session.id, "interview", 0)
+
+        entry = QuestionAnswer.objects.get(session=self.session, kind="interview", index=0).evaluation
+        self.assertEqual(entry["answer_hash"], answer_hash("Q1?", "A1"))
+        # Interview question 0 sits at position 1 behind the tech question
+        self.assertEqual(len(entry["evaluations"]), 2)
+        self.assertEqual(chat_completion.await_count, 2)
+
+    @patch("interview.utils.llm_client.chat_completion", return_value=SYNTHESIS)
+    @patch.object(llm_engine, "chat_completion", new_callable=AsyncMock, return_value=EVALUATION)
+    def test_feedback_reuses_stored_evaluations(self, chat_completion, synthesize):
+        """Test that feedback only evaluates answers without a current evaluation"""
+        evaluate_answer_background(self.session.id, "tech", 0)
+        evaluate_answer_background(self.session.id, "interview", 0)
+        chat_completion.reset_mock()
+
+        feedback = get_feedback_using_openai_multi_agent(self.session)
+
+        # Only interview questions 1 and 2 (3 reviewers each) are evaluated now
+        self.assertEqual(chat_completion.await_count, 6)
+        self.assertEqual(feedback["summary"], "done")
+
+    @patch("interview.utils.llm_client.chat_completion", return_value=SYNTHESIS)
+    @patch.object(llm_engine, "chat_completion", new_callable=AsyncMock, return_value=EVALUATION)
+    def test_changed_answer_is_reevaluated(self, chat_completion, synthesize):
+        """Test that a stale evaluation is ignored after the answer changes"""
+        evaluate_answer_background(self.session.id, "interview", 0)
+        store_answer(self.session.id, "interview", 0, "Q1?", "A1 revised")
+        chat_completion.reset_mock()
+
+        get_feedback_using_openai_multi_agent(self.session)
+
+        self.assertEqual(chat_completion.await_count, 11)
+
+    @patch("interview.utils.llm_client.chat_completion", return_value=SYNTHESIS)
+    @patch.object(llm_engine, "chat_completion", new_callable=AsyncMock, return_value=EVALUATION)
+    def test_evaluation_for_other_reviewers_is_reevaluated(self, chat_completion, synthesize):
+        """Test that an evaluation made for a different position's reviewers is ignored"""
+        evaluate_answer_background(self.session.id, "interview", 0)
+        # Without a tech answer, interview question 0 moves to the head position
+        store_answer(self.session.id, "tech", 0, "TQ?", "")
+        chat_completion.reset_mock()
+
+        get_feedback_using_openai_multi_agent(self.session)
+
+        # Positions 0 and 1 get 2 reviewers, position 2 gets 3
+        self.assertEqual(chat_completion.await_count, 7)
+
+
+class SubmitAnswerEvaluationTest(APITestCase):
+    """Tests for queueing evaluations from the answer endpoints"""
+
+    @patch("interview.utils.enqueue")
+    def test_submit_answer_queues_evaluation(self, enqueue):
+        """Test that a submitted text answer is evaluated in the background"""
+        session = InterviewSession.objects.create(
+            keywords=["python"],
+            target_job="Software Engineer",
+            answer_type="text",
+        )
+        session.set_questions([], ["Q1?", "Q2?", "Q3?"])
+
+        response = self.client.post(
+            reverse("submit-interview-answer"),
+            {"id": str(session.id), "index": 0, "question": "Q1?", "answer_type": "text", "answer": "A1"},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        enqueue.assert_called_once()
+        self.assertEqual(enqueue.call_args.args, ("evaluate_answer", session.id, "interview", 0))
@@ -0,0 +1,105 @@
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from .models.interview_session import InterviewSession
+from .models.question_answer import QuestionAnswer
+from .utils import store_answer
+
+
+class SubmitAnswerTestCase(APITestCase):
+    """Base for tests posting text answers to ``self.session``, without queueing their evaluations"""
+
+    def setUp(self):
+        patcher = patch("interview.views.enqueue_answer_evaluation")
+        self.enqueue_evaluation = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _submit(self, index, answer):
+        return self.client.post(
+            reverse("submit-interview-answer"),
+            {"id": str(self.session.id), "index": index, "question": f"Q{index + 1}?", "answer_type": "text", "answer": answer},
+            format="json",
+        )
+
+
+class AnswerSubmissionTest(SubmitAnswerTestCase):
+    """Tests for storing answers without rewriting the rest of the session"""
+
+    def setUp(self):
+        super().setUp()
+        self.session = InterviewSession.objects.create(answer_type="text", feedback={"summary": "keep me"})
+        self.session.set_questions(["TQ?"], ["Q1?", "Q2?", "Q3?"])
+
+    def test_submission_updates_one_row(self):
+        """Test that submitting an answer updates its own row and leaves the session's columns alone"""
+        with CaptureQueriesContext(connection) as queries:
+            response = self._submit(1, "A2")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["progress"], 33.33)
+        updates = [query["sql"] for query in queries if query["sql"].startswith("UPDATE")]
+        answer_updates = [sql for sql in updates if "interview_questionanswer" in sql]
+        self.assertEqual(len(answer_updates), 1)
+        for sql in updates:
+            for column in ('"feedback"', '"grammar_results"', '"questions"'):
+                self.assertNotIn(column, sql)
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.answers, ["", "A2", ""])
+        self.assertEqual(self.session.feedback, {"summary": "keep me"})
+
+    def test_tech_submission(self):
+        """Test that a tech answer is stored at its index"""
+        response = self.client.post(
+            reverse("submit-tech-answer"),
+            {"id": str(self.session.id), "index": 0, "question": "TQ?", "answer": "TA"},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.session.tech_answers, ["TA"])
+        self.enqueue_evaluation.assert_called_once_with(self.session.id, "tech", 0)
+
+
+class StoreAnswerTest(TestCase):
+    """Tests for per-question answer rows"""
+
+    def setUp(self):
+        self.session = InterviewSession.objects.create()
+        self.session.set_questions(["TQ?"], ["Q1?", "Q2?"])
+
+    def test_set_questions_creates_rows(self):
+        """Test that storing questions creates one unanswered row per question, replacing old ones"""
+        store_answer(self.session.id, "interview", 0, "Q1?", "A1")
+        self.session.set_questions(["New TQ?"], ["New Q1?", "New Q2?", "New Q3?"])
+
+        rows = QuestionAnswer.objects.filter(session=self.session).values_list("kind", "index", "question", "answer")
+        self.assertEqual(
+            sorted(rows),
+            [
+                ("interview", 0, "New Q1?", ""),
+                ("interview", 1, "New Q2?", ""),
+                ("interview", 2, "New Q3?", ""),
+                ("tech", 0, "New TQ?", ""),
+            ],
+        )
+        self.assertEqual(self.session.question_status, InterviewSession.Status.COMPLETE)
+
+    def test_answers_from_stale_snapshots_survive(self):
+        """Test that answers submitted through different snapshots are all kept"""
+        stale = InterviewSession.objects.get(id=self.session.id)
+        self.assertTrue(store_answer(self.session.id, "interview", 1, "Q2?", "A2"))
+        self.assertTrue(store_answer(stale.id, "interview", 0, "Q1?", "A1"))
+
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.answers, ["A1", "A2"])
+        self.assertEqual(self.session.progress, "2/2")
+
+    def test_mismatched_question_rejected(self):
+        """Test that an answer for a question not at the index is not stored"""
+        self.assertFalse(store_answer(self.session.id, "interview", 1, "Q1?", "A"))
+        self.assertFalse(store_answer(self.session.id, "interview", 5, "Q6?", "A"))
@@ -0,0 +1,102 @@
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from .completion import VIDEO_ANSWERS_REQUIRED, claim_completion
+from .models.interview_session import InterviewSession
+from .models.video import Video
+from .test_answer_submission import SubmitAnswerTestCase
+from .utils import store_answer
+
+
+class CompletionCounterTest(TestCase):
+    """Tests for the denormalized answer counters"""
+
+    def setUp(self):
+        self.session = InterviewSession.objects.create()
+        self.session.set_questions(["TQ?"], ["Q1?", "Q2?"])
+
+    def _counters(self):
+        self.session.refresh_from_db()
+        return self.session.tech_answered, self.session.interview_answered, self.session.video_answered
+
+    def test_counters_follow_answer_transitions(self):
+        """Test that only blank/answered transitions move the counters"""
+        store_answer(self.session.id, "interview", 0, "Q1?", "A1")
+        store_answer(self.session.id, "interview", 0, "Q1?", "A1 revised")
+        store_answer(self.session.id, "interview", 1, "Q2?", "   ")
+        store_answer(self.session.id, "tech", 0, "TQ?", "TA")
+        self.assertEqual(self._counters(), (1, 1, 0))
+
+        store_answer(self.session.id, "interview", 0, "Q1?", "")
+        self.assertEqual(self._counters(), (1, 0, 0))
+
+    def test_totals_reset_with_new_questions(self):
+        """Test that new questions reset the answered counters and completion"""
+        store_answer(self.session.id, "interview", 0, "Q1?", "A1")
+        self.session.set_questions([], ["Q1?", "Q2?", "Q3?"])
+
+        self.session.refresh_from_db()
+        self.assertEqual((self.session.tech_total, self.session.interview_total), (0, 3))
+        self.assertEqual(self.session.progress, "0/3")
+
+    def test_videos_counted(self):
+        """Test that creating and deleting videos moves the video counter"""
+        videos = [
+            Video.objects.create(interview_session=self.session, original_filename=f"{i}.mp4", file_path=f"{i}.mp4", file_size=1)
+            for i in range(VIDEO_ANSWERS_REQUIRED)
+        ]
+        self.assertEqual(self._counters(), (0, 0, VIDEO_ANSWERS_REQUIRED))
+
+        videos[0].delete()
+        self.assertEqual(self._counters(), (0, 0, VIDEO_ANSWERS_REQUIRED - 1))
+
+    def test_completion_claimed_once(self):
+        """Test that completion is detected from counters and claimed by one caller only"""
+        store_answer(self.session.id, "tech", 0, "TQ?", "TA")
+        store_answer(self.session.id, "interview", 0, "Q1?", "A1")
+        self.assertFalse(claim_completion(self.session.id))
+
+        store_answer(self.session.id, "interview", 1, "Q2?", "A2")
+        with CaptureQueriesContext(connection) as queries:
+            self.assertTrue(claim_completion(self.session.id))
+        self.assertEqual(len(queries), 2)
+        self.assertFalse(claim_completion(self.session.id))
+
+
+class FeedbackTriggerTest(SubmitAnswerTestCase):
+    """Tests for queueing feedback when the last answer arrives"""
+
+    def setUp(self):
+        super().setUp()
+        self.session = InterviewSession.objects.create(answer_type="text")
+        self.session.set_questions([], ["Q1?", "Q2?"])
+
+    @patch("interview.views.enqueue")
+    def test_feedback_queued_exactly_once(self, enqueue):
+        """Test that feedback is queued by the completing submission only, not by later edits"""
+        self._submit(0, "A1")
+        enqueue.assert_not_called()
+
+        response = self._submit(1, "A2")
+        self.assertEqual(response.data["progress"], 100.0)
+        self.assertEqual(enqueue.call_count, 1)
+        self.assertEqual(enqueue.call_args.args, ("generate_feedback", self.session.id))
+
+        self._submit(1, "A2 revised")
+        self.assertEqual(enqueue.call_count, 1)
+
+    def test_failed_enqueue_releases_completion(self):
+        """Test that the session is not left completed without feedback when queueing fails"""
+        self._submit(0, "A1")
+        with patch("interview.views.enqueue", side_effect=RuntimeError("queue unavailable")):
+            with self.assertRaises(RuntimeError):
+                self._submit(1, "A2")
+        self.session.refresh_from_db()
+        self.assertFalse(self.session.is_completed)
+
+        with patch("interview.views.enqueue") as enqueue:
+            self._submit(1, "A2")
+        enqueue.assert_called_once()
@@ -0,0 +1,52 @@
+from unittest.mock import patch
+
+from django.db import connections
+from django.test import TestCase, TransactionTestCase
+from django.urls import reverse
+
+from jobify_backend.db_connections import managed, managed_connection
+
+from .models.interview_session import InterviewSession
+
+
+class ManagedConnectionTest(TransactionTestCase):
+    """Tests for releasing DB connections after background work"""
+
+    def test_connection_released_after_work(self):
+        """Test that the thread's connection is closed when the block ends, even on errors"""
+        with patch.object(connections["default"], "close") as close:
+            with self.assertRaises(ValueError), managed_connection("job"):
+                InterviewSession.objects.count()
+                close.reset_mock()  # stale connections are dropped on entry too
+                raise ValueError("boom")
+
+        close.assert_called_once()
+
+    def test_decorator_returns_result(self):
+        """Test that a managed stage returns its result and releases its connection"""
+        with patch.object(connections["default"], "close") as close:
+            stage = managed(lambda: close.reset_mock() or InterviewSession.objects.count())
+            self.assertEqual(stage(), 0)
+
+        close.assert_called_once()
+
+    def test_metrics_report_usage(self):
+        """Test that /metrics reports blocks holding a connection"""
+        with managed_connection("metrics-test"):
+            body = self.client.get(reverse("metrics")).content.decode()
+        self.assertIn("# TYPE jobify_db_managed_connections gauge", body)
+        self.assertRegex(body, r'jobify_db_managed_connections\{label="metrics-test",pid="\d+"\} 1')
+
+        body = self.client.get(reverse("metrics")).content.decode()
+        self.assertRegex(body, r'jobify_db_managed_connections\{label="metrics-test",pid="\d+"\} 0')
+
+
+class ManagedConnectionInTransactionTest(TestCase):
+    """Tests for managed blocks inside an enclosing transaction"""
+
+    def test_transaction_connection_kept(self):
+        """Test that work inside a transaction does not close its connection"""
+        with patch.object(connections["default"], "close") as close, managed_connection("job"):
+            InterviewSession.objects.count()
+
+        close.assert_not_called()
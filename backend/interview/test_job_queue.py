@@ -0,0 +1,192 @@
+import threading
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from .job_queue import claim_job, enqueue, run_job, task, work
+from .models import InterviewSession, Job
+
+calls = []
+
+
+def _record_failure(*args):
+    calls.append(("failed", *args))
+
+
+@task("test_record")
+def _record(*args):
+    calls.append(args)
+
+
+@task("test_flaky", on_failure=_record_failure)
+def _flaky(value):
+    raise RuntimeError("provider unavailable")
+
+
+@override_settings(JOB_QUEUE_EMBEDDED_WORKERS=0, JOB_RETRY_BASE_SECONDS=0)
+class JobQueueTest(TestCase):
+    """Tests for the database-backed job queue"""
+
+    def setUp(self):
+        calls.clear()
+
+    def test_enqueue_and_run(self):
+        """Test that a queued job is claimed, run and marked succeeded"""
+        job = enqueue("test_record", "a", 1)
+
+        work("test-worker", threading.Event(), burst=True)
+
+        job.refresh_from_db()
+        self.assertEqual(calls, [("a", 1)])
+        self.assertEqual(job.status, Job.Status.SUCCEEDED)
+        self.assertEqual(job.attempts, 1)
+
+    def test_unknown_task_rejected(self):
+        """Test that enqueueing an unregistered task fails fast"""
+        with self.assertRaises(ValueError):
+            enqueue("no_such_task")
+
+    def test_priority_order(self):
+        """Test that higher priority jobs are claimed first"""
+        enqueue("test_record", "low")
+        enqueue("test_record", "high", priority=5)
+
+        self.assertEqual(claim_job("test-worker").args, ["high"])
+
+    def test_claimed_job_not_claimed_twice(self):
+        """Test that a running job with a live lease is invisible to other workers"""
+        enqueue("test_record", "once")
+        self.assertIsNotNone(claim_job("worker-1"))
+        self.assertIsNone(claim_job("worker-2"))
+
+    def test_retry_then_fail(self):
+        """Test retries with backoff and the on_failure hook after the last attempt"""
+        job = enqueue("test_flaky", "x", max_attempts=2)
+
+        work("test-worker", threading.Event(), burst=True)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.Status.FAILED)
+        self.assertEqual(job.attempts, 2)
+        self.assertIn("provider unavailable", job.last_error)
+        self.assertEqual(calls, [("failed", "x")])
+
+    def test_expired_lease_is_reclaimed(self):
+        """Test that a job whose worker died is picked up again"""
+        job = enqueue("test_record", "again")
+        claim_job("dead-worker")
+        Job.objects.filter(id=job.id).update(lease_expires_at=timezone.now() - timezone.timedelta(seconds=1))
+
+        reclaimed = claim_job("live-worker")
+
+        self.assertEqual(reclaimed.id, job.id)
+        self.assertEqual(reclaimed.attempts, 2)
+        run_job(reclaimed, "live-worker")
+        self.assertEqual(calls, [("again",)])
+
+    @patch("resume.tasks.parse_resume")
+    def test_run_workers_command(self, parse_resume):
+        """Test that the management command drains the queue in burst mode"""
+        session = InterviewSession.objects.create()
+        enqueue("parse_resume", session.id, session_id=session.id)
+
+        with patch("interview.management.commands.run_workers.worker_thread", side_effect=_inline):
+            call_command("run_workers", "--concurrency", "1", "--burst", stdout=StringIO())
+
+        parse_resume.assert_called_once_with(str(session.id))
+        self.assertEqual(Job.objects.get().status, Job.Status.SUCCEEDED)
+
+    @patch("interview.job_queue._embedded_pid", None)
+    @patch("interview.job_queue.worker_thread")
+    @patch("resume.tasks.parse_resume")
+    def test_run_workers_starts_no_embedded_workers(self, parse_resume, embedded_thread):
+        """Test that jobs enqueued from a run_workers process do not start embedded workers"""
+        session = InterviewSession.objects.create()
+        parse_resume.side_effect = lambda session_id: enqueue("test_record", session_id)
+        enqueue("parse_resume", session.id, session_id=session.id)
+
+        with (
+            self.settings(JOB_QUEUE_EMBEDDED_WORKERS=2),
+            patch("interview.management.commands.run_workers.worker_thread", side_effect=_inline),
+        ):
+            call_command("run_workers", "--concurrency", "1", "--burst", stdout=StringIO())
+
+        self.assertEqual(calls, [(str(session.id),)])
+        embedded_thread.assert_not_called()
+
+
+def _inline(worker_id, stop, **kwargs):
+    """Run a worker loop in the calling thread (the test database is per-connection)."""
+    work(worker_id, stop, **kwargs)
+    thread = threading.Thread(target=lambda: None)
+    thread.start()
+    return thread
+
+
+@override_settings(JOB_QUEUE_EMBEDDED_WORKERS=0)
+class SingleFlightTest(TestCase):
+    """Tests for at-most-one in-flight job per dedupe key"""
+
+    def setUp(self):
+        calls.clear()
+
+    def test_duplicate_attaches_to_queued_job(self):
+        """Test that a second enqueue with the same key returns the first job"""
+        first = enqueue("test_record", "a", dedupe_key="record:1")
+        second = enqueue("test_record", "a", dedupe_key="record:1")
+
+        self.assertEqual(first.id, second.id)
+        self.assertEqual(Job.objects.count(), 1)
+
+    def test_duplicate_attaches_to_running_job(self):
+        """Test that a running job also blocks duplicates"""
+        first = enqueue("test_record", "a", dedupe_key="record:1")
+        claim_job("test-worker")
+
+        self.assertEqual(enqueue("test_record", "a", dedupe_key="record:1").id, first.id)
+
+    def test_running_job_runs_again_when_asked(self):
+        """Test that rerun=True queues a running job again when it finishes instead of attaching to a stale run"""
+        first = enqueue("test_record", "a", dedupe_key="record:1")
+        job = claim_job("test-worker")
+        self.assertEqual(enqueue("test_record", "a", dedupe_key="record:1", rerun=True).id, first.id)
+
+        run_job(job, "test-worker")
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts, job.rerun), (Job.Status.QUEUED, 0, False))
+
+        work("test-worker", threading.Event(), burst=True)
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.Status.SUCCEEDED)
+        self.assertEqual(calls, [("a",), ("a",)])
+
+    def test_rerun_of_queued_job_is_a_plain_attach(self):
+        """Test that rerun=True does not flag a job that has not started"""
+        first = enqueue("test_record", "a", dedupe_key="record:1")
+        enqueue("test_record", "a", dedupe_key="record:1", rerun=True)
+
+        first.refresh_from_db()
+        self.assertFalse(first.rerun)
+
+    def test_key_released_after_completion(self):
+        """Test that a finished job no longer blocks a new one"""
+        first = enqueue("test_record", "a", dedupe_key="record:1")
+        work("test-worker", threading.Event(), burst=True)
+
+        second = enqueue("test_record", "a", dedupe_key="record:1")
+
+        self.assertNotEqual(first.id, second.id)
+
+    def test_failed_resume_polling_starts_one_parse(self):
+        """Test that repeated polls of a FAILED resume queue a single parse"""
+        session = InterviewSession.objects.create(resume_status=InterviewSession.Status.FAILED)
+
+        for _ in range(3):
+            self.client.post(reverse("get-keywords"), {"id": str(session.id)})
+            InterviewSession.objects.filter(id=session.id).update(resume_status=InterviewSession.Status.FAILED)
+
+        self.assertEqual(Job.objects.filter(task="parse_resume", session_id=session.id).count(), 1)
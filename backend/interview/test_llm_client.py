@@ -0,0 +1,220 @@
+import os
+import tempfile
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import requests
+from django.core.cache import caches
+from django.test import SimpleTestCase, override_settings
+
+from jobify_backend.llm_cache import llm_cache
+from jobify_backend.llm_client import llm_client, parse_json_array
+from jobify_backend.llm_engine import llm_engine
+from jobify_backend.llm_guard import CircuitOpenError, TokenBucket, llm_guard, retry_after
+
+
+@override_settings(
+    OPEN_ROUTER_API_KEY="test-key", LLM_CONNECT_TIMEOUT=3, LLM_READ_TIMEOUT=30, LLM_RATE_LIMIT_PATH=""
+)
+class LLMClientTest(SimpleTestCase):
+    """Tests for the shared pooled OpenRouter client"""
+
+    def setUp(self):
+        llm_client._session = None
+        llm_guard.reset()
+
+    def _mock_response(self, content):
+        response = MagicMock()
+        response.json.return_value = {"choices": [{"message": {"content": content}}]}
+        return response
+
+    def test_session_is_reused_across_calls(self):
+        """Test that one pooled session serves every call in a worker"""
+        session = llm_client.session
+        with patch.object(session, "post", return_value=self._mock_response("hi")) as post:
+            self.assertEqual(llm_client.chat_completion("hello"), "hi")
+            self.assertEqual(llm_client.chat_completion("again"), "hi")
+
+        self.assertIs(llm_client.session, session)
+        self.assertEqual(post.call_count, 2)
+        self.assertEqual(post.call_args.kwargs["timeout"], (3, 30))
+        self.assertEqual(session.headers["Authorization"], "Bearer test-key")
+
+    def test_session_rebuilt_after_fork(self):
+        """Test that a forked worker does not reuse the parent's sockets"""
+        session = llm_client.session
+        llm_client._pid = -1
+        self.assertIsNot(llm_client.session, session)
+
+    def test_pool_stats(self):
+        """Test pool statistics reporting"""
+        llm_client.session
+        stats = llm_client.pool_stats()
+        self.assertIn("requests", stats)
+        self.assertIn("pools", stats)
+
+
+@override_settings(
+    CACHES={
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        "llm": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "llm-tests"},
+    },
+    LLM_CACHE_MAX_ENTRIES=2,
+    LLM_RATE_LIMIT_PATH="",
+)
+class LLMCacheTest(SimpleTestCase):
+    """Tests for the content-addressed LLM response cache"""
+
+    def setUp(self):
+        llm_cache.clear()
+        caches["llm"].clear()
+        llm_guard.reset()
+
+    def test_key_ignores_prompt_whitespace(self):
+        """Test that prompt indentation does not change the cache key"""
+        self.assertEqual(
+            llm_cache.make_key("m", "Generate  a\n    question"),
+            llm_cache.make_key("m", "Generate a question"),
+        )
+        self.assertNotEqual(
+            llm_cache.make_key("m", "prompt", {"temperature": 0}),
+            llm_cache.make_key("m", "prompt", {"temperature": 1}),
+        )
+
+    def test_identical_prompt_served_from_cache(self):
+        """Test that a repeated prompt skips the network call"""
+        response = MagicMock()
+        response.json.return_value = {"choices": [{"message": {"content": "[\"python\"]"}}]}
+        with patch.object(llm_client.session, "post", return_value=response) as post:
+            llm_client.chat_completion("resume text", call_type="keywords")
+            result = llm_client.chat_completion("resume text", call_type="keywords")
+
+        self.assertEqual(result, "[\"python\"]")
+        self.assertEqual(post.call_count, 1)
+        counters = llm_cache.stats()["call_types"]["keywords"]
+        self.assertEqual(counters["misses"], 1)
+        self.assertEqual(counters["memory_hits"], 1)
+
+    def test_unusable_response_not_cached(self):
+        """Test that a response rejected by the caller's parser is returned but not replayed"""
+        malformed, valid = MagicMock(), MagicMock()
+        malformed.json.return_value = {"choices": [{"message": {"content": "Sure! Here are keywords"}}]}
+        valid.json.return_value = {"choices": [{"message": {"content": "[\"python\"]"}}]}
+        with patch.object(llm_client.session, "post", side_effect=[malformed, valid]) as post:
+            first = llm_client.chat_completion("resume text", call_type="keywords", validate=parse_json_array)
+            second = llm_client.chat_completion("resume text", call_type="keywords", validate=parse_json_array)
+            third = llm_client.chat_completion("resume text", call_type="keywords", validate=parse_json_array)
+
+        self.assertEqual(first, "Sure! Here are keywords")
+        self.assertEqual(second, third)
+        self.assertEqual(post.call_count, 2)
+
+    def test_shared_tier_backfills_memory(self):
+        """Test that a shared tier hit is served and promoted to memory"""
+        key = llm_cache.make_key("m", "prompt")
+        llm_cache.set(key, "value", call_type="keywords")
+        llm_cache.clear()
+
+        self.assertEqual(llm_cache.get(key, call_type="keywords"), "value")
+        self.assertEqual(llm_cache.stats()["call_types"]["keywords"]["shared_hits"], 1)
+
+    def test_lru_eviction_and_disabled_call_types(self):
+        """Test LRU eviction and that TTL 0 disables caching"""
+        for name in ("a", "b", "c"):
+            llm_cache.set(name, name, call_type="keywords")
+        self.assertEqual(llm_cache.stats()["memory_entries"], 2)
+
+        llm_cache.set("d", "d", call_type="default")
+        self.assertIsNone(llm_cache.get("d", call_type="default"))
+
+
+def _http_error(status_code, retry_after=None):
+    response = requests.Response()
+    response.status_code = status_code
+    if retry_after is not None:
+        response.headers["Retry-After"] = retry_after
+    return requests.HTTPError(response=response)
+
+
+@override_settings(
+    LLM_RATE_LIMIT=0,
+    LLM_RATE_LIMIT_PATH="",
+    LLM_RETRY_ATTEMPTS=3,
+    LLM_RETRY_BASE_SECONDS=0,
+    LLM_RETRY_MAX_SECONDS=0,
+    LLM_BREAKER_THRESHOLD=2,
+    LLM_BREAKER_RESET_SECONDS=60,
+)
+class LLMGuardTest(SimpleTestCase):
+    """Tests for the outbound rate limiter, retries and circuit breaker"""
+
+    def setUp(self):
+        llm_guard.reset()
+
+    def tearDown(self):
+        llm_guard.reset()
+
+    def test_retries_throttled_calls(self):
+        """Test that a 429 is retried and the eventual response returned"""
+        send = MagicMock(side_effect=[_http_error(429), "ok"])
+        self.assertEqual(llm_guard.call(send), "ok")
+        self.assertEqual(send.call_count, 2)
+        self.assertEqual(llm_guard.stats()["retries"], 1)
+
+    def test_client_errors_not_retried(self):
+        """Test that a 400 fails immediately"""
+        send = MagicMock(side_effect=_http_error(400))
+        with self.assertRaises(requests.HTTPError):
+            llm_guard.call(send)
+        self.assertEqual(send.call_count, 1)
+
+    def test_retry_after_header(self):
+        """Test that Retry-After is parsed from throttled responses"""
+        self.assertEqual(retry_after(_http_error(429, "3")), 3.0)
+        self.assertIsNone(retry_after(_http_error(429)))
+
+    def test_circuit_opens_and_fails_fast(self):
+        """Test that repeated provider failures open the circuit"""
+        send = MagicMock(side_effect=_http_error(503))
+        # The retry after the second failure already finds the circuit open
+        with self.assertRaises(CircuitOpenError):
+            llm_guard.call(send)
+        self.assertEqual(llm_guard.stats()["circuit"], "open")
+
+        with self.assertRaises(CircuitOpenError):
+            llm_guard.call(send)
+        self.assertEqual(send.call_count, 2)
+
+    @override_settings(LLM_RETRY_ATTEMPTS=1, LLM_BREAKER_THRESHOLD=1, LLM_BREAKER_RESET_SECONDS=0)
+    def test_probe_always_resolves(self):
+        """Test that a half-open probe failing without a retryable error does not wedge the circuit"""
+        with self.assertRaises(requests.HTTPError):
+            llm_guard.call(MagicMock(side_effect=_http_error(503)))
+        self.assertEqual(llm_guard.stats()["circuit"], "open")
+
+        # A client error is still a provider response: the circuit closes
+        with self.assertRaises(requests.HTTPError):
+            llm_guard.call(MagicMock(side_effect=_http_error(400)))
+        self.assertEqual(llm_guard.stats()["circuit"], "closed")
+
+        # A cancelled probe hands the next call the probe
+        with self.assertRaises(requests.HTTPError):
+            llm_guard.call(MagicMock(side_effect=_http_error(503)))
+        with self.assertRaises(KeyboardInterrupt):
+            llm_guard.call(MagicMock(side_effect=KeyboardInterrupt))
+        self.assertEqual(llm_guard.stats()["circuit"], "open")
+        self.assertEqual(llm_guard.call(MagicMock(return_value="ok")), "ok")
+        self.assertEqual(llm_guard.stats()["circuit"], "closed")
+
+    def test_async_call_retries(self):
+        """Test the async path used by the LLM engine"""
+        send = AsyncMock(side_effect=[_http_error(502), "ok"])
+        self.assertEqual(llm_engine.run(llm_guard.acall(send)), "ok")
+
+    def test_shared_token_bucket(self):
+        """Test that buckets sharing a state file draw from the same tokens"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "bucket.json")
+            first, second = TokenBucket(1, 2, path), TokenBucket(1, 2, path)
+            self.assertEqual(first.try_acquire(), 0)
+            self.assertEqual(second.try_acquire(), 0)
+            self.assertGreater(first.try_acquire(), 0)
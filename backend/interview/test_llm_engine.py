@@ -0,0 +1,138 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from jobify_backend.llm_engine import llm_engine
+
+from .models.interview_session import InterviewSession
+from .multi_agent import BaseAgent, InterviewerRole
+from .utils import get_feedback_using_openai_multi_agent, get_questions_using_openai_multi_agent, store_answer
+
+
+def _create_answered_session(**fields):
+    """A session with stored questions and every answer submitted."""
+    session = InterviewSession.objects.create(**fields)
+    session.set_questions(["TQ?"], ["Q1?", "Q2?", "Q3?"])
+    store_answer(session.id, "tech", 0, "TQ?", "TA")
+    for index, answer in enumerate(["A1", "A2", "A3"]):
+        store_answer(session.id, "interview", index, f"Q{index + 1}?", answer)
+    return session
+
+
+class LLMEngineTest(SimpleTestCase):
+    """Tests for the asyncio LLM fan-out engine"""
+
+    def test_gather_preserves_order(self):
+        """Test that gather returns results in submission order"""
+        async def delayed(value, delay):
+            await asyncio.sleep(delay)
+            return value
+
+        results = llm_engine.gather(delayed("a", 0.03), delayed("b", 0.01), delayed("c", 0))
+        self.assertEqual(results, ["a", "b", "c"])
+
+    def test_run_propagates_exceptions(self):
+        """Test that the sync facade re-raises coroutine errors"""
+        async def boom():
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            llm_engine.run(boom())
+
+
+class MultiAgentFanOutTest(TestCase):
+    """Tests for multi-agent question and feedback fan-out on the engine"""
+
+    def setUp(self):
+        self.session = _create_answered_session(
+            keywords=["python", "django"],
+            target_job="Software Engineer",
+        )
+
+    @patch.object(llm_engine, "chat_completion", new_callable=AsyncMock)
+    def test_questions_generated_concurrently(self, chat_completion):
+        """Test that all four questions come from one engine batch"""
+        chat_completion.return_value = json.dumps(
+            {"question": "Generated?", "focus_area": "General", "difficulty": 3}
+        )
+
+        get_questions_using_openai_multi_agent(self.session)
+
+        self.session.refresh_from_db()
+        self.assertEqual(chat_completion.await_count, 4)
+        self.assertEqual(self.session.tech_questions, ["Generated?"])
+        self.assertEqual(len(self.session.questions), 3)
+        self.assertEqual(self.session.question_status, InterviewSession.Status.COMPLETE)
+
+    @patch("interview.utils.llm_client.chat_completion")
+    @patch.object(llm_engine, "chat_completion", new_callable=AsyncMock)
+    def test_feedback_evaluations_regrouped_per_question(self, chat_completion, synthesize):
+        """Test that evaluations are issued in one batch and regrouped per question"""
+        chat_completion.return_value = json.dumps(
+            {"score": 8, "strengths": ["s"], "weaknesses": ["w"], "improvement_tips": ["t"]}
+        )
+        synthesize.return_value = json.dumps(
+            {"question_feedback": ["f0", "f1", "f2", "f3"], "summary": "done"}
+        )
+
+        feedback = get_feedback_using_openai_multi_agent(self.session)
+
+        # 3 tech reviewers + 2 + 3 + 3 interview reviewers
+        self.assertEqual(chat_completion.await_count, 11)
+        self.assertEqual(feedback["tech_question_feedback"], "f0")
+        self.assertEqual(feedback["question_3_feedback"], "f3")
+        self.assertEqual(feedback["summary"], "done")
+
+
+def _batch_response(prompt, **kwargs):
+    """Answer a batched prompt with one evaluation per listed answer"""
+    count = prompt.count("Question asked:")
+    evaluation = {"score": 7, "strengths": ["s"], "weaknesses": ["w"], "improvement_tips": ["t"]}
+    if "evaluations" not in prompt:
+        return json.dumps(evaluation)
+    return json.dumps({"evaluations": [dict(evaluation, index=index) for index in range(count)]})
+
+
+@override_settings(LLM_BATCH_REVIEWS=True)
+class BatchedReviewTest(TestCase):
+    """Tests for the single-call-per-reviewer feedback mode"""
+
+    def setUp(self):
+        self.session = _create_answered_session(
+            keywords=["python", "django"],
+            target_job="Software Engineer",
+        )
+
+    @patch("interview.utils.llm_client.chat_completion")
+    @patch.object(llm_engine, "chat_completion", new_callable=AsyncMock, side_effect=_batch_response)
+    def test_one_call_per_reviewer(self, chat_completion, synthesize):
+        """Test that each reviewer role scores all of its answers in one call"""
+        synthesize.return_value = json.dumps(
+            {"question_feedback": ["f0", "f1", "f2", "f3"], "summary": "done"}
+        )
+
+        feedback = get_feedback_using_openai_multi_agent(self.session)
+
+        # 11 evaluations spread over the five reviewer roles
+        self.assertEqual(chat_completion.await_count, 5)
+        self.assertEqual(feedback["summary"], "done")
+
+    @patch.object(llm_engine, "chat_completion", new_callable=AsyncMock)
+    def test_unparsed_items_fall_back_per_answer(self, chat_completion):
+        """Test that answers missing from a batched response are evaluated singly"""
+        single = {"score": 4, "strengths": [], "weaknesses": [], "improvement_tips": []}
+        chat_completion.side_effect = [
+            json.dumps({"evaluations": [{"index": 1, "score": 9}]}),
+            json.dumps(single),
+            json.dumps(single),
+        ]
+        agent = BaseAgent(InterviewerRole.TECHNICAL_LEAD, "key")
+
+        results = llm_engine.run(
+            agent.evaluate_answers([("Q1?", "A1"), ("Q2?", "A2"), ("Q3?", "A3")], "SWE", ["python"])
+        )
+
+        self.assertEqual([result["score"] for result in results], [4, 9, 4])
+        self.assertEqual(chat_completion.await_count, 3)
@@ -0,0 +1,86 @@
+import json
+from unittest.mock import AsyncMock, patch
+
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from jobify_backend.llm_engine import llm_engine
+from jobify_backend.metrics import metrics
+
+from .models.interview_session import InterviewSession
+from .utils import store_answer
+from .views import generate_feedback_background
+
+
+def _create_answered_session(**fields):
+    """A session with stored questions and every answer submitted."""
+    session = InterviewSession.objects.create(**fields)
+    session.set_questions(["TQ?"], ["Q1?", "Q2?", "Q3?"])
+    store_answer(session.id, "tech", 0, "TQ?", "TA")
+    for index, answer in enumerate(["A1", "A2", "A3"]):
+        store_answer(session.id, "interview", index, f"Q{index + 1}?", answer)
+    return session
+
+
+class MetricsTest(SimpleTestCase):
+    """Tests for the latency histograms and the /metrics endpoint"""
+
+    def setUp(self):
+        metrics.reset()
+
+    def test_timer_records_histogram_and_timings(self):
+        """Test that a stage timer feeds both the histogram and the session breakdown"""
+        timings = {}
+        with metrics.timer("grammar", timings):
+            pass
+        metrics.observe("grammar", 0.5, timings)
+
+        series = metrics.stages.snapshot()["grammar"]
+        self.assertEqual(series["count"], 2)
+        self.assertGreaterEqual(timings["grammar"], 0.5)
+
+    def test_prometheus_exposition(self):
+        """Test the text format served on /metrics"""
+        metrics.observe("llamaparse", 3)
+        metrics.observe_llm("evaluation", 0.2)
+
+        response = self.client.get(reverse("metrics"))
+
+        self.assertEqual(response.status_code, 200)
+        body = response.content.decode()
+        self.assertIn("# TYPE jobify_stage_duration_seconds histogram", body)
+        self.assertIn('jobify_stage_duration_seconds_bucket{stage="llamaparse",', body)
+        self.assertIn('le="2.5"} 0', body)
+        self.assertIn('jobify_llm_request_duration_seconds_count{call_type="evaluation",', body)
+        for collected in (
+            "jobify_llm_client_requests_total",
+            "jobify_llm_cache_memory_entries",
+            'jobify_llm_breaker_state{state="closed",',
+            "jobify_llm_engine_in_flight",
+        ):
+            self.assertIn(collected, body)
+
+
+class SessionTimingTest(TestCase):
+    """Tests for the per-session stage timing breakdown"""
+
+    @patch("interview.utils.llm_client.chat_completion")
+    @patch.object(llm_engine, "chat_completion", new_callable=AsyncMock)
+    def test_feedback_stages_stored_on_session(self, chat_completion, synthesize):
+        """Test that feedback generation stores its stage timings"""
+        chat_completion.return_value = json.dumps({"score": 8, "strengths": [], "weaknesses": [], "improvement_tips": []})
+        synthesize.return_value = json.dumps({"question_feedback": ["f0", "f1", "f2", "f3"], "summary": "done"})
+        session = _create_answered_session(
+            keywords=["python"],
+            target_job="Software Engineer",
+            stage_timings={"llamaparse": 2.0},
+        )
+
+        generate_feedback_background(session)
+
+        session.refresh_from_db()
+        self.assertEqual(session.feedback_status, InterviewSession.Status.COMPLETE)
+        self.assertIsNotNone(session.feedback_started)
+        self.assertEqual(session.stage_timings["llamaparse"], 2.0)
+        for stage in ("evaluations", "synthesis", "db_save", "feedback_total"):
+            self.assertIn(stage, session.stage_timings)
@@ -0,0 +1,90 @@
+from django.test import TestCase, override_settings
+
+from .models import BankedQuestion, InterviewSession
+from .question_bank import (
+    canonical_job_title,
+    deposit_questions,
+    draw_questions,
+    keyword_similarity,
+)
+from .utils import fill_questions_from_bank
+
+KEYWORDS = ["python", "django", "postgresql", "docker"]
+
+
+def _deposit_full_set(title="Software Engineer", keywords=KEYWORDS):
+    deposit_questions(title, keywords, BankedQuestion.Kind.TECH, ["How does Django's ORM build queries?"])
+    deposit_questions(
+        title,
+        keywords,
+        BankedQuestion.Kind.INTERVIEW,
+        [
+            {"question": "Q hard?", "interviewer_role": "Technical Lead", "difficulty": 5},
+            {"question": "Q easy?", "interviewer_role": "HR Recruiter", "difficulty": 1},
+            {"question": "Q mid?", "interviewer_role": "Hiring Manager", "difficulty": 3},
+            {"question": "Q fallback?", "interviewer_role": "Senior Peer", "fallback": True},
+        ],
+    )
+
+
+@override_settings(QUESTION_BANK_REUSE_RATIO=1.0, QUESTION_BANK_MIN_SIMILARITY=0.5)
+class QuestionBankTest(TestCase):
+    """Tests for the persisted question bank"""
+
+    def test_canonical_job_title(self):
+        """Test job title normalization"""
+        self.assertEqual(canonical_job_title("Sr. Software Developer II"), "software engineer")
+        self.assertEqual(canonical_job_title("Senior Front-End Engineer"), "frontend engineer")
+        self.assertEqual(canonical_job_title("SWE"), "software engineer")
+
+    def test_keyword_similarity(self):
+        """Test Jaccard keyword similarity"""
+        self.assertEqual(keyword_similarity(["Python", "django"], ["python", "DJANGO"]), 1.0)
+        self.assertEqual(keyword_similarity(["python"], ["java"]), 0.0)
+
+    def test_deposit_skips_fallbacks_and_duplicates(self):
+        """Test that fallback questions and repeats are not banked"""
+        _deposit_full_set()
+        _deposit_full_set()
+        self.assertEqual(BankedQuestion.objects.filter(kind=BankedQuestion.Kind.INTERVIEW).count(), 3)
+        self.assertFalse(BankedQuestion.objects.filter(question="Q fallback?").exists())
+
+    def test_draw_matching_set(self):
+        """Test drawing a full set for a similar session"""
+        _deposit_full_set()
+
+        banked = draw_questions("Software Developer", ["python", "django", "docker"])
+
+        self.assertEqual(banked["tech_questions"], ["How does Django's ORM build queries?"])
+        self.assertEqual(banked["questions"], ["Q easy?", "Q mid?", "Q hard?"])
+        self.assertEqual(BankedQuestion.objects.filter(times_served=1).count(), 4)
+
+    def test_no_match_for_different_job_or_keywords(self):
+        """Test that dissimilar sessions fall through to the LLM"""
+        _deposit_full_set()
+        self.assertIsNone(draw_questions("Product Designer", KEYWORDS))
+        self.assertIsNone(draw_questions("Software Engineer", ["figma", "sketch"]))
+
+    @override_settings(QUESTION_BANK_MAX_SERVES=1)
+    def test_retired_questions_not_served(self):
+        """Test the diversity policy retires heavily served questions"""
+        _deposit_full_set()
+        self.assertIsNotNone(draw_questions("Software Engineer", KEYWORDS))
+        self.assertIsNone(draw_questions("Software Engineer", KEYWORDS))
+
+    @override_settings(QUESTION_BANK_REUSE_RATIO=0.0)
+    def test_reuse_ratio_zero_always_generates(self):
+        """Test that a zero reuse ratio disables drawing"""
+        _deposit_full_set()
+        self.assertIsNone(draw_questions("Software Engineer", KEYWORDS))
+
+    def test_fill_session_from_bank(self):
+        """Test that a session is completed straight from the bank"""
+        _deposit_full_set()
+        session = InterviewSession.objects.create(target_job="Software Engineer", keywords=KEYWORDS)
+
+        self.assertTrue(fill_questions_from_bank(session))
+
+        session.refresh_from_db()
+        self.assertEqual(session.question_status, InterviewSession.Status.COMPLETE)
+        self.assertEqual(len(session.questions), 3)
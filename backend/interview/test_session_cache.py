@@ -0,0 +1,100 @@
+from unittest.mock import patch
+
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from resume.tasks import mark_resume_failed
+from resume.utils import get_session_by_id
+
+from . import session_cache
+from .models.interview_session import InterviewSession
+
+SESSION_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "sessions": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "session-cache-tests"},
+}
+
+
+@override_settings(CACHES=SESSION_CACHES, SESSION_CACHE_TTL=60)
+class SessionCacheTest(TestCase):
+    """Tests for the read-through cache of session statuses"""
+
+    def setUp(self):
+        caches["sessions"].clear()
+        self.session = InterviewSession.objects.create(questions=["Q1?"])
+
+    def _statuses(self):
+        return get_session_by_id(self.session.id, only=InterviewSession.STATUS_FIELDS)
+
+    def test_repeated_reads_skip_database(self):
+        """Test that only the first status read queries the database"""
+        self._statuses()
+        with self.assertNumQueries(0):
+            session = self._statuses()
+        self.assertEqual(session.resume_status, InterviewSession.Status.PROCESSING)
+
+    def test_deferred_columns_load_from_database(self):
+        """Test that a cached session still loads its other columns on access"""
+        self._statuses()
+        session = self._statuses()
+        with self.assertNumQueries(1):
+            self.assertEqual(session.questions, ["Q1?"])
+
+    def test_save_invalidates(self):
+        """Test that saving a status column drops the cached entry"""
+        self._statuses()
+        self.session.question_status = InterviewSession.Status.COMPLETE
+        self.session.save(update_fields=["question_status"])
+
+        self.assertEqual(self._statuses().question_status, InterviewSession.Status.COMPLETE)
+
+    def test_worker_update_invalidates(self):
+        """Test that a worker's queryset update drops the cached entry"""
+        self._statuses()
+        mark_resume_failed(self.session.id)
+
+        self.assertEqual(self._statuses().resume_status, InterviewSession.Status.FAILED)
+
+    def test_snapshot_read_before_write_not_served(self):
+        """Test that a poller that read the row before a write cannot cache the old statuses"""
+        load = session_cache._load_statuses
+
+        def load_then_write(session_id):
+            values = load(session_id)
+            # The write lands after the poller's read, before it stores its snapshot
+            mark_resume_failed(session_id)
+            return values
+
+        with patch("interview.session_cache._load_statuses", side_effect=load_then_write):
+            self.assertEqual(self._statuses().resume_status, InterviewSession.Status.PROCESSING)
+
+        self.assertEqual(self._statuses().resume_status, InterviewSession.Status.FAILED)
+
+    def test_delete_invalidates(self):
+        """Test that a deleted session is not served from the cache"""
+        self._statuses()
+        self.session.delete()
+
+        self.assertIsNone(self._statuses())
+
+
+@override_settings(CACHES=SESSION_CACHES, SESSION_CACHE_TTL=60)
+class CachedPollingTest(APITestCase):
+    """Tests for status polling served from the session cache"""
+
+    def setUp(self):
+        caches["sessions"].clear()
+        self.session = InterviewSession.objects.create()
+
+    def test_in_progress_polls_skip_database(self):
+        """Test that polls of an in-progress session after the first run no queries"""
+        self.client.post(reverse("get-keywords"), {"id": str(self.session.id)}, format="json")
+        for name in ("get-keywords", "get-grammar-results", "get-all-questions", "get-feedback"):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.post(reverse(name), {"id": str(self.session.id)}, format="json")
+            self.assertEqual(response.status_code, 200, name)
+            self.assertEqual(len(queries), 0, name)
@@ -0,0 +1,109 @@
+import asyncio
+import json
+import threading
+import uuid
+
+from asgiref.sync import async_to_sync, sync_to_async
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from .models.interview_session import InterviewSession
+from .session_events import session_event_hub, snapshot_events, stream_session_events
+
+
+def _parse(chunk):
+    """Split an SSE chunk into (event, data), or None for comments and retry hints."""
+    lines = dict(line.split(": ", 1) for line in chunk.strip().split("\n") if not line.startswith(":"))
+    if "event" not in lines:
+        return None
+    return lines["event"], json.loads(lines["data"])
+
+
+class SessionEventHubTest(TestCase):
+    """Tests for waking session event streams"""
+
+    def test_signal_wakes_async_stream(self):
+        """Test that a signal from another thread wakes a stream waiting on the event loop"""
+        session_id = uuid.uuid4()
+        version = session_event_hub.subscribe(session_id)
+
+        async def wait():
+            threading.Timer(0.05, session_event_hub.signal, args=(session_id,)).start()
+            return await session_event_hub.wait_async(session_id, version, timeout=5)
+
+        try:
+            self.assertEqual(asyncio.run(wait()), version + 1)
+        finally:
+            session_event_hub.unsubscribe(session_id)
+
+    def test_signal_without_subscribers_is_dropped(self):
+        """Test that sessions without an open stream are not tracked"""
+        session_id = uuid.uuid4()
+        session_event_hub.signal(session_id)
+        self.assertEqual(asyncio.run(session_event_hub.wait_async(session_id, 0, timeout=0)), 0)
+
+
+@override_settings(SESSION_EVENTS_POLL_SECONDS=1, SESSION_EVENTS_MAX_SECONDS=5)
+class SessionEventStreamTest(TestCase):
+    """Tests for the session event stream"""
+
+    def setUp(self):
+        self.session = InterviewSession.objects.create(keywords=["python"])
+
+    def test_partial_results_hidden_until_complete(self):
+        """Test that keywords are only sent once their stage is complete"""
+        row = {field: getattr(self.session, field) for field in (
+            "resume_status", "keywords_status", "keywords", "grammar_status", "grammar_results",
+            "question_status", "tech_questions", "questions", "feedback_status", "feedback",
+        )}
+        self.assertEqual(snapshot_events(row)["keywords"], {"status": "processing", "keywords": []})
+
+        row["keywords_status"] = InterviewSession.Status.COMPLETE
+        self.assertEqual(snapshot_events(row)["keywords"]["keywords"], ["python"])
+
+    def test_grammar_event_sends_first_page(self):
+        """Test that the grammar event carries one page of matches, not the whole result"""
+        match = {"offset": 0, "length": 3, "rule": "R", "category": "TYPOS", "message": "m", "short_message": "",
+                 "replacements": [], "context": "abc", "context_offset": 0}
+        row = {"resume_status": "complete", "keywords_status": "complete", "keywords": [],
+               "grammar_status": InterviewSession.Status.COMPLETE,
+               "grammar_results": {"language": "en-US", "matches": [match] * 120},
+               "question_status": "processing", "tech_questions": [], "questions": [],
+               "feedback_status": "processing", "feedback": None}
+
+        grammar = snapshot_events(row)["grammar"]["grammar_check"]
+        self.assertEqual((len(grammar["matches"]), grammar["total"], grammar["page"]), (50, 120, 1))
+
+    def _complete_feedback(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.session.feedback_status = InterviewSession.Status.COMPLETE
+            self.session.feedback = {"summary": "done"}
+            self.session.save(update_fields=["feedback_status", "feedback"])
+
+    def test_stream_pushes_changes_and_finishes(self):
+        """Test that only changed stages are sent and the stream ends with done"""
+
+        @async_to_sync
+        async def consume():
+            stream = stream_session_events(self.session.id)
+            initial = [await anext(stream) for _ in range(6)]
+            await sync_to_async(self._complete_feedback)()
+            return initial, [chunk async for chunk in stream]
+
+        initial, remaining = consume()
+        initial = [_parse(chunk) for chunk in initial]
+        self.assertIsNone(initial[0])  # retry hint
+        self.assertEqual([event for event, _ in initial[1:]], ["resume", "keywords", "grammar", "questions", "feedback"])
+
+        remaining = [parsed for parsed in map(_parse, remaining) if parsed]
+        self.assertEqual(remaining, [("feedback", {"status": "complete", "feedbacks": {"summary": "done"}}), ("done", {})])
+
+    def test_events_endpoint(self):
+        """Test that the endpoint streams text/event-stream and 404s for unknown sessions"""
+        response = self.client.get(reverse("session-events", args=[uuid.uuid4()]))
+        self.assertEqual(response.status_code, 404)
+
+        response = self.client.get(reverse("session-events", args=[self.session.id]))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        response.close()
@@ -0,0 +1,132 @@
+import json
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from .models.banked_question import BankedQuestion
+from .models.interview_session import InterviewSession
+from .utils import (
+    get_questions_using_openai,
+    infer_target_titles,
+    pregenerate_questions,
+    promote_speculative_questions,
+    store_answer,
+)
+
+
+def _questions(title):
+    return json.dumps({"tech_question": [f"{title} tech?"], "interview_question": [f"{title} {i}?" for i in range(3)]})
+
+
+def _fake_completion(prompt, call_type="default", **kwargs):
+    if call_type == "titles":
+        return '["Software Engineer", "Data Analyst"]'
+    title = "Data Analyst" if "Data Analyst" in prompt else "Software Engineer"
+    return _questions(title)
+
+
+@override_settings(SPECULATIVE_QUESTION_TITLES=2, QUESTION_BANK_ENABLED=True)
+@patch("interview.utils.llm_client.chat_completion", side_effect=_fake_completion)
+class SpeculativeQuestionsTest(TestCase):
+    """Tests for pre-generating questions before the target job is known"""
+
+    def setUp(self):
+        self.session = InterviewSession.objects.create(keywords=["python", "sql"])
+
+    def test_infer_target_titles(self, chat_completion):
+        """Test that inferred titles are parsed from the model's JSON array"""
+        self.assertEqual(infer_target_titles(["python"], 2), ["Software Engineer", "Data Analyst"])
+
+    def test_pregenerated_questions_stored_by_title(self, chat_completion):
+        """Test that questions are stored per canonical title until a target job arrives"""
+        pregenerate_questions(self.session.id)
+
+        self.session.refresh_from_db()
+        self.assertEqual(set(self.session.speculative_questions), {"software engineer", "data analyst"})
+        self.assertEqual(self.session.question_status, InterviewSession.Status.PROCESSING)
+
+    def test_matching_title_promoted_and_rest_recycled(self, chat_completion):
+        """Test that the matching set is promoted and the others go to the question bank"""
+        pregenerate_questions(self.session.id)
+        self.session.refresh_from_db()
+        self.session.target_job = "software engineer"
+
+        self.assertTrue(promote_speculative_questions(self.session))
+
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.question_status, InterviewSession.Status.COMPLETE)
+        self.assertEqual(self.session.tech_questions, ["Software Engineer tech?"])
+        self.assertEqual(self.session.speculative_questions, {})
+        banked = set(BankedQuestion.objects.values_list("job_title", flat=True))
+        self.assertEqual(banked, {"data analyst"})
+
+    def test_target_job_set_while_generating(self, chat_completion):
+        """Test that a set finishing after target_job is chosen is promoted directly"""
+        InterviewSession.objects.filter(id=self.session.id).update(target_job="Data Analyst")
+
+        pregenerate_questions(self.session.id)
+
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.question_status, InterviewSession.Status.COMPLETE)
+        self.assertEqual(self.session.tech_questions, ["Data Analyst tech?"])
+        self.assertEqual(self.session.speculative_questions, {})
+
+
+    def test_questions_for_replaced_title_discarded(self, chat_completion):
+        """Test that questions generated for a title changed meanwhile are not stored"""
+        self.session.target_job = "Data Analyst"
+        self.session.save(update_fields=["target_job"])
+        InterviewSession.objects.filter(id=self.session.id).update(target_job="Software Engineer")
+
+        get_questions_using_openai(self.session)
+
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.question_status, InterviewSession.Status.PROCESSING)
+        self.assertEqual(self.session.tech_questions, [])
+
+    def test_late_generation_keeps_promoted_questions(self, chat_completion):
+        """Test that a generation job finishing after promotion does not replace answered questions"""
+        pregenerate_questions(self.session.id)
+        self.session.refresh_from_db()
+        self.session.target_job = "Software Engineer"
+        self.session.save(update_fields=["target_job"])
+        self.assertTrue(promote_speculative_questions(self.session))
+        store_answer(self.session.id, "interview", 0, "Software Engineer 0?", "A1")
+
+        get_questions_using_openai(InterviewSession.objects.get(id=self.session.id))
+
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.answers, ["A1", "", ""])
+        self.assertEqual(self.session.interview_answered, 1)
+
+
+class TargetJobPromotionTest(APITestCase):
+    """Tests for serving pre-generated questions from the target job endpoint"""
+
+    @patch("resume.views.enqueue")
+    def test_target_job_uses_pregenerated_questions(self, enqueue):
+        """Test that a matching pre-generated set skips question generation"""
+        session = InterviewSession.objects.create(
+            keywords=["python"],
+            speculative_questions={
+                "software engineer": {
+                    "title": "Software Engineer",
+                    "tech_questions": ["T?"],
+                    "questions": ["Q1?", "Q2?", "Q3?"],
+                }
+            },
+        )
+
+        response = self.client.post(
+            reverse("target-job"),
+            {"id": str(session.id), "title": "Software Engineer", "answer_type": "text"},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        enqueue.assert_not_called()
+        session.refresh_from_db()
+        self.assertEqual(session.questions, ["Q1?", "Q2?", "Q3?"])
+        self.assertEqual(session.question_status, InterviewSession.Status.COMPLETE)
@@ -0,0 +1,89 @@
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from django.db.utils import ConnectionHandler
+from django.test import TransactionTestCase
+
+from jobify_backend.sqlite3.base import DatabaseWrapper
+
+
+class SQLiteConcurrencyTest(TransactionTestCase):
+    """Tests for the single-writer SQLite backend on a file database"""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.handler = ConnectionHandler(
+            {
+                "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"},
+                "sqlite_test": {
+                    "ENGINE": "jobify_backend.sqlite3",
+                    "NAME": str(Path(directory.name) / "test.sqlite3"),
+                    "OPTIONS": {
+                        "init_command": "PRAGMA journal_mode=WAL;PRAGMA synchronous=NORMAL;PRAGMA cache_size=-2048",
+                        "timeout": 5,
+                        "transaction_mode": "IMMEDIATE",
+                    },
+                }
+            }
+        )
+        self.addCleanup(self.handler.close_all)
+        with self.handler["sqlite_test"].cursor() as cursor:
+            cursor.execute("CREATE TABLE events (id INTEGER PRIMARY KEY, name TEXT)")
+
+    def _connection(self) -> DatabaseWrapper:
+        return self.handler["sqlite_test"]
+
+    def test_pragmas_applied(self):
+        """Test that every connection runs the profile's pragmas"""
+        with self._connection().cursor() as cursor:
+            self.assertEqual(cursor.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+            self.assertEqual(cursor.execute("PRAGMA synchronous").fetchone()[0], 1)
+            self.assertEqual(cursor.execute("PRAGMA cache_size").fetchone()[0], -2048)
+
+    def test_writes_wait_for_open_transaction(self):
+        """Test that a write from another thread waits for the open transaction instead of failing"""
+        order = []
+        started = threading.Event()
+
+        def writer():
+            connection = self._connection()
+            started.wait()
+            with connection.cursor() as cursor:
+                cursor.execute("INSERT INTO events (name) VALUES (%s)", ["second"])
+            order.append("second")
+            connection.close()
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        connection = self._connection()
+        connection.ensure_connection()
+        # What transaction.atomic does on SQLite (atomic always uses the global handler)
+        connection._start_transaction_under_autocommit()
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM events")
+            started.set()
+            time.sleep(0.2)
+            cursor.execute("INSERT INTO events (name) VALUES (%s)", ["first"])
+        order.append("first")
+        connection.commit()
+        thread.join(5)
+
+        self.assertEqual(order, ["first", "second"])
+        self.assertFalse(connection.holds_writer_lock)
+        with connection.cursor() as cursor:
+            self.assertEqual(cursor.execute("SELECT name FROM events ORDER BY id").fetchall(), [("first",), ("second",)])
+
+    def test_lock_released_on_rollback(self):
+        """Test that a rolled back transaction lets the next writer in"""
+        connection = self._connection()
+        connection.ensure_connection()
+        connection._start_transaction_under_autocommit()
+        self.assertTrue(connection.holds_writer_lock)
+        connection.rollback()
+
+        self.assertFalse(connection.holds_writer_lock)
+        with connection.cursor() as cursor:
+            cursor.execute("INSERT INTO events (name) VALUES (%s)", ["after"])
@@ -0,0 +1,50 @@
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from .models.interview_session import InterviewSession
+
+HEAVY_COLUMNS = ("grammar_results", "speculative_questions", '"feedback"', "stage_timings")
+
+
+@override_settings(SESSION_CACHE_TTL=0)  # every poll reads the database
+class StatusProjectionTest(APITestCase):
+    """Tests for polling endpoints reading only status columns until results are ready"""
+
+    def setUp(self):
+        self.session = InterviewSession.objects.create(
+            keywords=["python"],
+            grammar_results={"language": "en-US", "matches": []},
+            questions=["Q1?", "Q2?", "Q3?"],
+            tech_questions=["TQ?"],
+        )
+
+    def _poll(self, name):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(reverse(name), {"id": str(self.session.id)}, format="json")
+        self.assertEqual(response.status_code, 200)
+        return response, [query["sql"] for query in queries]
+
+    def test_unfinished_polls_skip_heavy_columns(self):
+        """Test that not-yet-finished polls run one query without JSON result columns"""
+        for name in ("get-keywords", "get-grammar-results", "get-all-questions", "get-feedback"):
+            response, queries = self._poll(name)
+            self.assertEqual(len(queries), 1, name)
+            for column in HEAVY_COLUMNS:
+                self.assertNotIn(column, queries[0], name)
+            self.assertNotIn('"keywords"', queries[0], name)
+
+    def test_finished_poll_loads_results(self):
+        """Test that results are loaded once their stage is complete"""
+        InterviewSession.objects.filter(id=self.session.id).update(
+            resume_status=InterviewSession.Status.COMPLETE,
+            question_status=InterviewSession.Status.COMPLETE,
+        )
+
+        response, queries = self._poll("get-all-questions")
+
+        self.assertEqual(len(queries), 2)
+        self.assertEqual(response.data["tech_questions"], ["TQ?"])
+        self.assertEqual(response.data["interview_questions"], ["Q1?", "Q2?", "Q3?"])
@@ -5,6 +5,7 @@ from .views import (
     get_all_questions,
     get_feedback,
     ping,
+    session_events,
     submit_interview_answer,
     submit_tech_answer,
 )
@@ -19,5 +20,6 @@ urlpatterns = [
         name="submit-interview-answer",
     ),
     path("feedback/", get_feedback, name="get-feedback"),
+    path("sessions/<uuid:session_id>/events", session_events, name="session-events"),
     path("cleanup-all-videos/", cleanup_all_videos, name="cleanup-all-videos"),
 ]
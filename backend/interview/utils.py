@@ -1,20 +1,34 @@
+import hashlib
 import json
 import os
 import re
-from concurrent.futures import ThreadPoolExecutor
+import time
+from functools import partial
 from typing import List, Dict, Any
 
-import requests
-from requests import session
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
 
+from .completion import ANSWERED_FIELDS, adjust_answered, claim_completion
+from .job_queue import enqueue
+from .models.banked_question import BankedQuestion
 from .models.interview_session import InterviewSession
+from .models.job import Job
+from .models.question_answer import QuestionAnswer
 from interview.multi_agent import BaseAgent, InterviewerRole
+from interview.question_bank import canonical_job_title, deposit_questions, draw_questions
+from jobify_backend.llm_client import llm_client, parse_json_array
+from jobify_backend.llm_engine import llm_engine
 from jobify_backend.logger import logger
+from jobify_backend.metrics import metrics
 
-def get_questions_using_openai(interview_session):
-    target_job = interview_session.target_job
-    keywords = interview_session.keywords
 
+def _generate_questions(target_job: str, keywords: List[str]) -> Dict[str, List[str]]:
+    """
+    Generate one tech and three interview questions in a single call.
+    Returns ``{"tech_questions": [...], "questions": [...]}`` or None if the response can't be parsed.
+    """
     prompt = f"""
     You are a professional career coach helping job seekers prepare for interviews.
 
@@ -31,30 +45,59 @@ def get_questions_using_openai(interview_session):
 
     Do not include any explanations, formatting, or markdown. Only return the raw JSON object.
     """
-    response = requests.post(
-        "https://openrouter.ai/api/v1/chat/completions",
-        headers={
-            "Authorization": f"Bearer {os.getenv('OPEN_ROUTER_API_KEY')}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "jobify.com",
-            "X-Title": "Jobify",
-        },
-        data=json.dumps(
-            {
-                "model": "openai/gpt-4o",
-                "messages": [{"role": "user", "content": prompt}],
-            }
-        ),
-    )
-    response_text = response.json()["choices"][0]["message"]["content"]
+    response_text = llm_client.chat_completion(prompt, call_type="questions", validate=_parse_questions)
     try:
-        questions = json.loads(response_text)
-        interview_session.questions = questions["interview_question"]
-        interview_session.tech_questions = questions["tech_question"]
-        interview_session.question_status = InterviewSession.Status.COMPLETE
-        interview_session.save()
-    except json.JSONDecodeError:
-        print(f"Error parsing questions: {response_text}")
+        return _parse_questions(response_text)
+    except (ValueError, KeyError, TypeError):
+        logger.error(f"Error parsing questions: {response_text}")
+        return None
+
+
+def _parse_questions(response_text: str) -> Dict[str, List[str]]:
+    """Parse a question generation response; raises on anything unusable"""
+    questions = json.loads(response_text)
+    return {"tech_questions": questions["tech_question"], "questions": questions["interview_question"]}
+
+
+def get_questions_using_openai(interview_session):
+    target_job = interview_session.target_job
+    keywords = interview_session.keywords
+
+    timings = {}
+    try:
+        with metrics.timer("questions", timings):
+            questions = _generate_questions(target_job, keywords)
+        if questions is None:
+            return
+        with metrics.timer("db_save", timings), transaction.atomic():
+            # The title may have changed while the LLM was answering; the rerun
+            # queued by target_job generates for the new one
+            current_job, question_status = (
+                InterviewSession.objects.select_for_update()
+                .filter(id=interview_session.id)
+                .values_list("target_job", "question_status")
+                .first()
+            )
+            if current_job != target_job:
+                logger.info(
+                    f"Discarding questions for '{target_job}': session {interview_session.id} "
+                    f"now targets '{current_job}'"
+                )
+                return
+            # Questions for this title were served meanwhile (e.g. a promoted
+            # pre-generated set) and may already have answers
+            if question_status == InterviewSession.Status.COMPLETE:
+                logger.info(
+                    f"Discarding questions for '{target_job}': session {interview_session.id} "
+                    f"already has questions"
+                )
+                return
+            interview_session.set_questions(questions["tech_questions"], questions["questions"])
+    finally:
+        InterviewSession.record_stage_timings(interview_session.id, timings)
+
+    deposit_questions(target_job, keywords, BankedQuestion.Kind.TECH, interview_session.tech_questions)
+    deposit_questions(target_job, keywords, BankedQuestion.Kind.INTERVIEW, interview_session.questions)
 
 
 def get_feedback_using_openai_text(interview_session):
@@ -103,26 +146,11 @@ def get_feedback_using_openai_text(interview_session):
     - Use only double quotes and valid JSON syntax.
 
 """
-    response = requests.post(
-        "https://openrouter.ai/api/v1/chat/completions",
-        headers={
-            "Authorization": f"Bearer {os.getenv('OPEN_ROUTER_API_KEY')}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "jobify.com",
-            "X-Title": "Jobify",
-        },
-        data=json.dumps(
-            {
-                "model": "openai/gpt-4o",
-                "messages": [{"role": "user", "content": prompt}],
-            }
-        ),
-    )
-    response_text = response.json()["choices"][0]["message"]["content"]
+    response_text = llm_client.chat_completion(prompt, call_type="feedback", validate=json.loads)
     try:
         feedbacks = json.loads(response_text)
     except json.JSONDecodeError:
-        print(f"Error parsing feedback: {response_text}")
+        logger.error(f"Error parsing feedback: {response_text}")
         return []
     return feedbacks
 
@@ -140,26 +168,14 @@ def get_questions_using_openai_multi_agent(interview_session):
     selected_roles = _select_agent_roles_for_job(target_job, num_agents=3)
     interview_agents = [BaseAgent(role, api_key) for role in selected_roles]
 
-    # Generate tech question and interview questions concurrently
-    with ThreadPoolExecutor(max_workers=4) as executor:
-        # Submit tech question generation
-        tech_future = executor.submit(_generate_tech_question, tech_agent, target_job, keywords)
-        
-        # Submit interview questions generation
-        interview_futures = [
-            executor.submit(agent.generate_question_sync, target_job, keywords)
-            for agent in interview_agents
-        ]
-
-        # Get tech question result
-        tech_question_data = tech_future.result()
-        tech_questions = [tech_question_data["question"]]
-        
-        # Get interview questions results
-        questions_data = []
-        for future in interview_futures:
-            question_data = future.result()
-            questions_data.append(question_data)
+    # Generate tech question and interview questions concurrently on the LLM engine
+    timings = {}
+    with metrics.timer("questions", timings):
+        tech_question_data, *questions_data = llm_engine.gather(
+            _generate_tech_question_async(tech_agent, target_job, keywords),
+            *(agent.generate_question(target_job, keywords) for agent in interview_agents),
+        )
+    tech_questions = [tech_question_data["question"]]
 
     # Sort interview questions by difficulty for better flow
     questions_data.sort(key=lambda q: q.get("difficulty", 3))
@@ -167,82 +183,212 @@ def get_questions_using_openai_multi_agent(interview_session):
     
     # Save results to the database (same as original function)
     try:
-        interview_session.questions = interview_questions
-        interview_session.tech_questions = tech_questions
-        interview_session.question_status = InterviewSession.Status.COMPLETE
         logger.info(f"Generated MA questions: {interview_questions} | Tech Questions: {tech_questions}")
-        interview_session.save()
+        with metrics.timer("db_save", timings):
+            interview_session.set_questions(tech_questions, interview_questions)
     except Exception as e:
-        print(f"Error saving multi-agent questions: {e}")
+        logger.error(f"Error saving multi-agent questions for session {interview_session.id}: {e}")
         interview_session.question_status = InterviewSession.Status.FAILED
-        interview_session.save()
+        interview_session.save(update_fields=["question_status"])
+        return
+    finally:
+        InterviewSession.record_stage_timings(interview_session.id, timings)
 
+    deposit_questions(target_job, keywords, BankedQuestion.Kind.TECH, [tech_question_data])
+    deposit_questions(target_job, keywords, BankedQuestion.Kind.INTERVIEW, questions_data)
 
-def get_feedback_using_openai_multi_agent(interview_session):
-    """Multi-agent version that maintains the same interface as the original function"""
+
+def fill_questions_from_bank(interview_session) -> bool:
+    """
+    Fill a session's questions from the question bank.
+    Returns True if the session is ready without calling the LLM.
+    """
+    banked = draw_questions(interview_session.target_job, interview_session.keywords)
+    if not banked:
+        return False
+
+    interview_session.set_questions(banked["tech_questions"], banked["questions"])
+    return True
+
+
+def infer_target_titles(keywords: List[str], count: int) -> List[str]:
+    """Guess the job titles a candidate with these resume keywords is most likely to target"""
+    prompt = f"""You are an experienced technical recruiter.
+
+    A candidate's resume contains these keywords: {', '.join(keywords)}
+
+    List the {count} job titles this candidate is most likely applying for, most likely first.
+    Use common, generic titles such as "Software Engineer" or "Data Analyst".
+
+    Output ONLY a JSON array of strings. Do not include any explanation or markdown.
+    """
+    response_text = llm_client.chat_completion(prompt, call_type="titles", validate=parse_json_array)
+    try:
+        titles = parse_json_array(response_text)
+    except ValueError:
+        logger.error(f"Error parsing target titles: {response_text}")
+        return []
+    return [title for title in titles if isinstance(title, str) and title.strip()][:count]
+
+
+def _recycle_speculative_questions(entries: List[Dict[str, Any]], keywords: List[str]):
+    """Deposit unused pre-generated question sets into the question bank"""
+    for entry in entries:
+        deposit_questions(entry["title"], keywords, BankedQuestion.Kind.TECH, entry["tech_questions"])
+        deposit_questions(entry["title"], keywords, BankedQuestion.Kind.INTERVIEW, entry["questions"])
+
+
+def pregenerate_questions(session_id):
+    """
+    Background task: once keywords are known, generate questions for the most
+    likely target titles so ``target_job`` can serve them immediately.
+
+    A set is kept on the session until ``target_job`` arrives. If the user has
+    already chosen a matching title and is waiting, the set is promoted right
+    away; otherwise it is recycled into the question bank.
+    """
+    session = InterviewSession.objects.get(id=session_id)
+    keywords = session.keywords
+    if not keywords or settings.SPECULATIVE_QUESTION_TITLES <= 0:
+        return
+
+    generated = set()
+    for title in infer_target_titles(keywords, settings.SPECULATIVE_QUESTION_TITLES):
+        job_title = canonical_job_title(title)
+        if not job_title or job_title in generated:
+            continue
+        generated.add(job_title)
+        with metrics.timer("speculative_questions"):
+            questions = _generate_questions(title, keywords)
+        if questions is None:
+            continue
+        entry = {"title": title, **questions}
+
+        with transaction.atomic():
+            locked = InterviewSession.objects.select_for_update().only(
+                "target_job", "question_status", "speculative_questions"
+            ).get(id=session_id)
+            if not locked.target_job:
+                locked.speculative_questions[job_title] = entry
+                locked.save(update_fields=["speculative_questions"])
+                logger.info(f"Pre-generated questions for '{title}' in session {session_id}")
+                continue
+            waiting = (
+                locked.question_status != InterviewSession.Status.COMPLETE
+                and canonical_job_title(locked.target_job) == job_title
+            )
+            if waiting:
+                locked.set_questions(entry["tech_questions"], entry["questions"])
+        if waiting:
+            logger.info(f"Promoted pre-generated questions for '{title}' in session {session_id}")
+        else:
+            _recycle_speculative_questions([entry], keywords)
+
+
+def enqueue_question_pregeneration(session_id):
+    """Queue speculative question generation behind all user-facing work"""
+    if settings.SPECULATIVE_QUESTION_TITLES <= 0:
+        return
+    enqueue(
+        "pregenerate_questions",
+        session_id,
+        session_id=session_id,
+        priority=-1,
+        dedupe_key=f"pregenerate_questions:{session_id}",
+    )
+
+
+def promote_speculative_questions(interview_session) -> bool:
+    """
+    Serve pre-generated questions matching the session's target job.
+    Non-matching sets are recycled into the question bank either way.
+    Returns True if the session's questions are ready.
+    """
+    job_title = canonical_job_title(interview_session.target_job)
+    with transaction.atomic():
+        locked = InterviewSession.objects.select_for_update().only("speculative_questions").get(
+            id=interview_session.id
+        )
+        speculative = locked.speculative_questions or {}
+        if not speculative:
+            return False
+        match = speculative.pop(job_title, None)
+        locked.speculative_questions = {}
+        locked.save(update_fields=["speculative_questions"])
+
+    _recycle_speculative_questions(list(speculative.values()), interview_session.keywords)
+    if match is None:
+        return False
+
+    interview_session.speculative_questions = {}
+    interview_session.set_questions(match["tech_questions"], match["questions"], update_fields=["speculative_questions"])
+    return True
+
+
+def get_feedback_using_openai_multi_agent(interview_session, timings: Dict[str, float] = None):
+    """
+    Multi-agent version that maintains the same interface as the original function.
+    Stage durations are added to ``timings`` when given.
+    """
     api_key = os.getenv('OPEN_ROUTER_API_KEY')
     
-    questions = interview_session.questions
-    answers = interview_session.answers
-    tech_questions = interview_session.tech_questions or []
-    tech_answers = interview_session.tech_answers or []
     target_job = interview_session.target_job
     keywords = interview_session.keywords
 
     # Combine tech and interview questions/answers with tech at the head
-    all_questions = []
-    all_answers = []
-    
-    # Add tech question/answer at the head if they exist
-    if tech_questions and tech_answers and len(tech_questions) > 0 and len(tech_answers) > 0:
-        all_questions.append(tech_questions[0])
-        all_answers.append(tech_answers[0])
-    
-    # Add interview questions/answers
-    all_questions.extend(questions)
-    all_answers.extend(answers)
+    slots = _answer_slots(interview_session)
+    all_questions = [question for _, _, question, _ in slots]
+    all_answers = [answer for _, _, _, answer in slots]
 
     # Get feedback from multiple agents for all questions
-    all_feedbacks = []
     logger.debug(f"Starting multi-agent feedback for {len(all_questions)} questions")
 
+    # Reuse evaluations already produced while the candidate was answering
+    wait_for_answer_evaluations(interview_session.id)
+    stored = {
+        (row.kind, row.index): row.evaluation
+        for row in interview_session.question_answers.only("kind", "index", "evaluation")
+    }
+
     # For each question, get feedback from 2-3 different agents
-    for i, (question, answer) in enumerate(zip(all_questions, all_answers)):
+    all_feedbacks = [None] * len(slots)
+    pending = []
+    for position, (kind, index, question, answer) in enumerate(slots):
         if not answer.strip():  # Skip empty answers
-            all_feedbacks.append([])
+            all_feedbacks[position] = []
             continue
-            
-        # Select different agents for each question to get diverse perspectives
-        # For tech questions (index 0), use more technical agents
-        if i == 0 and tech_questions:  # First question is tech question
-            reviewing_roles = [InterviewerRole.TECHNICAL_LEAD, InterviewerRole.SENIOR_PEER, InterviewerRole.INDUSTRY_EXPERT]
-        else:
-            reviewing_roles = _select_reviewing_roles(i)
-            
-        agents = [BaseAgent(role, api_key) for role in reviewing_roles]
 
-        # Collect feedback from each agent
-        question_feedback = []
-        with ThreadPoolExecutor(max_workers=len(agents)) as executor:
-            futures = [
-                executor.submit(agent.evaluate_answer_sync, question, answer, target_job, keywords)
-                for agent in agents
-            ]
+        # Reuse only evaluations of this answer by the reviewers of this position
+        roles = _reviewing_roles(kind, position)
+        entry = stored.get((kind, index))
+        if (
+            entry
+            and entry.get("answer_hash") == answer_hash(question, answer)
+            and entry.get("roles") == [role.value for role in roles]
+        ):
+            all_feedbacks[position] = entry["evaluations"]
+            continue
 
-            for future in futures:
-                feedback = future.result()
-                question_feedback.append(feedback)
+        pending.append((position, question, answer, roles))
 
-        all_feedbacks.append(question_feedback)
+    with metrics.timer("evaluations", timings):
+        evaluated = _evaluate_answers(pending, target_job, keywords, api_key)
+    for position, evaluations in evaluated.items():
+        all_feedbacks[position] = evaluations
+    logger.info(
+        f"Feedback for session {interview_session.id}: "
+        f"{len(slots) - len(pending)} answers pre-evaluated, {len(pending)} evaluated now"
+    )
 
     # Synthesize feedback from all agents
-    synthesized_feedback = _synthesize_feedback(all_questions, all_answers, all_feedbacks, target_job, keywords, api_key)
+    with metrics.timer("synthesis", timings):
+        synthesized_feedback = _synthesize_feedback(all_questions, all_answers, all_feedbacks, target_job, keywords, api_key)
 
     # Format to match expected output
     feedback_questions = synthesized_feedback["question_feedback"]
     
     # Determine if we have tech feedback at the head
-    has_tech = tech_questions and tech_answers and len(tech_questions) > 0 and len(tech_answers) > 0
+    has_tech = bool(slots) and slots[0][0] == "tech"
     
     formatted_feedback = {
         "tech_question_feedback": feedback_questions[0] if has_tech and len(feedback_questions) > 0 else "",
@@ -255,6 +401,176 @@ def get_feedback_using_openai_multi_agent(interview_session):
     return formatted_feedback
 
 
+def _evaluate_answers(pending: List[tuple], target_job: str, keywords: List[str], api_key: str) -> Dict[int, List[Dict]]:
+    """
+    Evaluate ``(position, question, answer, roles)`` items as one batch of coroutines
+    on the LLM engine. Returns each position's evaluations in reviewer order.
+
+    With LLM_BATCH_REVIEWS each reviewer scores all of its assigned answers in a
+    single call; otherwise every (answer, reviewer) pair is its own call.
+    """
+    if not pending:
+        return {}
+
+    if not settings.LLM_BATCH_REVIEWS:
+        evaluations = []
+        for _, question, answer, roles in pending:
+            evaluations.extend(
+                BaseAgent(role, api_key).evaluate_answer(question, answer, target_job, keywords)
+                for role in roles
+            )
+        results = llm_engine.gather(*evaluations)
+
+        # Regroup the flat result list into per-question feedback
+        grouped, offset = {}, 0
+        for position, _, _, roles in pending:
+            grouped[position] = results[offset:offset + len(roles)]
+            offset += len(roles)
+        return grouped
+
+    # Batched mode: collect every answer each reviewer is assigned
+    assignments = {}
+    for position, question, answer, roles in pending:
+        for role in roles:
+            assignments.setdefault(role, []).append((position, question, answer))
+
+    roles = list(assignments)
+    results = llm_engine.gather(*(
+        BaseAgent(role, api_key).evaluate_answers(
+            [(question, answer) for _, question, answer in assignments[role]], target_job, keywords
+        )
+        for role in roles
+    ))
+    by_role = {
+        (role, position): evaluation
+        for role, evaluations in zip(roles, results)
+        for (position, _, _), evaluation in zip(assignments[role], evaluations)
+    }
+    logger.info(f"Batched {sum(len(item[3]) for item in pending)} evaluations into {len(roles)} reviewer calls")
+    return {
+        position: [by_role[(role, position)] for role in item_roles]
+        for position, _, _, item_roles in pending
+    }
+
+
+def _answer_slots(interview_session) -> List[tuple]:
+    """
+    Return ``(kind, index, question, answer)`` for every answer in feedback order:
+    the tech question at the head (if answered), then the interview questions.
+    """
+    rows = list(interview_session.question_answers.only("kind", "index", "question", "answer", "answered_at"))
+    tech = [row for row in rows if row.kind == QuestionAnswer.Kind.TECH]
+    interview = [row for row in rows if row.kind == QuestionAnswer.Kind.INTERVIEW]
+    # Interview questions up to the last one answered
+    answered = [row.index for row in interview if row.answered_at]
+    slots = []
+    if tech and tech[0].answered_at:
+        slots.append(("tech", 0, tech[0].question, tech[0].answer))
+    slots.extend(
+        ("interview", row.index, row.question, row.answer) for row in interview if row.index <= max(answered, default=-1)
+    )
+    return slots
+
+
+def _reviewing_roles(kind: str, position: int) -> List[InterviewerRole]:
+    """Select the reviewers for the answer at ``position`` in feedback order"""
+    # For tech questions, use more technical agents
+    if kind == "tech":
+        return [InterviewerRole.TECHNICAL_LEAD, InterviewerRole.SENIOR_PEER, InterviewerRole.INDUSTRY_EXPERT]
+    # Select different agents for each question to get diverse perspectives
+    return _select_reviewing_roles(position)
+
+
+def answer_hash(question: str, answer: str) -> str:
+    """Fingerprint of a question/answer pair, so resubmitted answers are re-evaluated"""
+    return hashlib.sha1(f"{question}\n{answer}".encode("utf-8")).hexdigest()
+
+
+def evaluate_answer_background(session_id, kind: str, index: int):
+    """
+    Background task: run the reviewer agents for one submitted answer and store
+    the results on its QuestionAnswer row so feedback only has to synthesize.
+    """
+    try:
+        interview_session = InterviewSession.objects.only("target_job", "keywords", "tech_questions").get(id=session_id)
+        row = QuestionAnswer.objects.get(session_id=session_id, kind=kind, index=index)
+        # Guess the tech-at-head position the final feedback will use; the roles
+        # are stored with the evaluation, so feedback ignores it if the guess is wrong
+        has_tech = bool(interview_session.tech_questions)
+        position = 0 if kind == "tech" else index + (1 if has_tech else 0)
+        question, answer = row.question, row.answer
+        if not answer.strip():
+            return
+
+        api_key = os.getenv('OPEN_ROUTER_API_KEY')
+        roles = _reviewing_roles(kind, position)
+        agents = [BaseAgent(role, api_key) for role in roles]
+        evaluations = llm_engine.gather(*(
+            agent.evaluate_answer(question, answer, interview_session.target_job, interview_session.keywords)
+            for agent in agents
+        ))
+
+        # Store only if the answer was not resubmitted meanwhile
+        stored = QuestionAnswer.objects.filter(pk=row.pk, answer=answer).update(
+            evaluation={
+                "answer_hash": answer_hash(question, answer),
+                "roles": [role.value for role in roles],
+                "evaluations": evaluations,
+            },
+            evaluated_at=timezone.now(),
+        )
+        if not stored:
+            logger.info(f"Answer {kind} {index} changed during evaluation for session {session_id}")
+            return
+        logger.info(f"Stored incremental evaluation for {kind} answer {index} of session {session_id}")
+    except Exception as e:
+        logger.error(f"Incremental evaluation failed for session {session_id} {kind} {index}: {e}")
+
+
+def store_answer(session_id, kind: str, index: int, question: str, answer: str) -> bool:
+    """
+    Store one answer with a single-row UPDATE on its QuestionAnswer, which also
+    checks that ``question`` is the question at ``index``. The session's
+    answered counter moves in the same transaction when the row goes from
+    blank to answered or back.
+    Returns False if there is no such question.
+    """
+    now = timezone.now()
+    answered_at = now if answer.strip() else None
+    rows = QuestionAnswer.objects.filter(session_id=session_id, kind=kind, index=index, question=question)
+    with transaction.atomic():
+        flipped = rows.filter(answered_at__isnull=answered_at is not None).update(
+            answer=answer, answered_at=answered_at, updated_at=now
+        )
+        if flipped:
+            adjust_answered(session_id, kind, 1 if answered_at else -1)
+            return True
+        return bool(rows.update(answer=answer, answered_at=answered_at, updated_at=now))
+
+
+def answered_count(session_id, kind: str) -> int:
+    """Number of answered questions of one kind in a session."""
+    field = ANSWERED_FIELDS[kind]
+    return InterviewSession.objects.filter(id=session_id).values_list(field, flat=True).first() or 0
+
+
+def enqueue_answer_evaluation(session_id, kind: str, index: int):
+    """Queue the evaluation of a just-submitted answer, ahead of feedback jobs"""
+    enqueue("evaluate_answer", session_id, kind, index, session_id=session_id, priority=1)
+
+
+def wait_for_answer_evaluations(session_id, timeout: float = 60):
+    """
+    Cancel a session's not-yet-started evaluations (feedback will run them itself)
+    and wait for the ones already running on a worker to finish.
+    """
+    evaluations = Job.objects.filter(session_id=session_id, task="evaluate_answer")
+    evaluations.filter(status=Job.Status.QUEUED).delete()
+    deadline = time.monotonic() + timeout
+    while evaluations.filter(status=Job.Status.RUNNING).exists() and time.monotonic() < deadline:
+        time.sleep(0.5)
+
+
 def process_text_answer(session_id: str, question_index: int, question_text: str, answer: str, interview_session) -> Dict[str, Any]:
     """
     Process and save a text answer for an interview question.
@@ -285,18 +601,11 @@ def process_text_answer(session_id: str, question_index: int, question_text: str
                 "status": 400
             }
         
-        # Ensure answers list is properly sized
-        answers = interview_session.answers or []
-        while len(answers) <= question_index:
-            answers.append("")
-        
-        # Update the answer at the specified index
-        answers[question_index] = answer
-        interview_session.answers = answers
-        interview_session.save()
+        if not store_answer(session_id, "interview", question_index, question_text, answer):
+            return {"error": "Interview session not found", "status": 404}
         
         # Calculate progress
-        answered_questions = sum(1 for ans in answers if ans.strip())
+        answered_questions = answered_count(session_id, "interview")
         total_questions = len(interview_session.questions)
         progress = round((answered_questions / total_questions) * 100, 2) if total_questions > 0 else 0
         is_completed = answered_questions == total_questions
@@ -322,9 +631,9 @@ def process_text_answer(session_id: str, question_index: int, question_text: str
         }
 
 
-def _generate_tech_question(tech_agent: BaseAgent, target_job: str, keywords: List[str]) -> Dict[str, Any]:
-    """Generate a technical question using the technical agent"""
-    tech_prompt = f"""{tech_agent.personality}
+def _tech_question_prompt(tech_agent: BaseAgent, target_job: str, keywords: List[str]) -> str:
+    """Build the technical question prompt for the technical agent"""
+    return f"""{tech_agent.personality}
     
     You're interviewing for: {target_job}
     Key technical skills/keywords: {', '.join(keywords)}
@@ -344,50 +653,70 @@ def _generate_tech_question(tech_agent: BaseAgent, target_job: str, keywords: Li
     Make the question specific and technical, not just theoretical.
     Do not include any explanation or markdown, just the JSON.
     """
-    
+
+
+def _parse_tech_question(tech_agent: BaseAgent, response_text: str) -> Dict[str, Any]:
+    """Parse the technical agent's response into question data"""
     try:
-        response = requests.post(
-            "https://openrouter.ai/api/v1/chat/completions",
-            headers={
-                "Authorization": f"Bearer {tech_agent.api_key}",
-                "Content-Type": "application/json",
-            },
-            json={
-                "model": "openai/gpt-4o",
-                "messages": [{"role": "user", "content": tech_prompt}]
-            }
+        # Try to parse directly first
+        question_data = json.loads(response_text.strip())
+    except json.JSONDecodeError:
+        # If direct parsing fails, try to extract JSON from the response
+        json_match = re.search(r'\{[^{}]*\{.*\}[^{}]*\}|\{[^{}]*\}', response_text, re.DOTALL)
+        if json_match:
+            question_data = json.loads(json_match.group())
+        else:
+            raise json.JSONDecodeError("Could not extract JSON from response", response_text, 0)
+
+    return {
+        "question": question_data["question"],
+        "interviewer_role": tech_agent.role.value,
+        "focus_area": question_data.get("focus_area", "Technical"),
+        "difficulty": question_data.get("difficulty", 4)
+    }
+
+
+def _fallback_tech_question(tech_agent: BaseAgent, keywords: List[str], error: Exception) -> Dict[str, Any]:
+    """Fallback technical question used when generation fails"""
+    logger.warning(f"Error generating tech question, using fallback: {error}")
+    tech_keyword = keywords[0] if keywords else "your technical skills"
+    return {
+        "question": f"Can you walk me through how you would approach solving a complex problem using {tech_keyword}? Please provide a specific example.",
+        "interviewer_role": tech_agent.role.value,
+        "focus_area": "Technical Problem Solving",
+        "difficulty": 3,
+        "fallback": True
+    }
+
+
+def _generate_tech_question(tech_agent: BaseAgent, target_job: str, keywords: List[str]) -> Dict[str, Any]:
+    """Generate a technical question using the technical agent"""
+    tech_prompt = _tech_question_prompt(tech_agent, target_job, keywords)
+    try:
+        response_text = llm_client.chat_completion(
+            tech_prompt,
+            api_key=tech_agent.api_key,
+            call_type="tech_question",
+            validate=partial(_parse_tech_question, tech_agent),
         )
-        
-        response_text = response.json()["choices"][0]["message"]["content"]
-        # Clean and parse the response (assuming clean_json_response is available)
-        try:
-            # Try to parse directly first
-            question_data = json.loads(response_text.strip())
-        except json.JSONDecodeError:
-            # If direct parsing fails, try to extract JSON from the response
-            import re
-            json_match = re.search(r'\{[^{}]*\{.*\}[^{}]*\}|\{[^{}]*\}', response_text, re.DOTALL)
-            if json_match:
-                question_data = json.loads(json_match.group())
-            else:
-                raise json.JSONDecodeError("Could not extract JSON from response", response_text, 0)
-        
-        return {
-            "question": question_data["question"],
-            "interviewer_role": tech_agent.role.value,
-            "focus_area": question_data.get("focus_area", "Technical"),
-            "difficulty": question_data.get("difficulty", 4)
-        }
+        return _parse_tech_question(tech_agent, response_text)
     except Exception as e:
-        print(f"Error generating tech question: {e}")
-        # Fallback technical question
-        tech_keyword = keywords[0] if keywords else "your technical skills"
-        return {
-            "question": f"Can you walk me through how you would approach solving a complex problem using {tech_keyword}? Please provide a specific example.",
-            "interviewer_role": tech_agent.role.value,
-            "focus_area": "Technical Problem Solving",
-            "difficulty": 3
-        }
+        return _fallback_tech_question(tech_agent, keywords, e)
+
+
+async def _generate_tech_question_async(tech_agent: BaseAgent, target_job: str, keywords: List[str]) -> Dict[str, Any]:
+    """Async version of _generate_tech_question, run on the LLM engine loop"""
+    tech_prompt = _tech_question_prompt(tech_agent, target_job, keywords)
+    try:
+        response_text = await llm_engine.chat_completion(
+            tech_prompt,
+            api_key=tech_agent.api_key,
+            call_type="tech_question",
+            validate=partial(_parse_tech_question, tech_agent),
+        )
+        return _parse_tech_question(tech_agent, response_text)
+    except Exception as e:
+        return _fallback_tech_question(tech_agent, keywords, e)
 
 
 def _select_agent_roles_for_job(target_job: str, num_agents: int) -> List[InterviewerRole]:
@@ -500,25 +829,15 @@ def _synthesize_feedback(questions: List[str], answers: List[str],
     """
 
     try:
-        response = requests.post(
-            "https://openrouter.ai/api/v1/chat/completions",
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-            },
-            json={
-                "model": "openai/gpt-4o",
-                "messages": [{"role": "user", "content": synthesis_prompt}]
-            }
+        response_text = llm_client.chat_completion(
+            synthesis_prompt, api_key=api_key, call_type="synthesis", validate=json.loads
         )
-
-        response_text = response.json()["choices"][0]["message"]["content"]
         synthesized = json.loads(response_text)
 
         return synthesized
 
     except Exception as e:
-        print(f"Error synthesizing feedback: {e}")
+        logger.warning(f"Error synthesizing feedback, concatenating reviewer feedback instead: {e}")
         # Fallback to simple concatenation
         return {
             "question_feedback": [
@@ -535,21 +854,8 @@ def _synthesize_feedback(questions: List[str], answers: List[str],
 
 
 def get_answers_status(interview_session) -> bool:
-    """ Determine whether all answers have been submitted """
-    # Check tech questions completion
-    tech_answered = len([answer for answer in (interview_session.tech_answers or [])
-                         if answer and answer.strip()])
-    tech_total = len(interview_session.tech_questions or [])
-    tech_completed = tech_answered == tech_total if tech_total > 0 else True
-
-    # Check interview questions completion
-    interview_answered = len([answer for answer in (interview_session.answers or [])
-                              if answer and answer.strip()])
-    interview_total = len(interview_session.questions or [])
-    interview_completed = interview_answered == interview_total if interview_total > 0 else True
-    video_completed = interview_session.videos.count() == 3
-    # Update completion status
-    interview_session.is_completed = (tech_completed and interview_completed) or (tech_completed and video_completed)
-    logger.info(f"Interview session {interview_session.id} completion status updated: {interview_session.is_completed}")
-    interview_session.save()
-    return interview_session.is_completed
\ No newline at end of file
+    """
+    Determine whether all answers have been submitted, from the session's counters.
+    True only for the one call that completes the session, so feedback starts once.
+    """
+    return claim_completion(interview_session.id)
\ No newline at end of file
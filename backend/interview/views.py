@@ -1,12 +1,15 @@
 import os
 import time
 import uuid
-import threading
 import deprecated
 import django
 from django.conf import settings
+from django.db import transaction
+from django.http import JsonResponse, StreamingHttpResponse
 from django.utils import timezone
+from django.views.decorators.http import require_GET
 from jobify_backend.logger import logger
+from jobify_backend.metrics import metrics
 from jobify_backend.settings import MAX_VIDEO_FILE_SIZE
 from rest_framework import status
 from rest_framework.decorators import api_view
@@ -17,8 +20,13 @@ from .models.interview_session import InterviewSession
 from .utils import (
     get_questions_using_openai,
     get_feedback_using_openai_multi_agent,
-    get_answers_status
+    get_answers_status,
+    enqueue_answer_evaluation,
+    store_answer,
+    answered_count,
 )
+from .job_queue import enqueue
+from .session_events import stream_session_events
 
 
 @api_view(["POST"])
@@ -39,7 +47,7 @@ def get_all_questions(request):
         logger.warning("get_all_questions called without id")
         return Response({"error": "id is required"}, status=status.HTTP_400_BAD_REQUEST)
 
-    session = get_session_by_id(session_id)
+    session = get_session_by_id(session_id, only=InterviewSession.STATUS_FIELDS)
     if not session:
         logger.warning(f"All questions requested for non-existent id: {session_id}")
         return Response({"error": "Resume not found"}, status=status.HTTP_404_NOT_FOUND)
@@ -76,6 +84,9 @@ def get_all_questions(request):
             status=status.HTTP_200_OK,
         )
 
+    # Load both question columns in one query; they were deferred for the status checks
+    session.refresh_from_db(fields=["tech_questions", "questions"])
+
     # Get technical questions
     tech_questions = session.tech_questions or []
 
@@ -139,7 +150,7 @@ def submit_tech_answer(request):
         )
 
     # Verify that the resume exists for the given id
-    resume = get_session_by_id(session_id)
+    resume = get_session_by_id(session_id, only=("tech_questions",))
     if not resume:
         logger.warning(f"Tech answer submitted for non-existent id: {session_id}")
         return Response({"error": "Resume not found"}, status=status.HTTP_404_NOT_FOUND)
@@ -167,17 +178,13 @@ def submit_tech_answer(request):
             status=status.HTTP_400_BAD_REQUEST,
         )
 
-    # Ensure tech_answers list is properly sized
-    tech_answers = resume.tech_answers or []
-    while len(tech_answers) <= question_index:
-        tech_answers.append("")
-
-    # Update the answer at the specified index
-    tech_answers[question_index] = tech_answer
-    resume.tech_answers = tech_answers
-    resume.save()
+    if not store_answer(resume.id, "tech", question_index, tech_question, tech_answer):
+        logger.warning(f"Tech answer for id {session_id} no longer matches a stored question")
+        return Response({"error": "Resume not found"}, status=status.HTTP_404_NOT_FOUND)
 
     logger.info(f"Updated tech answer at index {question_index} for id: {session_id}")
+    # Evaluate the answer now so feedback is ready soon after the last submission
+    enqueue_answer_evaluation(resume.id, "tech", question_index)
 
     return Response(
         {
@@ -239,8 +246,8 @@ def submit_interview_answer(request):
             {"error": "answer_type is required"}, status=status.HTTP_400_BAD_REQUEST
         )
 
-    # Find the interview session by id
-    interview_session = InterviewSession.objects.filter(id=session_id).first()
+    # Find the interview session by id; answers are written to their own rows by store_answer
+    interview_session = InterviewSession.objects.filter(id=session_id).only("questions").first()
     if not interview_session:
         logger.warning(f"Interview session not found for id: {session_id}")
         return Response(
@@ -275,18 +282,13 @@ def submit_interview_answer(request):
                 status=status.HTTP_400_BAD_REQUEST,
             )
         
-        # Ensure answers list is properly sized
-        answers = interview_session.answers or []
-        while len(answers) <= question_index:
-            answers.append("")
-        
-        # Update the answer at the specified index
-        answers[question_index] = answer
-        interview_session.answers = answers
-        interview_session.save()
+        if not store_answer(interview_session.id, "interview", question_index, question_text, answer):
+            logger.warning(f"Answer for session {session_id} no longer matches a stored question")
+            return Response({"error": "Interview session not found"}, status=status.HTTP_404_NOT_FOUND)
+        enqueue_answer_evaluation(interview_session.id, "interview", question_index)
         
         # Calculate progress
-        answered_questions = sum(1 for ans in answers if ans.strip())
+        answered_questions = answered_count(interview_session.id, "interview")
         total_questions = len(interview_session.questions)
         progress = round((answered_questions / total_questions) * 100, 2) if total_questions > 0 else 0
         is_completed = answered_questions == total_questions
@@ -325,13 +327,39 @@ def submit_interview_answer(request):
     # Handle the result from utility functions
     if "error" in result:
         return Response({"error": result["error"]}, status=status.HTTP_400_BAD_REQUEST)
-    if get_answers_status(interview_session):
-        threading.Thread(target=generate_feedback_background, args=(interview_session,)).start()
-        logger.info(f"Feedback generation thread started for session {interview_session.id}")
+    # Claim completion and queue feedback together, so a failed enqueue does not
+    # leave the session completed with no feedback on the way
+    with transaction.atomic():
+        if get_answers_status(interview_session):
+            enqueue(
+                "generate_feedback",
+                interview_session.id,
+                session_id=interview_session.id,
+                dedupe_key=f"generate_feedback:{interview_session.id}",
+            )
+            logger.info(f"Feedback generation job queued for session {interview_session.id}")
     # Return the successful result
     return Response(result, status=status.HTTP_200_OK)
 
 
+@require_GET
+async def session_events(request, session_id):
+    """
+    Stream a session's stage transitions and partial results as Server-Sent Events.
+    Replaces polling get-keywords, get-grammar-results, get-all-questions and feedback;
+    see interview/session_events.py for the event format. Async, so an open
+    stream does not hold a worker thread (serve through ASGI, see gunicorn.conf.py).
+    """
+    if not await InterviewSession.objects.filter(id=session_id).aexists():
+        logger.warning(f"Events requested for non-existent id: {session_id}")
+        return JsonResponse({"error": "Resume not found"}, status=status.HTTP_404_NOT_FOUND)
+
+    response = StreamingHttpResponse(stream_session_events(session_id), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"  # Don't let nginx buffer the stream
+    return response
+
+
 @api_view(["POST"])
 def get_feedback(request):
     """
@@ -350,7 +378,8 @@ def get_feedback(request):
         },
         "completed": true,
         "message": "Feedback retrieved successfully",
-        "duration": "5 seconds"
+        "duration": "5 seconds",
+        "stage_timings": {"llamaparse": 4.2, "evaluations": 9.1, "synthesis": 6.8, ...}
     }
     """
     logger.info("=== FEEDBACK REQUEST STARTED ===")
@@ -358,7 +387,9 @@ def get_feedback(request):
     if not session_id:
         logger.warning("get_feedback called without id")
         return Response({"error": "id is required"}, status=status.HTTP_400_BAD_REQUEST)
-    session = get_session_by_id(session_id)
+    session = get_session_by_id(
+        session_id, only=(*InterviewSession.STATUS_FIELDS, "feedback_started", "feedback_completed")
+    )
     if not session:
         logger.warning(
             f"Feedback questions requested for non-existent id: {session_id}"
@@ -369,6 +400,7 @@ def get_feedback(request):
         logger.info(
             f"Fetching feedback for id: {session_id}"
         )
+        session.refresh_from_db(fields=["feedback", "stage_timings"])
         return Response({
                 "id": session_id,
                 "feedbacks": session.feedback,
@@ -377,6 +409,7 @@ def get_feedback(request):
                 "duration": (
                     session.feedback_completed - session.feedback_started
                 ).total_seconds() if session.feedback_started and session.feedback_completed else None,
+                "stage_timings": session.stage_timings,
             },
             status=status.HTTP_200_OK,
         )
@@ -388,7 +421,7 @@ def get_feedback(request):
         return Response(
             {
                 "id": session_id,
-                "feedbacks": session.feedback,
+                "feedbacks": None,  # Written together with COMPLETE; don't load the column while polling
                 "completed": False,
                 "message": "Feedback generation in progress",
                 "duration": (
@@ -420,9 +453,10 @@ def generate_feedback_background(interview_session):
     Background task to generate feedback for an interview session.
     """
     session_id = interview_session.id
-    interview_session.feedback_started_at = timezone.now()
+    timings = {}
+    interview_session.feedback_started = timezone.now()
     interview_session.feedback_status = InterviewSession.Status.PROCESSING
-    interview_session.save()
+    interview_session.save(update_fields=["feedback_started", "feedback_status"])
     answer_type = interview_session.answer_type
 
     match answer_type:
@@ -430,7 +464,7 @@ def generate_feedback_background(interview_session):
             logger.info(
                 f"Retrieving feedback for id: {interview_session.id}, answer_type: {answer_type}"
             )
-            feedback = get_feedback_using_openai_multi_agent(interview_session)
+            feedback = get_feedback_using_openai_multi_agent(interview_session, timings)
             if not feedback:
                 logger.warning(
                     f"No feedback questions generated for session {interview_session.id}"
@@ -445,9 +479,16 @@ def generate_feedback_background(interview_session):
             # feedback = get_feedback_using_openai_video(session)
             # interview_session.feedback = feedback
 
-    interview_session.feedback_completed_at = timezone.now()
+    interview_session.feedback_completed = timezone.now()
     interview_session.feedback_status = InterviewSession.Status.COMPLETE
-    interview_session.save()
+    with metrics.timer("db_save", timings):
+        interview_session.save(update_fields=["feedback", "feedback_completed", "feedback_status"])
+    metrics.observe(
+        "feedback_total",
+        (interview_session.feedback_completed - interview_session.feedback_started).total_seconds(),
+        timings,
+    )
+    InterviewSession.record_stage_timings(session_id, timings)
 
 
 @api_view(["POST"])
@@ -484,7 +525,7 @@ def upload_video(request):
         )
 
     # Verify that the resume exists for the given id
-    resume = get_session_by_id(session_id)
+    resume = get_session_by_id(session_id, only=("tech_questions",))
     if not resume:
         logger.warning(f"Video upload attempted for non-existent id: {session_id}")
         return Response({"error": "Resume not found"}, status=status.HTTP_404_NOT_FOUND)
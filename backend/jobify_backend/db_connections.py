@@ -0,0 +1,101 @@
+"""
+Database connection lifecycle for ORM work outside the request cycle.
+
+Django opens one connection per thread and only closes it at the end of a
+request, so job workers, their lease heartbeats and the resume pipeline's stage
+threads must release their own. Wrap that work in ``managed_connection``:
+
+    from jobify_backend.db_connections import managed_connection
+
+    with managed_connection("job"):
+        run_job(job, worker_id)
+
+or decorate a thread's target with ``@managed``. Stale or broken connections
+are dropped on entry, and the thread's connection is closed on exit, which
+returns it to the pool when ``DB_POOL`` is on (Django's psycopg 3 connection
+pool) instead of tearing down a server connection. Work running inside an
+enclosing transaction (tests, eager calls) keeps its connection.
+
+Saturation is exposed on ``/metrics``:
+
+    jobify_db_managed_connections        managed blocks currently holding a connection
+    jobify_db_pool{stat=...}             psycopg_pool statistics (pool_size,
+                                         pool_available, requests_waiting, ...)
+"""
+
+import functools
+import os
+import threading
+from contextlib import contextmanager
+
+from django.db import close_old_connections, connection
+
+from jobify_backend.logger import logger
+from jobify_backend.metrics import metrics
+
+_lock = threading.Lock()
+_active = {}
+
+
+@contextmanager
+def managed_connection(label: str = "task"):
+    """Run the enclosed ORM work with a fresh connection and release it afterwards."""
+    if not connection.in_atomic_block:
+        close_old_connections()
+    with _lock:
+        _active[label] = _active.get(label, 0) + 1
+    try:
+        yield
+    finally:
+        with _lock:
+            _active[label] -= 1
+        if not connection.in_atomic_block:
+            try:
+                connection.close()
+            except Exception as e:
+                logger.error(f"Failed to release DB connection after {label}: {e}")
+
+
+def managed(func=None, *, label: str = None):
+    """Decorator form of ``managed_connection`` for thread targets and pipeline stages."""
+    if func is None:
+        return functools.partial(managed, label=label)
+
+    @functools.wraps(func)
+    def run(*args, **kwargs):
+        with managed_connection(label or func.__name__):
+            return func(*args, **kwargs)
+
+    return run
+
+
+def pool_stats() -> dict:
+    """Return psycopg_pool statistics for the default database, or {} when not pooled."""
+    try:
+        pool = getattr(connection, "pool", None)
+    except Exception as e:
+        logger.error(f"Failed to read DB pool: {e}")
+        return {}
+    return pool.get_stats() if pool is not None else {}
+
+
+def render_metrics() -> list:
+    """Return the exposition lines for connection usage and pool saturation."""
+    pid = os.getpid()
+    with _lock:
+        active = dict(_active)
+    lines = [
+        "# HELP jobify_db_managed_connections Background blocks currently holding a DB connection.",
+        "# TYPE jobify_db_managed_connections gauge",
+    ]
+    for label, count in sorted(active.items()):
+        lines.append(f'jobify_db_managed_connections{{label="{label}",pid="{pid}"}} {count}')
+    stats = pool_stats()
+    if stats:
+        lines += ["# HELP jobify_db_pool Connection pool statistics.", "# TYPE jobify_db_pool gauge"]
+        for stat, value in sorted(stats.items()):
+            lines.append(f'jobify_db_pool{{stat="{stat}",pid="{pid}"}} {value}')
+    return lines
+
+
+metrics.add_collector(render_metrics)
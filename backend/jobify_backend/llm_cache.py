@@ -0,0 +1,177 @@
+"""
+Content-addressed cache for OpenRouter responses.
+
+Identical prompts recur constantly (demo resumes, retries after a FAILED parse,
+the same job title and keyword set for question generation), so responses are
+cached under a SHA-256 of ``(model, normalized prompt, generation params)``.
+
+Two tiers are consulted in order:
+    1. an in-process LRU (``LLM_CACHE_MAX_ENTRIES`` entries per worker)
+    2. the shared ``"llm"`` Django cache (file-based by default, so every
+       gunicorn worker on a node sees the same entries)
+
+Each call type has its own TTL in ``LLM_CACHE_TTLS``; a TTL of 0 disables
+caching for that call type.
+
+Usage:
+    from jobify_backend.llm_cache import llm_cache
+
+    key = llm_cache.make_key(model, prompt, params)
+    content = llm_cache.get(key, call_type="keywords")
+    llm_cache.set(key, content, call_type="keywords")
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+
+from jobify_backend.logger import logger
+from jobify_backend.metrics import metrics
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Collapse whitespace so indentation changes in prompt templates don't bust the cache."""
+    return re.sub(r"\s+", " ", prompt).strip()
+
+
+class LLMCache:
+    """Singleton two-tier (memory LRU + shared Django cache) response cache."""
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = super(LLMCache, cls).__new__(cls)
+                    cls._instance._memory = OrderedDict()
+                    cls._instance._lock = threading.Lock()
+                    cls._instance._counters = {}
+        return cls._instance
+
+    @staticmethod
+    def make_key(model: str, prompt: str, params: dict = None) -> str:
+        """Return the content address for a completion request."""
+        material = json.dumps(
+            {"model": model, "prompt": normalize_prompt(prompt), "params": params or {}},
+            sort_keys=True,
+        )
+        return "llm:" + hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def ttl_for(call_type: str) -> int:
+        ttls = settings.LLM_CACHE_TTLS
+        return ttls.get(call_type, ttls.get("default", 0))
+
+    @property
+    def shared(self):
+        return caches["llm"]
+
+    def _count(self, call_type: str, outcome: str):
+        with self._lock:
+            counters = self._counters.setdefault(
+                call_type, {"memory_hits": 0, "shared_hits": 0, "misses": 0}
+            )
+            counters[outcome] += 1
+
+    def _remember(self, key: str, value: str, expires_at: float):
+        """Insert into the memory tier, evicting least recently used entries."""
+        with self._lock:
+            self._memory[key] = (expires_at, value)
+            self._memory.move_to_end(key)
+            while len(self._memory) > settings.LLM_CACHE_MAX_ENTRIES:
+                self._memory.popitem(last=False)
+
+    def get(self, key: str, call_type: str = "default"):
+        """Return the cached response for ``key`` or None."""
+        if self.ttl_for(call_type) <= 0:
+            return None
+
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                else:
+                    del self._memory[key]
+                    entry = None
+        if entry is not None:
+            self._count(call_type, "memory_hits")
+            return value
+
+        try:
+            entry = self.shared.get(key)
+        except Exception as e:
+            logger.warning(f"Shared LLM cache read failed: {e}")
+            entry = None
+        if entry is not None:
+            expires_at, value = entry
+            self._remember(key, value, expires_at)
+            self._count(call_type, "shared_hits")
+            return value
+
+        self._count(call_type, "misses")
+        return None
+
+    def set(self, key: str, value: str, call_type: str = "default"):
+        """Store a response in both tiers using the call type's TTL."""
+        ttl = self.ttl_for(call_type)
+        if ttl <= 0 or not value:
+            return
+
+        expires_at = time.time() + ttl
+        self._remember(key, value, expires_at)
+        try:
+            self.shared.set(key, (expires_at, value), timeout=ttl)
+        except Exception as e:
+            logger.warning(f"Shared LLM cache write failed: {e}")
+
+    def clear(self):
+        """Drop the memory tier and counters for this worker."""
+        with self._lock:
+            self._memory.clear()
+            self._counters.clear()
+
+    def stats(self) -> dict:
+        """Report hit/miss counters per call type for this worker."""
+        with self._lock:
+            return {
+                "memory_entries": len(self._memory),
+                "call_types": {name: dict(counts) for name, counts in self._counters.items()},
+            }
+
+
+# Create a singleton instance and expose the cache
+llm_cache = LLMCache()
+
+
+def render_metrics() -> list:
+    """Return the exposition lines for cache lookups by call type and outcome."""
+    stats = llm_cache.stats()
+    pid = os.getpid()
+    lines = [
+        "# HELP jobify_llm_cache_memory_entries Entries in the in-process LLM response cache.",
+        "# TYPE jobify_llm_cache_memory_entries gauge",
+        f'jobify_llm_cache_memory_entries{{pid="{pid}"}} {stats["memory_entries"]}',
+        "# HELP jobify_llm_cache_lookups_total LLM response cache lookups.",
+        "# TYPE jobify_llm_cache_lookups_total counter",
+    ]
+    for call_type, counts in sorted(stats["call_types"].items()):
+        for outcome, count in sorted(counts.items()):
+            lines.append(
+                f'jobify_llm_cache_lookups_total{{call_type="{call_type}",outcome="{outcome}",pid="{pid}"}} {count}'
+            )
+    return lines
+
+
+metrics.add_collector(render_metrics)
@@ -0,0 +1,239 @@
+"""
+Project-wide OpenRouter client for the Jobify backend.
+
+Every LLM call in the project goes through a single pooled ``requests.Session``
+per process, so a gunicorn worker pays the TCP+TLS handshake to openrouter.ai
+once instead of on every call. Headers are set once on the session and every
+request carries explicit connect/read timeouts.
+
+Usage:
+    from jobify_backend.llm_client import llm_client
+
+    content = llm_client.chat_completion(prompt)
+    stats = llm_client.pool_stats()
+"""
+
+import json
+import os
+import re
+import threading
+import time
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+from jobify_backend.llm_cache import llm_cache
+from jobify_backend.llm_guard import llm_guard
+from jobify_backend.logger import logger
+from jobify_backend.metrics import metrics
+
+
+def default_headers() -> dict:
+    """Headers sent with every OpenRouter request."""
+    return {
+        "Authorization": f"Bearer {settings.OPEN_ROUTER_API_KEY}",
+        "Content-Type": "application/json",
+        "HTTP-Referer": "jobify.com",  # Optional. Site URL for rankings on openrouter.ai.
+        "X-Title": "Jobify",  # Optional. Site title for rankings on openrouter.ai.
+    }
+
+
+def build_request(prompt: str, model: str = None, api_key: str = None, **params) -> tuple:
+    """Return the ``(payload, extra_headers)`` pair for a single-message completion."""
+    payload = {
+        "model": model or settings.LLM_MODEL,
+        "messages": [{"role": "user", "content": prompt}],
+        **params,
+    }
+    headers = None
+    if api_key and api_key != settings.OPEN_ROUTER_API_KEY:
+        headers = {"Authorization": f"Bearer {api_key}"}
+    return payload, headers
+
+
+def extract_content(data: dict) -> str:
+    """Pull the message content out of a chat completion response body."""
+    return data["choices"][0]["message"]["content"]
+
+
+def parse_json_array(response_text: str) -> list:
+    """Parse the first JSON array in a response; raises ValueError if there is none."""
+    match = re.search(r"\[.*?\]", response_text, re.DOTALL)
+    if not match:
+        raise ValueError("No JSON array in response")
+    return json.loads(match[0])
+
+
+def cache_if_valid(cache_key: str, content: str, call_type: str, validate=None):
+    """Store ``content`` unless ``validate(content)`` rejects it by raising."""
+    if validate is not None:
+        try:
+            validate(content)
+        except Exception as e:
+            # Let the caller's fallback (or the job queue's retry) make a fresh call
+            logger.warning(f"Not caching unusable {call_type} response: {e}")
+            return
+    llm_cache.set(cache_key, content, call_type=call_type)
+
+
+class LLMClient:
+    """Singleton, fork-aware OpenRouter chat completion client."""
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = super(LLMClient, cls).__new__(cls)
+                    cls._instance._session = None
+                    cls._instance._pid = None
+                    cls._instance._session_lock = threading.Lock()
+                    cls._instance._stats_lock = threading.Lock()
+                    cls._instance._requests = 0
+                    cls._instance._errors = 0
+        return cls._instance
+
+    def _build_session(self) -> requests.Session:
+        """Create a session with a connection pool sized for one worker."""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=settings.LLM_POOL_MAXSIZE,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update(default_headers())
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        Return the pooled session for the current process.
+
+        Sockets must not be shared across a fork, so a gunicorn worker that
+        inherits a session from the master gets a fresh one on first use.
+        """
+        pid = os.getpid()
+        if self._session is None or self._pid != pid:
+            with self._session_lock:
+                if self._session is None or self._pid != pid:
+                    self._session = self._build_session()
+                    self._pid = pid
+                    self._requests = 0
+                    self._errors = 0
+                    logger.info(f"Created pooled LLM session for worker pid {pid}")
+        return self._session
+
+    @property
+    def timeout(self) -> tuple:
+        return settings.LLM_CONNECT_TIMEOUT, settings.LLM_READ_TIMEOUT
+
+    def chat_completion(
+        self,
+        prompt: str,
+        model: str = None,
+        api_key: str = None,
+        call_type: str = "default",
+        validate=None,
+        **params,
+    ) -> str:
+        """
+        Send a single-message chat completion and return the message content.
+
+        Responses are served from and stored in ``llm_cache`` using the TTL
+        configured for ``call_type``. Callers that parse the content pass their
+        parser as ``validate``: a response it raises on is still returned (so
+        the caller's fallback runs) but is not cached, so it is not replayed.
+
+        Requests go through ``llm_guard`` (rate limit, retries, circuit breaker).
+        Raises ``requests.RequestException`` on transport/HTTP errors once
+        retries are exhausted, ``CircuitOpenError`` while the provider circuit
+        is open, and ``KeyError``/``ValueError`` on malformed responses;
+        callers keep their existing fallbacks for all of them.
+        """
+        payload, headers = build_request(prompt, model=model, api_key=api_key, **params)
+        cache_key = llm_cache.make_key(payload["model"], prompt, params)
+        cached = llm_cache.get(cache_key, call_type=call_type)
+        if cached is not None:
+            return cached
+
+        with self._stats_lock:
+            self._requests += 1
+        def send():
+            response = self.session.post(
+                settings.LLM_API_URL, json=payload, headers=headers, timeout=self.timeout
+            )
+            response.raise_for_status()
+            return response
+
+        start = time.perf_counter()
+        try:
+            response = llm_guard.call(send)
+            content = extract_content(response.json())
+        except Exception:
+            with self._stats_lock:
+                self._errors += 1
+            raise
+        finally:
+            metrics.observe_llm(call_type, time.perf_counter() - start)
+        cache_if_valid(cache_key, content, call_type, validate)
+        return content
+
+    def pool_stats(self) -> dict:
+        """Report per-host connection pool usage for this worker."""
+        pools = []
+        if self._session is not None:
+            adapter = self._session.get_adapter(settings.LLM_API_URL)
+            for key in adapter.poolmanager.pools.keys():
+                pool = adapter.poolmanager.pools.get(key)
+                if pool is None:
+                    continue
+                pools.append(
+                    {
+                        "host": f"{pool.scheme}://{pool.host}:{pool.port}",
+                        "connections_created": pool.num_connections,
+                        "requests": pool.num_requests,
+                        # The pool queue is pre-filled with None placeholders
+                        "idle_connections": sum(
+                            1 for conn in list(pool.pool.queue) if conn is not None
+                        ) if pool.pool else 0,
+                        "max_size": settings.LLM_POOL_MAXSIZE,
+                    }
+                )
+        return {
+            "pid": self._pid,
+            "requests": self._requests,
+            "errors": self._errors,
+            "pools": pools,
+        }
+
+
+# Create a singleton instance and expose the client
+llm_client = LLMClient()
+
+
+def render_metrics() -> list:
+    """Return the exposition lines for request counts and connection pool usage."""
+    stats = llm_client.pool_stats()
+    pid = os.getpid()
+    lines = [
+        "# HELP jobify_llm_client_requests_total OpenRouter requests sent by the pooled client.",
+        "# TYPE jobify_llm_client_requests_total counter",
+        f'jobify_llm_client_requests_total{{pid="{pid}"}} {stats["requests"]}',
+        "# HELP jobify_llm_client_errors_total OpenRouter requests that failed.",
+        "# TYPE jobify_llm_client_errors_total counter",
+        f'jobify_llm_client_errors_total{{pid="{pid}"}} {stats["errors"]}',
+    ]
+    if stats["pools"]:
+        lines += ["# HELP jobify_llm_pool OpenRouter connection pool statistics.", "# TYPE jobify_llm_pool gauge"]
+        for pool in stats["pools"]:
+            for stat, value in sorted(pool.items()):
+                if stat != "host":
+                    lines.append(f'jobify_llm_pool{{host="{pool["host"]}",stat="{stat}",pid="{pid}"}} {value}')
+    return lines
+
+
+metrics.add_collector(render_metrics)
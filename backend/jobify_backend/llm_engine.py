@@ -0,0 +1,184 @@
+"""
+Asyncio fan-out engine for OpenRouter calls.
+
+Multi-agent question generation and feedback issue many independent LLM calls
+per session. Instead of spinning up a ThreadPoolExecutor per call (and per
+question), every call runs as a coroutine on one event loop per process, under
+a single global concurrency semaphore, over a shared ``httpx.AsyncClient``.
+HTTP/2 is negotiated through ``h2`` (installed with the ``httpx[http2]``
+dependency); without it the client falls back to HTTP/1.1.
+
+The loop lives in a daemon thread, so synchronous code (views, background
+threads) drives it through a small facade:
+
+Usage:
+    from jobify_backend.llm_engine import llm_engine
+
+    content = llm_engine.run(llm_engine.chat_completion(prompt))
+    results = llm_engine.gather(coro_1, coro_2, coro_3)
+"""
+
+import asyncio
+import importlib.util
+import os
+import threading
+import time
+
+import httpx
+from django.conf import settings
+
+from jobify_backend.llm_cache import llm_cache
+from jobify_backend.llm_client import build_request, cache_if_valid, default_headers, extract_content
+from jobify_backend.llm_guard import llm_guard
+from jobify_backend.logger import logger
+from jobify_backend.metrics import metrics
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class LLMEngine:
+    """Singleton owning the per-process event loop, async client and semaphore."""
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = super(LLMEngine, cls).__new__(cls)
+                    cls._instance._loop = None
+                    cls._instance._client = None
+                    cls._instance._semaphore = None
+                    cls._instance._pid = None
+                    cls._instance._start_lock = threading.Lock()
+        return cls._instance
+
+    def _start(self):
+        """Start the event loop thread for the current process."""
+        loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        def run_loop():
+            asyncio.set_event_loop(loop)
+            ready.set()
+            loop.run_forever()
+
+        threading.Thread(target=run_loop, name="llm-engine", daemon=True).start()
+        ready.wait()
+
+        async def setup():
+            self._semaphore = asyncio.Semaphore(settings.LLM_MAX_CONCURRENCY)
+            self._client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                headers=default_headers(),
+                timeout=httpx.Timeout(
+                    settings.LLM_READ_TIMEOUT, connect=settings.LLM_CONNECT_TIMEOUT
+                ),
+                limits=httpx.Limits(
+                    max_connections=settings.LLM_MAX_CONCURRENCY,
+                    max_keepalive_connections=settings.LLM_MAX_CONCURRENCY,
+                ),
+            )
+
+        asyncio.run_coroutine_threadsafe(setup(), loop).result()
+        self._loop = loop
+        self._pid = os.getpid()
+        logger.info(
+            f"Started LLM engine loop for worker pid {self._pid} "
+            f"(concurrency={settings.LLM_MAX_CONCURRENCY}, http2={HTTP2_AVAILABLE})"
+        )
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Return the running loop for this process, starting it on first use.
+
+        Threads do not survive a fork, so a gunicorn worker starts its own loop.
+        """
+        if self._loop is None or self._pid != os.getpid():
+            with self._start_lock:
+                if self._loop is None or self._pid != os.getpid():
+                    self._start()
+        return self._loop
+
+    async def chat_completion(
+        self,
+        prompt: str,
+        model: str = None,
+        api_key: str = None,
+        call_type: str = "default",
+        validate=None,
+        **params,
+    ) -> str:
+        """Async counterpart of ``LLMClient.chat_completion``, guarded the same way."""
+        payload, headers = build_request(prompt, model=model, api_key=api_key, **params)
+        cache_key = llm_cache.make_key(payload["model"], prompt, params)
+        # The shared tier may hit disk or the database, so keep it off the loop
+        cached = await asyncio.to_thread(llm_cache.get, cache_key, call_type)
+        if cached is not None:
+            return cached
+
+        async def send():
+            async with self._semaphore:
+                response = await self._client.post(settings.LLM_API_URL, json=payload, headers=headers)
+            response.raise_for_status()
+            return response
+
+        start = time.perf_counter()
+        try:
+            response = await llm_guard.acall(send)
+        finally:
+            metrics.observe_llm(call_type, time.perf_counter() - start)
+        content = extract_content(response.json())
+        await asyncio.to_thread(cache_if_valid, cache_key, content, call_type, validate)
+        return content
+
+    def submit(self, coro):
+        """Schedule a coroutine on the engine loop and return a concurrent Future."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro):
+        """Run a coroutine on the engine loop and block until it finishes."""
+        return self.submit(coro).result()
+
+    def gather(self, *coros, return_exceptions: bool = False) -> list:
+        """Run coroutines concurrently on the engine loop and return their results in order."""
+
+        async def gather_all():
+            return await asyncio.gather(*coros, return_exceptions=return_exceptions)
+
+        return self.run(gather_all())
+
+    def stats(self) -> dict:
+        """Report semaphore usage for this worker."""
+        in_flight = 0
+        if self._semaphore is not None:
+            in_flight = settings.LLM_MAX_CONCURRENCY - self._semaphore._value
+        return {
+            "pid": self._pid,
+            "max_concurrency": settings.LLM_MAX_CONCURRENCY,
+            "in_flight": in_flight,
+            "http2": HTTP2_AVAILABLE,
+        }
+
+
+# Create a singleton instance and expose the engine
+llm_engine = LLMEngine()
+
+
+def render_metrics() -> list:
+    """Return the exposition lines for the engine's concurrency limit."""
+    stats = llm_engine.stats()
+    pid = os.getpid()
+    return [
+        "# HELP jobify_llm_engine_in_flight LLM requests currently holding an engine slot.",
+        "# TYPE jobify_llm_engine_in_flight gauge",
+        f'jobify_llm_engine_in_flight{{pid="{pid}"}} {stats["in_flight"]}',
+        "# HELP jobify_llm_engine_max_concurrency Engine slots per worker.",
+        "# TYPE jobify_llm_engine_max_concurrency gauge",
+        f'jobify_llm_engine_max_concurrency{{pid="{pid}"}} {stats["max_concurrency"]}',
+    ]
+
+
+metrics.add_collector(render_metrics)
@@ -0,0 +1,344 @@
+"""
+Rate limiting, retries and circuit breaking for outbound OpenRouter traffic.
+
+Both the pooled ``llm_client`` and the async ``llm_engine`` send every request
+through ``llm_guard``:
+
+    1. a token bucket (``LLM_RATE_LIMIT`` requests/second, ``LLM_RATE_BURST``
+       burst) shared by every thread, and by every gunicorn worker on the node
+       through a ``flock``-guarded state file at ``LLM_RATE_LIMIT_PATH``
+    2. retries with jittered exponential backoff (tenacity) on 429, 5xx and
+       transport errors, honoring the provider's ``Retry-After`` header
+    3. a per-worker circuit breaker that fails fast with ``CircuitOpenError``
+       after ``LLM_BREAKER_THRESHOLD`` consecutive provider failures, and lets a
+       single probe through after ``LLM_BREAKER_RESET_SECONDS``
+
+Callers keep their existing fallbacks: exhausted retries re-raise the last
+error and an open circuit raises ``CircuitOpenError``.
+
+Usage:
+    from jobify_backend.llm_guard import llm_guard
+
+    response = llm_guard.call(lambda: session.post(...))
+    response = await llm_guard.acall(lambda: client.post(...))
+"""
+
+import asyncio
+import fcntl
+import json
+import os
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+import httpx
+import requests
+from django.conf import settings
+from tenacity import (
+    AsyncRetrying,
+    Retrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+from jobify_backend.logger import logger
+from jobify_backend.metrics import metrics
+
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling the provider while the circuit is open."""
+
+
+def _status_code(error: Exception):
+    """HTTP status carried by a requests/httpx error, if any."""
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None)
+
+
+def is_retryable(error: Exception) -> bool:
+    """Whether an error means the provider is throttling us or degraded."""
+    if isinstance(error, (requests.HTTPError, httpx.HTTPStatusError)):
+        return _status_code(error) in RETRYABLE_STATUS_CODES
+    return isinstance(error, (requests.ConnectionError, requests.Timeout, httpx.TransportError))
+
+
+def retry_after(error: Exception):
+    """Seconds the provider asked us to wait, from the ``Retry-After`` header."""
+    response = getattr(error, "response", None)
+    value = response.headers.get("Retry-After") if response is not None else None
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at ``rate`` tokens/second up to ``burst``.
+
+    With a ``path`` the bucket state lives in a file locked with ``flock``, so
+    every process on the node draws from the same bucket.
+    """
+
+    def __init__(self, rate: float, burst: int, path: str = ""):
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self.path = path
+        self._lock = threading.Lock()
+        self._state = {"tokens": float(self.burst), "updated": time.time()}
+
+    def _take(self, state: dict) -> float:
+        """Refill ``state``, take a token if one is available, and return the wait (0 when taken)."""
+        now = time.time()
+        tokens = min(self.burst, state["tokens"] + (now - state["updated"]) * self.rate)
+        state["updated"] = now
+        if tokens >= 1:
+            state["tokens"] = tokens - 1
+            return 0.0
+        state["tokens"] = tokens
+        return (1 - tokens) / self.rate
+
+    def try_acquire(self) -> float:
+        """Take a token without blocking; return 0 on success or the seconds to wait."""
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            if not self.path:
+                return self._take(self._state)
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "a+") as handle:
+                fcntl.flock(handle, fcntl.LOCK_EX)
+                try:
+                    handle.seek(0)
+                    try:
+                        state = json.loads(handle.read())
+                    except ValueError:
+                        state = {"tokens": float(self.burst), "updated": time.time()}
+                    wait = self._take(state)
+                    handle.seek(0)
+                    handle.truncate()
+                    handle.write(json.dumps(state))
+                finally:
+                    fcntl.flock(handle, fcntl.LOCK_UN)
+            return wait
+
+    def acquire(self):
+        """Block the calling thread until a token is available."""
+        while (wait := self.try_acquire()) > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """Wait on the event loop until a token is available."""
+        # try_acquire takes a thread lock and may flock the state file: keep it off the loop
+        while (wait := await asyncio.to_thread(self.try_acquire)) > 0:
+            await asyncio.sleep(wait)
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker (closed -> open -> half-open -> closed)."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, threshold: int, reset_seconds: float):
+        self.threshold = threshold
+        self.reset_seconds = reset_seconds
+        self._lock = threading.Lock()
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.rejected = 0
+
+    def before_call(self) -> bool:
+        """
+        Raise ``CircuitOpenError`` unless a call may go out now.
+        Returns True when the call is the half-open probe, which must be resolved.
+        """
+        if self.threshold <= 0:
+            return False
+        with self._lock:
+            if self.state == self.CLOSED:
+                return False
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_seconds:
+                # Let one probe through; its outcome decides the next state
+                self.state = self.HALF_OPEN
+                return True
+            self.rejected += 1
+        raise CircuitOpenError("LLM provider circuit is open")
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or (self.threshold > 0 and self.failures >= self.threshold):
+                if self.state != self.OPEN:
+                    logger.warning(f"LLM circuit opened after {self.failures} consecutive failures")
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    def release_probe(self):
+        """Reopen without restarting the reset timer, so the next call probes again."""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self.state = self.OPEN
+
+
+class LLMGuard:
+    """Singleton combining the shared rate limiter, retry policy and circuit breaker."""
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = super(LLMGuard, cls).__new__(cls)
+                    cls._instance._bucket = None
+                    cls._instance._breaker = None
+                    cls._instance._stats_lock = threading.Lock()
+                    cls._instance._retries = 0
+        return cls._instance
+
+    @property
+    def bucket(self) -> TokenBucket:
+        if self._bucket is None:
+            self._bucket = TokenBucket(
+                settings.LLM_RATE_LIMIT, settings.LLM_RATE_BURST, settings.LLM_RATE_LIMIT_PATH
+            )
+        return self._bucket
+
+    @property
+    def breaker(self) -> CircuitBreaker:
+        if self._breaker is None:
+            self._breaker = CircuitBreaker(settings.LLM_BREAKER_THRESHOLD, settings.LLM_BREAKER_RESET_SECONDS)
+        return self._breaker
+
+    def reset(self):
+        """Drop the limiter and breaker so they are rebuilt from current settings."""
+        self._bucket = None
+        self._breaker = None
+        self._retries = 0
+
+    def _wait(self, retry_state) -> float:
+        """Honor Retry-After when the provider sends it, else jittered exponential backoff."""
+        error = retry_state.outcome.exception()
+        delay = retry_after(error) if error is not None else None
+        if delay is None:
+            delay = wait_random_exponential(
+                multiplier=settings.LLM_RETRY_BASE_SECONDS, max=settings.LLM_RETRY_MAX_SECONDS
+            )(retry_state)
+        return min(delay, settings.LLM_RETRY_MAX_SECONDS)
+
+    def _before_sleep(self, retry_state):
+        with self._stats_lock:
+            self._retries += 1
+        logger.warning(
+            f"LLM call attempt {retry_state.attempt_number} failed "
+            f"({retry_state.outcome.exception()}); retrying"
+        )
+
+    def _retry_kwargs(self) -> dict:
+        return {
+            "retry": retry_if_exception(is_retryable),
+            "stop": stop_after_attempt(settings.LLM_RETRY_ATTEMPTS),
+            "wait": self._wait,
+            "before_sleep": self._before_sleep,
+            "reraise": True,
+        }
+
+    def _record(self, error: BaseException = None, probe: bool = False):
+        """Update the breaker with the outcome of one call; a probe always leaves HALF_OPEN."""
+        if error is not None and is_retryable(error):
+            self.breaker.record_failure()
+        elif error is None or isinstance(error, Exception):
+            # The provider answered, even if with a client error or a body we could not use
+            self.breaker.record_success()
+        elif probe:
+            # Cancelled (or interrupted) before the provider answered
+            self.breaker.release_probe()
+
+    def call(self, send):
+        """Run ``send()`` (which returns a checked response) under the limiter, retries and breaker."""
+        for attempt in Retrying(**self._retry_kwargs()):
+            with attempt:
+                probe = self.breaker.before_call()
+                outcome = None
+                try:
+                    self.bucket.acquire()
+                    response = send()
+                except BaseException as e:
+                    outcome = e
+                    raise
+                finally:
+                    self._record(outcome, probe)
+        return response
+
+    async def acall(self, send):
+        """Async counterpart of ``call``; ``send()`` returns an awaitable."""
+        async for attempt in AsyncRetrying(**self._retry_kwargs()):
+            with attempt:
+                probe = self.breaker.before_call()
+                outcome = None
+                try:
+                    await self.bucket.acquire_async()
+                    response = await send()
+                except BaseException as e:
+                    outcome = e
+                    raise
+                finally:
+                    self._record(outcome, probe)
+        return response
+
+    def stats(self) -> dict:
+        """Report limiter and breaker state for this worker."""
+        return {
+            "rate_limit": settings.LLM_RATE_LIMIT,
+            "retries": self._retries,
+            "circuit": self.breaker.state,
+            "consecutive_failures": self.breaker.failures,
+            "rejected": self.breaker.rejected,
+        }
+
+
+# Create a singleton instance and expose the guard
+llm_guard = LLMGuard()
+
+
+def render_metrics() -> list:
+    """Return the exposition lines for retries and the circuit breaker."""
+    stats = llm_guard.stats()
+    pid = os.getpid()
+    lines = [
+        "# HELP jobify_llm_retries_total LLM requests retried after a retryable error.",
+        "# TYPE jobify_llm_retries_total counter",
+        f'jobify_llm_retries_total{{pid="{pid}"}} {stats["retries"]}',
+        "# HELP jobify_llm_breaker_rejected_total LLM requests rejected by the open circuit breaker.",
+        "# TYPE jobify_llm_breaker_rejected_total counter",
+        f'jobify_llm_breaker_rejected_total{{pid="{pid}"}} {stats["rejected"]}',
+        "# HELP jobify_llm_breaker_consecutive_failures Consecutive failed LLM requests.",
+        "# TYPE jobify_llm_breaker_consecutive_failures gauge",
+        f'jobify_llm_breaker_consecutive_failures{{pid="{pid}"}} {stats["consecutive_failures"]}',
+        "# HELP jobify_llm_breaker_state Circuit breaker state (1 for the current one).",
+        "# TYPE jobify_llm_breaker_state gauge",
+    ]
+    for state in (CircuitBreaker.CLOSED, CircuitBreaker.OPEN, CircuitBreaker.HALF_OPEN):
+        lines.append(f'jobify_llm_breaker_state{{state="{state}",pid="{pid}"}} {int(stats["circuit"] == state)}')
+    return lines
+
+
+metrics.add_collector(render_metrics)
@@ -0,0 +1,146 @@
+"""
+Latency instrumentation for the Jobify backend.
+
+Two histograms are kept per worker process and exposed in the Prometheus text
+format on ``/metrics``:
+
+    jobify_stage_duration_seconds{stage=...}
+        wall-clock time of pipeline stages (local_pdf, llamaparse, keywords, grammar,
+        questions, evaluations, synthesis, db_save)
+    jobify_llm_request_duration_seconds{call_type=...}
+        every OpenRouter request that missed the cache, by call type
+
+Stage timers can also collect into a ``timings`` dict, which callers store on
+the session (``InterviewSession.stage_timings``) as a per-session breakdown.
+
+Other modules add gauges and counters with ``metrics.add_collector``:
+database connection usage (jobify_backend/db_connections.py), and the LLM
+client pool, response cache, guard and engine (jobify_backend/llm_*.py).
+
+Each gunicorn worker reports its own series (labelled with ``pid``), so
+Prometheus should aggregate with ``sum without (pid)``.
+
+Usage:
+    from jobify_backend.metrics import metrics
+
+    timings = {}
+    with metrics.timer("llamaparse", timings):
+        text = parse(...)
+    metrics.observe_llm("evaluation", 1.7)
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# Upper bounds in seconds; LLM calls and LlamaParse routinely take tens of seconds
+DEFAULT_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120, 300)
+
+
+class Histogram:
+    """Cumulative-bucket histogram with a single label."""
+
+    def __init__(self, name: str, help_text: str, label: str, buckets: tuple = DEFAULT_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.label = label
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._series = {}
+
+    def observe(self, label_value: str, seconds: float):
+        with self._lock:
+            series = self._series.setdefault(
+                label_value, {"buckets": [0] * len(self.buckets), "sum": 0.0, "count": 0}
+            )
+            for index, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    series["buckets"][index] += 1
+            series["sum"] += seconds
+            series["count"] += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                label_value: {"buckets": list(series["buckets"]), "sum": series["sum"], "count": series["count"]}
+                for label_value, series in self._series.items()
+            }
+
+    def render(self, pid: int) -> list:
+        """Return the exposition lines for this histogram."""
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for label_value, series in sorted(self.snapshot().items()):
+            labels = f'{self.label}="{label_value}",pid="{pid}"'
+            for bound, count in zip(self.buckets, series["buckets"]):
+                lines.append(f'{self.name}_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f'{self.name}_bucket{{{labels},le="+Inf"}} {series["count"]}')
+            lines.append(f"{self.name}_sum{{{labels}}} {series['sum']:.6f}")
+            lines.append(f"{self.name}_count{{{labels}}} {series['count']}")
+        return lines
+
+    def reset(self):
+        with self._lock:
+            self._series = {}
+
+
+class Metrics:
+    """Singleton registry for the stage and LLM request histograms."""
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = super(Metrics, cls).__new__(cls)
+                    cls._instance.stages = Histogram(
+                        "jobify_stage_duration_seconds", "Duration of pipeline stages.", "stage"
+                    )
+                    cls._instance.llm_requests = Histogram(
+                        "jobify_llm_request_duration_seconds",
+                        "Duration of OpenRouter requests that missed the cache.",
+                        "call_type",
+                    )
+                    cls._instance.collectors = []
+        return cls._instance
+
+    def observe(self, stage: str, seconds: float, timings: dict = None):
+        """Record a stage duration, adding it to ``timings`` when given."""
+        self.stages.observe(stage, seconds)
+        if timings is not None:
+            timings[stage] = round(timings.get(stage, 0) + seconds, 3)
+
+    def observe_llm(self, call_type: str, seconds: float):
+        self.llm_requests.observe(call_type, seconds)
+
+    @contextmanager
+    def timer(self, stage: str, timings: dict = None):
+        """Time the enclosed block as ``stage``; failed attempts are recorded too."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start, timings)
+
+    def add_collector(self, collector):
+        """Register a callable returning extra exposition lines (e.g. gauges) for ``render``."""
+        if collector not in self.collectors:
+            self.collectors.append(collector)
+
+    def render(self) -> str:
+        """Render every histogram and collector in the Prometheus text exposition format."""
+        pid = os.getpid()
+        lines = self.stages.render(pid) + self.llm_requests.render(pid)
+        for collector in self.collectors:
+            lines += collector()
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        self.stages.reset()
+        self.llm_requests.reset()
+
+
+# Create a singleton instance and expose the registry
+metrics = Metrics()
@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
 import os
+import sys
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -18,6 +19,9 @@ from dotenv import load_dotenv
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+# Test runs (pytest or manage.py test) keep caches in memory instead of writing under BASE_DIR / "cache"
+TESTING = "pytest" in sys.modules or sys.argv[1:2] == ["test"]
+
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/5.2/howto/deployment/checklist/
 
@@ -86,6 +90,23 @@ if DB_ENGINE == "django.db.backends.sqlite3":
             "NAME": BASE_DIR / "db.sqlite3",
         }
     }
+    if os.getenv("SQLITE_PROFILE", default="concurrent") == "concurrent":
+        # Single-node profile: WAL so readers never block the writer, and one
+        # writer at a time per process (see jobify_backend/sqlite3/base.py)
+        DATABASES["default"]["ENGINE"] = "jobify_backend.sqlite3"
+        DATABASES["default"]["OPTIONS"] = {
+            "init_command": ";".join(
+                [
+                    "PRAGMA journal_mode=WAL",
+                    "PRAGMA synchronous=NORMAL",  # durable with WAL except across power loss
+                    f"PRAGMA mmap_size={int(os.getenv('SQLITE_MMAP_SIZE', default=256 * 1024 * 1024))}",
+                    f"PRAGMA cache_size=-{int(os.getenv('SQLITE_CACHE_KB', default=64 * 1024))}",  # KiB
+                    "PRAGMA temp_store=MEMORY",
+                ]
+            ),
+            "timeout": float(os.getenv("SQLITE_BUSY_TIMEOUT", default=20)),  # seconds, sets busy_timeout
+            "transaction_mode": "IMMEDIATE",
+        }
 else:
     # Use PostgreSQL or another DB from .env
     DATABASES = {
@@ -96,8 +117,23 @@ else:
             "PASSWORD": os.getenv("DB_PASSWORD"),
             "HOST": os.getenv("DB_HOST"),
             "PORT": os.getenv("DB_PORT"),
+            # Drop connections the server closed instead of failing the next query
+            "CONN_HEALTH_CHECKS": True,
         }
     }
+    if os.getenv("DB_POOL", default="False") == "True":
+        # Django's psycopg 3 connection pool; background work returns connections to it
+        # (see jobify_backend/db_connections.py). Size max_size for web threads plus
+        # job workers, their heartbeats and two stage threads per running parse.
+        DATABASES["default"]["OPTIONS"] = {
+            "pool": {
+                "min_size": int(os.getenv("DB_POOL_MIN_SIZE", default=2)),
+                "max_size": int(os.getenv("DB_POOL_MAX_SIZE", default=20)),
+                "timeout": float(os.getenv("DB_POOL_TIMEOUT", default=10)),  # seconds to wait for a connection
+            }
+        }
+    else:
+        DATABASES["default"]["CONN_MAX_AGE"] = int(os.getenv("DB_CONN_MAX_AGE", default=0))
 # print(f"Using database engine: {DB_ENGINE}")
 
 # Password validation
@@ -143,6 +179,134 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 LLAMA_API_KEY = os.getenv("LLAMA_PARSE_API_KEY")
 LLAMA_API_URL = "https://api.cloud.llamaindex.ai/api/v1/parsing/upload"
 
+# Local PDF text extraction, tried before LlamaParse (see resume/utils.py)
+LOCAL_PDF_EXTRACTION = os.getenv("LOCAL_PDF_EXTRACTION", default="True") == "True"
+LOCAL_PDF_MIN_CHARS = int(os.getenv("LOCAL_PDF_MIN_CHARS", default=300))  # less text suggests a scanned resume
+LOCAL_PDF_MIN_LETTER_RATIO = 0.6  # share of letters among non-space characters
+LOCAL_PDF_MAX_LONG_WORD_RATIO = 0.05  # share of 25+ character "words" (missing spaces, broken layout)
+
+# Grammar check against a LanguageTool-compatible server, e.g. a self-hosted one (see resume/grammar.py)
+GRAMMAR_CHECK_URL = os.getenv("GRAMMAR_CHECK_URL", default="https://api.languagetool.org/v2/check")
+GRAMMAR_CHECK_LANGUAGE = os.getenv("GRAMMAR_CHECK_LANGUAGE", default="en-US")
+GRAMMAR_CHECK_CONNECT_TIMEOUT = float(os.getenv("GRAMMAR_CHECK_CONNECT_TIMEOUT", default=3))  # seconds
+GRAMMAR_CHECK_READ_TIMEOUT = float(os.getenv("GRAMMAR_CHECK_READ_TIMEOUT", default=15))  # seconds
+GRAMMAR_CHECK_MAX_CHARS = int(os.getenv("GRAMMAR_CHECK_MAX_CHARS", default=18000))  # per request; the public API takes 20KB
+GRAMMAR_CHECK_CONCURRENCY = int(os.getenv("GRAMMAR_CHECK_CONCURRENCY", default=4))  # requests in flight
+GRAMMAR_CACHE_TTL = 90 * 24 * 60 * 60  # seconds; per-sentence results
+GRAMMAR_MAX_REPLACEMENTS = 3  # suggestions kept per match
+GRAMMAR_PAGE_SIZE = 50  # get-grammar-results default page size
+GRAMMAR_MAX_PAGE_SIZE = 200
+
+# Keyword extraction: skills taxonomy first (see resume/skills.py), the LLM as an optional tier
+KEYWORD_LIMIT = 10
+LOCAL_KEYWORDS = os.getenv("LOCAL_KEYWORDS", default="True") == "True"
+LOCAL_KEYWORDS_MIN_MATCHES = int(os.getenv("LOCAL_KEYWORDS_MIN_MATCHES", default=5))  # fewer go to the LLM
+KEYWORDS_LLM_REFINEMENT = os.getenv("KEYWORDS_LLM_REFINEMENT", default="False") == "True"  # LLM refines every list
+
+# OpenRouter LLM client (see jobify_backend/llm_client.py)
+OPEN_ROUTER_API_KEY = os.getenv("OPEN_ROUTER_API_KEY")
+LLM_API_URL = "https://openrouter.ai/api/v1/chat/completions"
+LLM_MODEL = os.getenv("LLM_MODEL", default="openai/gpt-4o")
+LLM_CONNECT_TIMEOUT = float(os.getenv("LLM_CONNECT_TIMEOUT", default=5))  # seconds
+LLM_READ_TIMEOUT = float(os.getenv("LLM_READ_TIMEOUT", default=90))  # seconds
+LLM_POOL_MAXSIZE = int(os.getenv("LLM_POOL_MAXSIZE", default=20))  # per worker
+# Async fan-out engine (see jobify_backend/llm_engine.py), HTTP/2 through httpx[http2]
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", default=16))  # per worker
+# Score all answers assigned to a reviewer in one call instead of one call per answer
+LLM_BATCH_REVIEWS = os.getenv("LLM_BATCH_REVIEWS", default="False") == "True"
+# Outbound LLM traffic guard (see jobify_backend/llm_guard.py)
+LLM_RATE_LIMIT = float(os.getenv("LLM_RATE_LIMIT", default=5))  # requests/second per node, 0 disables
+LLM_RATE_BURST = int(os.getenv("LLM_RATE_BURST", default=10))
+# Bucket state file shared by all workers on the node; empty keeps the bucket per worker
+LLM_RATE_LIMIT_PATH = os.getenv(
+    "LLM_RATE_LIMIT_PATH", default="" if TESTING else str(BASE_DIR / "cache" / "llm_rate_limit.json")
+)
+LLM_RETRY_ATTEMPTS = int(os.getenv("LLM_RETRY_ATTEMPTS", default=4))
+LLM_RETRY_BASE_SECONDS = float(os.getenv("LLM_RETRY_BASE_SECONDS", default=0.5))
+LLM_RETRY_MAX_SECONDS = float(os.getenv("LLM_RETRY_MAX_SECONDS", default=20))
+LLM_BREAKER_THRESHOLD = int(os.getenv("LLM_BREAKER_THRESHOLD", default=8))  # consecutive failures, 0 disables
+LLM_BREAKER_RESET_SECONDS = float(os.getenv("LLM_BREAKER_RESET_SECONDS", default=30))
+# LLM response cache (see jobify_backend/llm_cache.py); TTLs in seconds, 0 disables
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", default=1000))  # per worker
+LLM_CACHE_TTLS = {
+    "default": 0,
+    "keywords": 30 * 24 * 60 * 60,
+    "questions": 24 * 60 * 60,
+    "question": 24 * 60 * 60,
+    "tech_question": 24 * 60 * 60,
+    "evaluation": 7 * 24 * 60 * 60,
+    "synthesis": 7 * 24 * 60 * 60,
+    "feedback": 7 * 24 * 60 * 60,
+    "titles": 30 * 24 * 60 * 60,
+}
+
+# Question bank (see interview/question_bank.py)
+QUESTION_BANK_ENABLED = os.getenv("QUESTION_BANK_ENABLED", default="True") == "True"
+QUESTION_BANK_REUSE_RATIO = float(os.getenv("QUESTION_BANK_REUSE_RATIO", default=0.8))
+QUESTION_BANK_MIN_SIMILARITY = float(os.getenv("QUESTION_BANK_MIN_SIMILARITY", default=0.5))
+QUESTION_BANK_MAX_AGE_DAYS = int(os.getenv("QUESTION_BANK_MAX_AGE_DAYS", default=90))
+QUESTION_BANK_MAX_SERVES = int(os.getenv("QUESTION_BANK_MAX_SERVES", default=50))
+QUESTION_BANK_CANDIDATE_LIMIT = 500  # rows scored per lookup
+# Likely target titles to pre-generate questions for once keywords are known, 0 disables
+SPECULATIVE_QUESTION_TITLES = int(os.getenv("SPECULATIVE_QUESTION_TITLES", default=2))
+
+# Background job queue (see interview/job_queue.py); run workers with `manage.py run_workers`
+JOB_QUEUE_EMBEDDED_WORKERS = int(os.getenv("JOB_QUEUE_EMBEDDED_WORKERS", default=0))  # worker threads per web process, e.g. 2 for a lone runserver
+JOB_LEASE_SECONDS = int(os.getenv("JOB_LEASE_SECONDS", default=300))
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", default=3))
+JOB_RETRY_BASE_SECONDS = float(os.getenv("JOB_RETRY_BASE_SECONDS", default=15))
+JOB_POLL_INTERVAL = float(os.getenv("JOB_POLL_INTERVAL", default=1))  # seconds
+
+# Session event streams (see interview/session_events.py)
+SESSION_EVENTS_POLL_SECONDS = float(os.getenv("SESSION_EVENTS_POLL_SECONDS", default=15))  # re-read when not notified
+SESSION_EVENTS_MAX_SECONDS = float(os.getenv("SESSION_EVENTS_MAX_SECONDS", default=300))  # clients reconnect after
+SESSION_EVENTS_RETRY_MS = 2000  # EventSource reconnect delay
+
+# Session status cache (see interview/session_cache.py); bounds staleness if an invalidation is missed, 0 disables
+SESSION_CACHE_TTL = int(os.getenv("SESSION_CACHE_TTL", default=120))
+
+# Caches
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "llm": {
+        "BACKEND": os.getenv(
+            "LLM_CACHE_BACKEND",
+            default="django.core.cache.backends.filebased.FileBasedCache",
+        ),
+        "LOCATION": os.getenv("LLM_CACHE_LOCATION", default=str(BASE_DIR / "cache" / "llm")),
+        "TIMEOUT": None,
+        "OPTIONS": {"MAX_ENTRIES": 20000},
+    },
+    # Per-sentence entries are written dozens at a time, and FileBasedCache lists its whole
+    # directory on every set: keep them in a bounded in-process LRU, or share them across
+    # workers with django.core.cache.backends.redis.RedisCache and a redis:// location
+    "grammar": {
+        "BACKEND": os.getenv(
+            "GRAMMAR_CACHE_BACKEND",
+            default="django.core.cache.backends.locmem.LocMemCache",
+        ),
+        "LOCATION": os.getenv("GRAMMAR_CACHE_LOCATION", default="grammar"),
+        "TIMEOUT": None,
+        "OPTIONS": {"MAX_ENTRIES": int(os.getenv("GRAMMAR_CACHE_MAX_ENTRIES", default=20000))},
+    },
+    # Must be shared by web and worker processes: file-based on one node,
+    # django.core.cache.backends.redis.RedisCache with a redis:// location across nodes
+    "sessions": {
+        "BACKEND": os.getenv(
+            "SESSION_CACHE_BACKEND",
+            default="django.core.cache.backends.filebased.FileBasedCache",
+        ),
+        "LOCATION": os.getenv("SESSION_CACHE_LOCATION", default=str(BASE_DIR / "cache" / "sessions")),
+        "OPTIONS": {"MAX_ENTRIES": 10000},
+    },
+}
+if TESTING:
+    for alias in ("llm", "sessions"):
+        CACHES[alias] = {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": alias}
+
 FILE_UPLOAD_MAX_MEMORY_SIZE = 5 * 1024 * 1024  # 5 MB
 DATA_UPLOAD_MAX_MEMORY_SIZE = 5 * 1024 * 1024  # 5 MB
 
@@ -0,0 +1,144 @@
+"""
+SQLite backend with a single writer per process.
+
+SQLite allows one writer at a time. With WAL, readers never block, but two
+threads that both write (the resume pipeline, question generation, feedback
+and the job queue all do) collide: an autocommit write waits at most the busy
+timeout, and a deferred transaction that read first and then tries to write
+fails with "database is locked" straight away, whatever the timeout.
+
+This backend (``ENGINE: "jobify_backend.sqlite3"``) queues every write in the
+process behind one lock:
+
+    - a transaction (``transaction.atomic``) takes the lock at ``BEGIN`` and
+      releases it at commit or rollback; with ``transaction_mode: IMMEDIATE``
+      it also reserves the database up front, so it can never deadlock on the
+      upgrade from reader to writer
+    - an ``INSERT``/``UPDATE``/``DELETE`` outside a transaction takes the lock
+      for that statement only
+
+Reads never take the lock. Writers in other processes (``run_workers``) are
+still arbitrated by SQLite's busy timeout (``OPTIONS["timeout"]``), which also
+bounds how long a writer waits for the lock here before failing with the
+usual "database is locked" error.
+
+In-memory databases (the test database) are left alone: a test holds its
+transaction open for the whole test case.
+"""
+
+import os
+import threading
+
+from django.db.backends.sqlite3 import base
+from django.db.utils import OperationalError
+
+_WRITE_STATEMENTS = ("INSERT", "UPDATE", "DELETE", "REPLACE")
+
+_writer_lock = threading.Lock()
+
+
+def _reset_writer_lock():
+    # A fork can copy the lock while another thread holds it
+    global _writer_lock
+    _writer_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_writer_lock)
+
+
+def _is_write(query: str) -> bool:
+    return query.lstrip()[:7].upper().startswith(_WRITE_STATEMENTS)
+
+
+class SerializedCursorWrapper(base.SQLiteCursorWrapper):
+    """Cursor that queues autocommit writes behind the process's writer lock."""
+
+    def __init__(self, connection, db):
+        super().__init__(connection)
+        self.db = db
+
+    def execute(self, query, params=None):
+        if self.db.holds_writer_lock or not _is_write(query):
+            return super().execute(query, params)
+        with self.db.writer_lock():
+            return super().execute(query, params)
+
+    def executemany(self, query, param_list):
+        if self.db.holds_writer_lock or not _is_write(query):
+            return super().executemany(query, param_list)
+        with self.db.writer_lock():
+            return super().executemany(query, param_list)
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.holds_writer_lock = False
+
+    @property
+    def serializes_writes(self) -> bool:
+        return self.settings_dict["OPTIONS"].get("serialize_writes", True) and not self.is_in_memory_db()
+
+    def get_connection_params(self):
+        params = super().get_connection_params()
+        params.pop("serialize_writes", None)
+        return params
+
+    def _acquire_writer_lock(self):
+        if self.holds_writer_lock or not self.serializes_writes:
+            return
+        timeout = self.settings_dict["OPTIONS"].get("timeout", 5)
+        if not _writer_lock.acquire(timeout=timeout):
+            raise OperationalError(f"database is locked (waited {timeout}s for the writer lock)")
+        self.holds_writer_lock = True
+
+    def _release_writer_lock(self):
+        if self.holds_writer_lock:
+            self.holds_writer_lock = False
+            _writer_lock.release()
+
+    def writer_lock(self):
+        """Context manager holding the writer lock for one autocommit statement."""
+        return _WriterLock(self)
+
+    def create_cursor(self, name=None):
+        if not self.serializes_writes:
+            return super().create_cursor(name)
+        return self.connection.cursor(factory=lambda connection: SerializedCursorWrapper(connection, self))
+
+    def _start_transaction_under_autocommit(self):
+        self._acquire_writer_lock()
+        try:
+            super()._start_transaction_under_autocommit()
+        except Exception:
+            self._release_writer_lock()
+            raise
+
+    def _commit(self):
+        try:
+            return super()._commit()
+        finally:
+            self._release_writer_lock()
+
+    def _rollback(self):
+        try:
+            return super()._rollback()
+        finally:
+            self._release_writer_lock()
+
+    def _close(self):
+        try:
+            return super()._close()
+        finally:
+            self._release_writer_lock()
+
+
+class _WriterLock:
+    def __init__(self, db):
+        self.db = db
+
+    def __enter__(self):
+        self.db._acquire_writer_lock()
+
+    def __exit__(self, *exc_info):
+        self.db._release_writer_lock()
@@ -18,8 +18,11 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import include, path
 
+from jobify_backend.views import prometheus_metrics
+
 urlpatterns = [
     path("admin/", admin.site.urls),
+    path("metrics", prometheus_metrics, name="metrics"),
     path("api/v1/", include("accounts.urls")),
     path("api/v1/", include("resume.urls")),
     path("api/v1/", include("interview.urls")),
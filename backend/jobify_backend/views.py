@@ -0,0 +1,10 @@
+from django.http import HttpResponse
+from django.views.decorators.http import require_GET
+
+from jobify_backend.metrics import metrics
+
+
+@require_GET
+def prometheus_metrics(request):
+    """Expose stage and LLM request latency histograms for Prometheus to scrape."""
+    return HttpResponse(metrics.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
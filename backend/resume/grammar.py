@@ -0,0 +1,289 @@
+"""
+Sentence-level grammar checking against a LanguageTool-compatible server.
+
+``GRAMMAR_CHECK_URL`` points at the public api.languagetool.org by default, or
+at a self-hosted LanguageTool server (``docker run -p 8010:8010
+erikvl87/languagetool`` then ``GRAMMAR_CHECK_URL=http://localhost:8010/v2/check``).
+
+A resume is split into sentences (and lines, since bullets rarely end with a
+period), and matches are cached per sentence under a SHA-256 of
+``(language, sentence)`` in the ``"grammar"`` Django cache. Resume boilerplate
+repeats heavily, so re-checks mostly hit the cache. The distinct uncached
+sentences are joined into as few requests as ``GRAMMAR_CHECK_MAX_CHARS``
+allows (one for a typical resume, which keeps the public endpoint's ~20
+requests/minute limit out of reach), and each match is mapped back to its
+sentence by offset. Match offsets are then shifted back onto the full text.
+
+LanguageTool's verbose payload (software, warnings, language detection, full
+rule and context objects) is dropped: results are stored compactly as
+
+    {"language": "en-US", "matches": [{"offset", "length", "rule", "category",
+        "message", "short_message", "replacements", "context", "context_offset"}]}
+
+and ``expand_match`` turns an entry back into the LanguageTool-style shape the
+``get-grammar-results`` API returns.
+
+Usage:
+    from resume.grammar import grammar_check
+
+    grammar_results = grammar_check(parsed_text)
+"""
+
+import hashlib
+import os
+import re
+import threading
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import requests
+from django.conf import settings
+from django.core.cache import caches
+from requests.adapters import HTTPAdapter
+
+from jobify_backend.logger import logger
+from jobify_backend.metrics import metrics
+
+CACHE_VERSION = 2  # bump when the cached match format changes
+
+# A sentence ends at . ! or ? followed by whitespace, or at a line break
+_SENTENCE = re.compile(r"[^\n.!?]*(?:[.!?]+(?=\s|$)|[^\n]*?(?=\n|$))")
+
+# Sentences of one request are separated as paragraphs
+_SEPARATOR = "\n\n"
+
+
+def compact_match(match: dict) -> dict:
+    """Keep only what the API serves from a LanguageTool match (idempotent)."""
+    if not isinstance(match.get("rule"), dict):
+        return match
+    context = match.get("context") or {}
+    return {
+        "offset": match["offset"],
+        "length": match["length"],
+        "rule": match["rule"].get("id", ""),
+        "category": (match["rule"].get("category") or {}).get("id", ""),
+        "message": match.get("message", ""),
+        "short_message": match.get("shortMessage") or "",
+        "replacements": [
+            replacement["value"] for replacement in match.get("replacements", [])[: settings.GRAMMAR_MAX_REPLACEMENTS]
+        ],
+        "context": context.get("text", ""),
+        "context_offset": context.get("offset", 0),
+    }
+
+
+def compact_grammar_results(results):
+    """Compact stored grammar results, whether raw LanguageTool output or already compact."""
+    if not results:
+        return results
+    language = results.get("language")
+    if isinstance(language, dict):
+        language = language.get("code")
+    return {
+        "language": language or settings.GRAMMAR_CHECK_LANGUAGE,
+        "matches": [compact_match(match) for match in results.get("matches", [])],
+    }
+
+
+def expand_match(entry: dict) -> dict:
+    """Render a compact match in the LanguageTool shape clients parse."""
+    return {
+        "message": entry["message"],
+        "shortMessage": entry["short_message"],
+        "offset": entry["offset"],
+        "length": entry["length"],
+        "replacements": [{"value": value} for value in entry["replacements"]],
+        "context": {"text": entry["context"], "offset": entry["context_offset"], "length": entry["length"]},
+        "rule": {"id": entry["rule"], "category": {"id": entry["category"], "name": entry["category"]}},
+    }
+
+
+def _as_set(value) -> set:
+    """Filter values from a request: a list, or a comma-separated string."""
+    if not value:
+        return set()
+    if isinstance(value, str):
+        value = value.split(",")
+    return {str(item).strip().upper() for item in value if str(item).strip()}
+
+
+def page_grammar_results(results, page=1, page_size=None, categories=None, rules=None) -> dict:
+    """
+    Filter stored grammar results by category and rule id, and return one page
+    of matches in the API shape with totals and per-category counts.
+    Raises ValueError for an invalid page or page size.
+    """
+    page = int(page or 1)
+    page_size = int(page_size or settings.GRAMMAR_PAGE_SIZE)
+    if page < 1 or not 1 <= page_size <= settings.GRAMMAR_MAX_PAGE_SIZE:
+        raise ValueError(f"page must be >= 1 and page_size between 1 and {settings.GRAMMAR_MAX_PAGE_SIZE}")
+
+    compact = compact_grammar_results(results) or {"language": settings.GRAMMAR_CHECK_LANGUAGE, "matches": []}
+    category_filter, rule_filter = _as_set(categories), _as_set(rules)
+    counts = {}
+    selected = []
+    for entry in compact["matches"]:
+        counts[entry["category"]] = counts.get(entry["category"], 0) + 1
+        if category_filter and entry["category"].upper() not in category_filter:
+            continue
+        if rule_filter and entry["rule"].upper() not in rule_filter:
+            continue
+        selected.append(entry)
+
+    start = (page - 1) * page_size
+    return {
+        "language": {"code": compact["language"]},
+        "matches": [expand_match(entry) for entry in selected[start : start + page_size]],
+        "total": len(selected),
+        "page": page,
+        "page_size": page_size,
+        "num_pages": max((len(selected) + page_size - 1) // page_size, 1),
+        "categories": counts,
+    }
+
+
+def split_sentences(text: str) -> List[tuple]:
+    """Return ``(offset, sentence)`` pairs for the non-blank sentences of ``text``."""
+    sentences = []
+    for match in _SENTENCE.finditer(text):
+        sentence = match.group(0)
+        stripped = sentence.strip()
+        if not stripped:
+            continue
+        sentences.append((match.start() + sentence.index(stripped[0]), stripped))
+    return sentences
+
+
+def batch_sentences(sentences: List[str], max_chars: int) -> List[List[str]]:
+    """Group sentences, in order, into requests of at most ``max_chars`` characters (a longer sentence goes alone)."""
+    batches, batch, size = [], [], 0
+    for sentence in sentences:
+        if batch and size + len(sentence) > max_chars:
+            batches.append(batch)
+            batch, size = [], 0
+        batch.append(sentence)
+        size += len(sentence) + len(_SEPARATOR)
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+class GrammarChecker:
+    """Singleton that checks batches of sentences over one pooled session per process."""
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = super(GrammarChecker, cls).__new__(cls)
+                    cls._instance._session = None
+                    cls._instance._pid = None
+        return cls._instance
+
+    @property
+    def session(self) -> requests.Session:
+        """Return this process's pooled session (a forked worker builds its own)."""
+        pid = os.getpid()
+        if self._session is None or self._pid != pid:
+            with self._instance_lock:
+                if self._session is None or self._pid != pid:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_maxsize=settings.GRAMMAR_CHECK_CONCURRENCY)
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    self._session = session
+                    self._pid = pid
+        return self._session
+
+    @property
+    def cache(self):
+        return caches["grammar"]
+
+    @staticmethod
+    def cache_key(sentence: str) -> str:
+        material = f"{settings.GRAMMAR_CHECK_LANGUAGE}\n{sentence}"
+        return f"grammar:v{CACHE_VERSION}:" + hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _check_batch(self, batch: List[str]) -> tuple:
+        """
+        Check distinct sentences in one request.
+        Returns ``(language, {sentence: compact matches with offsets into the sentence})``.
+        """
+        starts, position = [], 0
+        for sentence in batch:
+            starts.append(position)
+            position += len(sentence) + len(_SEPARATOR)
+        response = self.session.post(
+            settings.GRAMMAR_CHECK_URL,
+            data={"text": _SEPARATOR.join(batch), "language": settings.GRAMMAR_CHECK_LANGUAGE},
+            timeout=(settings.GRAMMAR_CHECK_CONNECT_TIMEOUT, settings.GRAMMAR_CHECK_READ_TIMEOUT),
+        )
+        response.raise_for_status()
+        body = response.json()
+
+        results = {sentence: [] for sentence in batch}
+        for match in body.get("matches", []):
+            index = bisect_right(starts, match["offset"]) - 1
+            sentence, start = batch[index], starts[index]
+            if match["offset"] + match["length"] > start + len(sentence):
+                # Spans the separator, i.e. relates sentences that are not adjacent in the resume
+                continue
+            results[sentence].append({**compact_match(match), "offset": match["offset"] - start})
+        return (body.get("language") or {}).get("code"), results
+
+    def check(self, text: str) -> dict:
+        """
+        Check ``text`` and merge the per-sentence results.
+        Raises if any uncached sentence could not be checked; batches that were
+        checked are cached, so a retry only re-sends the failed ones.
+        """
+        sentences = split_sentences(text)
+        keys = {sentence: self.cache_key(sentence) for _, sentence in sentences}
+        cached = self.cache.get_many(list(set(keys.values())))
+        results = {sentence: cached[key] for sentence, key in keys.items() if key in cached}
+        missing = [sentence for sentence in keys if sentence not in results]
+
+        language = None
+        batches = batch_sentences(missing, settings.GRAMMAR_CHECK_MAX_CHARS)
+        if batches:
+            with metrics.timer("grammar_requests"), ThreadPoolExecutor(
+                max_workers=min(settings.GRAMMAR_CHECK_CONCURRENCY, len(batches))
+            ) as pool:
+                futures = [pool.submit(self._check_batch, batch) for batch in batches]
+            fresh = {}
+            error = None
+            for future in futures:
+                if future.exception() is not None:
+                    error = error or future.exception()
+                    continue
+                batch_language, batch_results = future.result()
+                language = batch_language or language
+                results.update(batch_results)
+                fresh.update({keys[sentence]: matches for sentence, matches in batch_results.items()})
+            if fresh:
+                self.cache.set_many(fresh, timeout=settings.GRAMMAR_CACHE_TTL)
+            if error is not None:
+                raise error
+        logger.info(
+            f"Grammar check: {len(keys)} distinct sentences, {len(keys) - len(missing)} cached, "
+            f"{len(batches)} requests"
+        )
+
+        matches = []
+        for offset, sentence in sentences:
+            for match in results[sentence]:
+                matches.append({**match, "offset": match["offset"] + offset})
+        return {"language": language or settings.GRAMMAR_CHECK_LANGUAGE, "matches": matches}
+
+
+# Create a singleton instance and expose the checker
+grammar_checker = GrammarChecker()
+
+
+def grammar_check(text: str) -> dict:
+    return grammar_checker.check(text)
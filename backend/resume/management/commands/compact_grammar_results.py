@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from interview.models import InterviewSession, ParsedResume
+from resume.grammar import compact_grammar_results
+
+
+class Command(BaseCommand):
+    help = "Rewrite stored grammar results in the compact format, dropping LanguageTool's raw payload."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500, help="Rows loaded per query")
+
+    def handle(self, *args, **options):
+        for model in (InterviewSession, ParsedResume):
+            rows = model.objects.exclude(grammar_results__isnull=True).only("pk", "grammar_results")
+            compacted = 0
+            for row in rows.iterator(chunk_size=options["batch_size"]):
+                compact = compact_grammar_results(row.grammar_results)
+                if compact != row.grammar_results:
+                    model.objects.filter(pk=row.pk).update(grammar_results=compact)
+                    compacted += 1
+            self.stdout.write(f"{model.__name__}: compacted {compacted} rows")
+        self.stdout.write(self.style.SUCCESS("Grammar results compacted"))
@@ -0,0 +1,480 @@
+"""
+Local keyword extraction over a curated skills taxonomy.
+
+Every alias in ``SKILL_TAXONOMY`` is compiled into one Aho-Corasick automaton,
+so a resume is scanned in a single pass however many skills the taxonomy
+holds. Matches must sit on word boundaries ("java" does not match inside
+"javascript") and overlapping matches keep the longest ("react native" over
+"react"). Aliases are spelling and abbreviation variants only and normalize to
+the canonical, lowercase keyword, so "Python3", "python 3" and "python" all
+count as "python", while "Vite" stays "vite" rather than becoming "webpack".
+
+A match is weighted by the resume section it appears in, so skills listed
+under "Skills" outrank a passing mention in "Education". The output has the
+same shape as the LLM extractor: a list of up to ``limit`` lowercase keywords.
+
+Usage:
+    from resume.skills import skill_matcher
+
+    keywords = skill_matcher.extract(parsed_text, limit=10)
+"""
+
+import re
+from collections import defaultdict
+from typing import Dict, List
+
+# canonical keyword -> spelling and abbreviation variants (matched case-insensitively; the canonical
+# name is matched too, see ALIAS_ONLY). Distinct products get their own entry, never an alias.
+SKILL_TAXONOMY: Dict[str, List[str]] = {
+    # Languages
+    "python": ["python3", "python 3", "python2"],
+    "java": ["java 8", "java 11", "java 17", "core java"],
+    "java ee": ["j2ee", "jakarta ee"],
+    "javascript": ["js", "ecmascript", "es6", "es2015", "vanilla js"],
+    "typescript": [],
+    "c++": ["cpp", "c plus plus"],
+    "c#": ["c sharp", "csharp"],
+    "go": ["golang", "go lang"],
+    "rust": ["rustlang"],
+    "kotlin": [],
+    "swift": [],
+    "objective-c": ["objective c", "objc"],
+    "ruby": [],
+    "php": [],
+    "scala": [],
+    "r": ["r programming"],
+    "matlab": [],
+    "perl": [],
+    "dart": [],
+    "elixir": [],
+    "haskell": [],
+    "bash": ["bash scripting"],
+    "shell scripting": ["shell script", "shell scripts"],
+    "zsh": [],
+    "powershell": [],
+    "sql": ["ansi sql"],
+    "t-sql": ["tsql", "transact-sql"],
+    "pl/sql": ["plsql"],
+    "html": ["html5"],
+    "css": ["css3"],
+    "sass": ["scss"],
+    "less": ["less css"],
+    "solidity": [],
+    "vba": ["excel vba"],
+    # Frontend
+    "react": ["react.js", "reactjs", "react js", "react hooks"],
+    "react native": ["react-native"],
+    "angular": ["angular 2+"],
+    "angularjs": ["angular.js"],
+    "vue": ["vue.js", "vuejs", "vue 3"],
+    "nuxt": ["nuxt.js", "nuxtjs"],
+    "svelte": [],
+    "sveltekit": [],
+    "next.js": ["nextjs", "next js"],
+    "redux": ["redux toolkit"],
+    "tailwind": ["tailwind css", "tailwindcss"],
+    "bootstrap": [],
+    "jquery": [],
+    "webpack": [],
+    "vite": ["vitejs"],
+    "rollup": ["rollup.js", "rollupjs"],
+    "esbuild": [],
+    "flutter": [],
+    "swiftui": ["swift ui"],
+    # Backend
+    "node.js": ["nodejs", "node js"],
+    "express.js": ["expressjs"],
+    "nestjs": ["nest.js"],
+    "django": [],
+    "django rest framework": ["drf"],
+    "flask": [],
+    "fastapi": ["fast api"],
+    "spring boot": ["springboot"],
+    "spring framework": [],
+    "spring mvc": [],
+    "hibernate": [],
+    "jpa": ["java persistence api"],
+    ".net": ["dotnet", ".net core"],
+    "asp.net": ["asp.net core"],
+    "entity framework": ["entity framework core", "ef core"],
+    "ruby on rails": ["rails", "ror"],
+    "laravel": [],
+    "symfony": [],
+    "graphql": [],
+    "apollo": ["apollo graphql", "apollo client", "apollo server"],
+    "rest api": ["rest apis", "restful", "restful api", "restful apis"],
+    "grpc": [],
+    "protobuf": ["protocol buffers"],
+    "microservices": ["microservice", "micro-services"],
+    "soa": ["service-oriented architecture", "service oriented architecture"],
+    "websockets": ["websocket"],
+    "socket.io": [],
+    # Data stores
+    "postgresql": ["postgres", "psql", "postgresql 14"],
+    "mysql": [],
+    "mariadb": [],
+    "sqlite": [],
+    "oracle": ["oracle db", "oracle database"],
+    "sql server": ["mssql", "microsoft sql server"],
+    "mongodb": ["mongo"],
+    "mongoose": [],
+    "redis": [],
+    "elasticsearch": ["elastic search"],
+    "opensearch": [],
+    "elk": ["elk stack"],
+    "cassandra": ["apache cassandra"],
+    "dynamodb": ["dynamo db"],
+    "firebase": [],
+    "firestore": ["cloud firestore"],
+    "snowflake": [],
+    "bigquery": ["big query"],
+    # Cloud and infrastructure
+    "aws": ["amazon web services"],
+    "ec2": ["amazon ec2"],
+    "s3": ["amazon s3"],
+    "aws lambda": [],
+    "cloudformation": ["aws cloudformation"],
+    "azure": ["microsoft azure"],
+    "gcp": ["google cloud", "google cloud platform"],
+    "docker": ["dockerfile"],
+    "docker compose": ["docker-compose"],
+    "containerization": [],
+    "kubernetes": ["k8s"],
+    "helm": ["helm charts", "helm chart"],
+    "eks": ["amazon eks"],
+    "gke": [],
+    "aks": [],
+    "terraform": [],
+    "pulumi": [],
+    "infrastructure as code": ["iac"],
+    "ansible": [],
+    "linux": [],
+    "unix": [],
+    "ubuntu": [],
+    "debian": [],
+    "centos": [],
+    "red hat": ["rhel", "red hat enterprise linux"],
+    "nginx": [],
+    "apache httpd": ["apache http server"],
+    "ci/cd": ["ci cd", "cicd", "continuous integration", "continuous delivery", "continuous deployment"],
+    "jenkins": [],
+    "github actions": [],
+    "gitlab ci": ["gitlab ci/cd"],
+    "circleci": ["circle ci"],
+    "travis ci": ["travis-ci"],
+    "git": [],
+    "github": [],
+    "gitlab": [],
+    "bitbucket": [],
+    "version control": [],
+    "serverless": [],
+    "kafka": ["apache kafka"],
+    "rabbitmq": ["rabbit mq"],
+    "celery": [],
+    "message queues": ["message queue"],
+    "prometheus": [],
+    "grafana": [],
+    "datadog": [],
+    "new relic": [],
+    "observability": [],
+    # Data, ML and AI
+    "machine learning": ["ml", "machine-learning"],
+    "scikit-learn": ["sklearn", "scikit learn"],
+    "xgboost": [],
+    "deep learning": [],
+    "neural networks": ["neural network"],
+    "cnn": ["cnns", "convolutional neural network", "convolutional neural networks"],
+    "rnn": ["rnns", "recurrent neural network", "recurrent neural networks"],
+    "lstm": [],
+    "tensorflow": [],
+    "keras": [],
+    "pytorch": [],
+    "nlp": ["natural language processing"],
+    "spacy": [],
+    "nltk": [],
+    "computer vision": [],
+    "opencv": [],
+    "image recognition": [],
+    "llm": ["llms", "large language models", "large language model"],
+    "gpt": [],
+    "prompt engineering": [],
+    "langchain": [],
+    "retrieval-augmented generation": ["retrieval augmented generation"],
+    "data analysis": ["data analytics", "data analyst", "exploratory data analysis", "eda"],
+    "data science": ["data scientist"],
+    "data engineering": ["data pipelines", "data pipeline"],
+    "etl": [],
+    "elt": [],
+    "airflow": ["apache airflow"],
+    "dbt": [],
+    "spark": ["apache spark", "pyspark"],
+    "hadoop": ["apache hadoop"],
+    "apache hive": [],
+    "databricks": [],
+    "pandas": [],
+    "numpy": [],
+    "scipy": [],
+    "statistics": ["statistical analysis"],
+    "a/b testing": ["ab testing"],
+    "hypothesis testing": [],
+    "regression analysis": [],
+    "tableau": [],
+    "power bi": ["powerbi"],
+    "excel": ["microsoft excel", "ms excel"],
+    "pivot tables": ["pivot table"],
+    "spreadsheets": [],
+    "jupyter": ["jupyter notebook", "jupyter notebooks"],
+    "rstudio": [],
+    # Mobile
+    "android": ["android sdk"],
+    "jetpack compose": [],
+    "ios": [],
+    "xcode": [],
+    "cocoapods": [],
+    # Testing and quality
+    "unit testing": ["unit tests"],
+    "pytest": [],
+    "junit": [],
+    "jest": [],
+    "mocha": [],
+    "tdd": ["test-driven development", "test driven development"],
+    "test automation": ["automated testing", "qa automation"],
+    "selenium": [],
+    "cypress": [],
+    "playwright": [],
+    "performance optimization": ["performance tuning"],
+    "profiling": [],
+    "load testing": [],
+    # Security
+    "cybersecurity": ["cyber security", "information security", "infosec"],
+    "network security": [],
+    "penetration testing": ["pentesting", "pen testing"],
+    "ethical hacking": [],
+    "burp suite": [],
+    "metasploit": [],
+    "oauth": ["oauth2", "oauth 2.0"],
+    "openid connect": ["oidc"],
+    "jwt": ["json web token", "json web tokens"],
+    "sso": ["single sign-on", "single sign on"],
+    # Design
+    "figma": [],
+    "adobe xd": [],
+    "ui/ux": ["ui design", "ux design", "user experience", "user interface design"],
+    "ux research": ["user research"],
+    "adobe creative suite": ["adobe creative cloud"],
+    "photoshop": ["adobe photoshop"],
+    "illustrator": ["adobe illustrator"],
+    "indesign": ["adobe indesign"],
+    "after effects": ["adobe after effects"],
+    "premiere pro": ["adobe premiere pro"],
+    # Practices and roles
+    "agile": ["agile methodologies"],
+    "scrum": ["sprint planning"],
+    "kanban": [],
+    "project management": ["project manager"],
+    "program management": ["program manager"],
+    "pmp": [],
+    "product management": ["product manager", "product roadmap", "roadmapping"],
+    "jira": [],
+    "confluence": [],
+    "system design": [],
+    "distributed systems": [],
+    "scalability": [],
+    "high availability": [],
+    "software architecture": [],
+    "object-oriented programming": ["oop", "object oriented programming"],
+    "object-oriented design": ["object oriented design", "ood"],
+    "design patterns": [],
+    "data structures": ["data structures and algorithms", "dsa"],
+    "algorithms": [],
+    "devops": [],
+    "sre": ["site reliability engineering"],
+    "embedded systems": ["embedded software"],
+    "firmware": [],
+    "rtos": [],
+    "microcontrollers": ["microcontroller"],
+    "arduino": [],
+    "raspberry pi": [],
+    "blockchain": [],
+    "web3": [],
+    "ethereum": [],
+    "smart contracts": ["smart contract"],
+    "game development": ["game dev"],
+    "unity": ["unity3d", "unity engine"],
+    "unreal engine": ["ue4", "ue5"],
+    # Business and professional
+    "leadership": ["team lead", "team leadership", "led a team", "people management"],
+    "mentoring": ["mentorship"],
+    "communication": ["communication skills"],
+    "public speaking": [],
+    "presentation skills": [],
+    "technical writing": [],
+    "stakeholder management": ["stakeholder communication"],
+    "cross-functional collaboration": ["cross-functional teams"],
+    "problem solving": ["problem-solving"],
+    "analytical skills": [],
+    "critical thinking": [],
+    "customer service": ["customer support"],
+    "client relations": [],
+    "customer success": [],
+    "sales": ["b2b sales"],
+    "business development": [],
+    "account management": [],
+    "lead generation": [],
+    "marketing": [],
+    "digital marketing": [],
+    "seo": ["search engine optimization"],
+    "content marketing": [],
+    "social media marketing": [],
+    "google analytics": [],
+    "salesforce": [],
+    "crm": [],
+    "hubspot": [],
+    "financial analysis": [],
+    "financial modeling": ["financial modelling"],
+    "budgeting": [],
+    "forecasting": [],
+    "fp&a": [],
+    "accounting": [],
+    "bookkeeping": [],
+    "quickbooks": [],
+    "gaap": [],
+    "accounts payable": [],
+    "accounts receivable": [],
+    "sap": ["sap erp"],
+    "erp": [],
+    "supply chain": ["supply chain management"],
+    "logistics": [],
+    "procurement": [],
+    "inventory management": [],
+    "human resources": ["hr"],
+    "recruiting": ["recruitment"],
+    "talent acquisition": [],
+    "onboarding": [],
+    "operations management": [],
+    "process improvement": [],
+    "lean manufacturing": [],
+    "six sigma": [],
+}
+
+# Section headings and the weight of a match found under them
+SECTION_WEIGHTS = {
+    "skills": 3.0,
+    "technical skills": 3.0,
+    "core competencies": 3.0,
+    "competencies": 3.0,
+    "technologies": 3.0,
+    "tech stack": 3.0,
+    "tools": 2.5,
+    "experience": 1.5,
+    "work experience": 1.5,
+    "professional experience": 1.5,
+    "employment": 1.5,
+    "employment history": 1.5,
+    "projects": 1.5,
+    "summary": 1.2,
+    "profile": 1.2,
+    "objective": 1.0,
+    "education": 0.8,
+    "certifications": 1.2,
+    "interests": 0.5,
+    "hobbies": 0.5,
+}
+DEFAULT_SECTION_WEIGHT = 1.0
+
+# Canonical names that are also common words; only their aliases are matched ("golang", not "go")
+ALIAS_ONLY = {"go", "r", "less", "rollup", "helm", "apollo", "unity"}
+
+_HEADING = re.compile(r"^\s*([a-z][a-z &/]{2,40}?)\s*(?::|$)")
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum()
+
+
+class SkillMatcher:
+    """Aho-Corasick automaton over the aliases of a skills taxonomy."""
+
+    def __init__(self, taxonomy: Dict[str, List[str]]):
+        # Trie: per node a dict of transitions, its failure link and the canonical keywords ending there
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        for canonical, aliases in taxonomy.items():
+            names = set(aliases) if canonical in ALIAS_ONLY else {canonical, *aliases}
+            for alias in names:
+                self._add(alias.lower(), canonical)
+        self._build_failure_links()
+
+    def _add(self, alias: str, canonical: str):
+        node = 0
+        for char in alias:
+            if char not in self._goto[node]:
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[node][char] = len(self._goto) - 1
+            node = self._goto[node][char]
+        self._output[node].append((len(alias), canonical))
+
+    def _build_failure_links(self):
+        queue = list(self._goto[0].values())
+        for node in queue:
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def find(self, text: str) -> List[tuple]:
+        """
+        Return non-overlapping ``(start, end, canonical)`` matches on word
+        boundaries, preferring the leftmost and then the longest match.
+        """
+        text = text.lower()
+        candidates = []
+        node = 0
+        for index, char in enumerate(text):
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            end = index + 1
+            for length, canonical in self._output[node]:
+                start = end - length
+                if start > 0 and _is_word_char(text[start - 1]) and _is_word_char(text[start]):
+                    continue
+                if end < len(text) and _is_word_char(text[end]) and _is_word_char(text[end - 1]):
+                    continue
+                candidates.append((start, end, canonical))
+
+        candidates.sort(key=lambda match: (match[0], match[0] - match[1]))
+        matches = []
+        covered_until = 0
+        for start, end, canonical in candidates:
+            if start >= covered_until:
+                matches.append((start, end, canonical))
+                covered_until = end
+        return matches
+
+    def extract(self, text: str, limit: int = 10) -> List[str]:
+        """Rank taxonomy keywords in ``text`` by section-weighted frequency."""
+        scores = defaultdict(float)
+        first_seen = {}
+        weight = DEFAULT_SECTION_WEIGHT
+        offset = 0
+        for line in text.splitlines():
+            heading = _HEADING.match(line.lower())
+            if heading and heading.group(1).strip() in SECTION_WEIGHTS:
+                weight = SECTION_WEIGHTS[heading.group(1).strip()]
+            for start, _, canonical in self.find(line):
+                scores[canonical] += weight
+                first_seen.setdefault(canonical, offset + start)
+            offset += len(line) + 1
+        ranked = sorted(scores, key=lambda keyword: (-scores[keyword], first_seen[keyword]))
+        return ranked[:limit]
+
+
+# Build the automaton once per process and expose it
+skill_matcher = SkillMatcher(SKILL_TAXONOMY)
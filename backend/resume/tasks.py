@@ -0,0 +1,30 @@
+"""Queue tasks for the resume app (see interview/job_queue.py)."""
+
+from interview.job_queue import task
+from interview.models.interview_session import InterviewSession
+from interview.session_cache import invalidate_session
+from interview.session_events import notify_session
+
+from .utils import check_grammar, parse_resume
+
+
+def mark_resume_failed(session_id):
+    InterviewSession.objects.filter(id=session_id).update(resume_status=InterviewSession.Status.FAILED)
+    invalidate_session(session_id)
+    notify_session(session_id)
+
+
+@task("parse_resume", on_failure=mark_resume_failed)
+def parse_resume_task(session_id):
+    parse_resume(session_id)
+
+
+def mark_grammar_failed(session_id, *args):
+    InterviewSession.objects.filter(id=session_id).update(grammar_status=InterviewSession.Status.FAILED)
+    invalidate_session(session_id)
+    notify_session(session_id)
+
+
+@task("check_grammar", on_failure=mark_grammar_failed)
+def check_grammar_task(session_id, content_hash):
+    check_grammar(session_id, content_hash)
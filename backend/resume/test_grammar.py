@@ -0,0 +1,142 @@
+import re
+from unittest.mock import MagicMock, patch
+
+import requests
+from django.core.cache import caches
+from django.test import SimpleTestCase, override_settings
+
+from .grammar import (
+    batch_sentences,
+    compact_grammar_results,
+    grammar_checker,
+    page_grammar_results,
+    split_sentences,
+)
+
+TEXT = "Jane Doe\nI has led teams. Team player.\n\nI has led teams."
+
+
+def _raw_match(offset, sentence, category="GRAMMAR", rule="HAVE_PRP"):
+    """A verbose LanguageTool match."""
+    return {
+        "message": "Use 'have'",
+        "shortMessage": "Agreement",
+        "offset": offset,
+        "length": 3,
+        "replacements": [{"value": "have"}, {"value": "had"}, {"value": "haves"}, {"value": "having"}],
+        "context": {"text": sentence, "offset": offset, "length": 3},
+        "sentence": sentence,
+        "type": {"typeName": "Other"},
+        "rule": {"id": rule, "description": "...", "issueType": "grammar", "category": {"id": category, "name": "Grammar"}},
+    }
+
+
+def _response(text):
+    """A LanguageTool reply flagging every "has" in the text."""
+    matches = [_raw_match(found.start(), text) for found in re.finditer("has", text)]
+    response = MagicMock(status_code=200)
+    response.json.return_value = {"software": {"name": "LanguageTool"}, "language": {"code": "en-US"}, "matches": matches}
+    return response
+
+
+@override_settings(
+    CACHES={
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        "grammar": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "grammar-tests"},
+    },
+    GRAMMAR_CHECK_URL="http://languagetool.test/v2/check",
+)
+class GrammarCheckTests(SimpleTestCase):
+    """Tests for batched, per-sentence cached grammar checks"""
+
+    def setUp(self):
+        caches["grammar"].clear()
+        self.post = patch.object(grammar_checker.session, "post", side_effect=lambda url, data, timeout: _response(data["text"])).start()
+        self.addCleanup(patch.stopall)
+
+    def test_split_sentences_keeps_offsets(self):
+        """Test that sentences and lines are split with their offsets into the text"""
+        sentences = split_sentences(TEXT)
+        self.assertEqual([sentence for _, sentence in sentences], ["Jane Doe", "I has led teams.", "Team player.", "I has led teams."])
+        for offset, sentence in sentences:
+            self.assertEqual(TEXT[offset:offset + len(sentence)], sentence)
+
+    def test_offsets_remapped_to_full_text(self):
+        """Test that matches point into the original text and distinct sentences go in one request"""
+        result = grammar_checker.check(TEXT)
+
+        self.assertEqual([TEXT[m["offset"]:m["offset"] + m["length"]] for m in result["matches"]], ["has", "has"])
+        self.assertEqual(self.post.call_count, 1)
+        self.assertEqual(self.post.call_args.kwargs["data"]["text"], "Jane Doe\n\nI has led teams.\n\nTeam player.")
+        self.assertEqual(self.post.call_args.args[0], "http://languagetool.test/v2/check")
+        self.assertEqual(result["language"], "en-US")
+        self.assertEqual(result["matches"][0]["rule"], "HAVE_PRP")
+        self.assertEqual(result["matches"][0]["replacements"], ["have", "had", "haves"])
+        self.assertNotIn("sentence", result["matches"][0])
+
+    def test_recheck_served_from_cache(self):
+        """Test that a second check of known sentences sends no requests"""
+        grammar_checker.check(TEXT)
+        self.post.reset_mock()
+
+        result = grammar_checker.check("I has led teams.\nNew line here.")
+
+        self.assertEqual(self.post.call_count, 1)
+        self.assertEqual(result["matches"][0]["offset"], 2)
+
+    def test_batches_bounded_by_size(self):
+        """Test that sentences are grouped in order into requests under the size limit"""
+        self.assertEqual(batch_sentences(["aaaa", "bb", "cccccc", "d"], 8), [["aaaa", "bb"], ["cccccc"], ["d"]])
+        self.assertEqual(batch_sentences(["x" * 20, "y"], 8), [["x" * 20], ["y"]])
+
+    @override_settings(GRAMMAR_CHECK_MAX_CHARS=20)
+    def test_failed_batch_raises_but_caches_others(self):
+        """Test that a failure fails the check without losing finished batches"""
+
+        def flaky(url, data, timeout):
+            if "Team player." in data["text"]:
+                raise requests.ConnectionError("down")
+            return _response(data["text"])
+
+        self.post.side_effect = flaky
+        with self.assertRaises(requests.ConnectionError):
+            grammar_checker.check(TEXT)
+
+        self.post.side_effect = lambda url, data, timeout: _response(data["text"])
+        self.post.reset_mock()
+        grammar_checker.check(TEXT)
+        self.assertEqual(self.post.call_count, 1)
+
+
+class GrammarResultsPageTests(SimpleTestCase):
+    """Tests for serving stored grammar results a page at a time"""
+
+    def setUp(self):
+        raw = {
+            "software": {"name": "LanguageTool"},
+            "language": {"code": "en-US", "detectedLanguage": {"code": "en-US"}},
+            "matches": [_raw_match(i, "x" * 40, category="TYPOS" if i % 2 else "GRAMMAR") for i in range(5)],
+        }
+        self.results = compact_grammar_results(raw)
+
+    def test_compaction_is_idempotent(self):
+        """Test that compacting compact results changes nothing"""
+        self.assertEqual(compact_grammar_results(self.results), self.results)
+        self.assertEqual(set(self.results), {"language", "matches"})
+
+    def test_pages_and_filters(self):
+        """Test that matches are paged, filtered and counted per category"""
+        page = page_grammar_results(self.results, page=2, page_size=2)
+        self.assertEqual([m["offset"] for m in page["matches"]], [2, 3])
+        self.assertEqual((page["total"], page["num_pages"]), (5, 3))
+        self.assertEqual(page["categories"], {"GRAMMAR": 3, "TYPOS": 2})
+        self.assertEqual(page["matches"][0]["rule"]["category"]["id"], "GRAMMAR")
+        self.assertEqual(page["matches"][0]["replacements"][0], {"value": "have"})
+
+        typos = page_grammar_results(self.results, categories="typos")
+        self.assertEqual([m["offset"] for m in typos["matches"]], [1, 3])
+
+    def test_invalid_page_size(self):
+        """Test that out-of-range page sizes are rejected"""
+        with self.assertRaises(ValueError):
+            page_grammar_results(self.results, page_size=10_000)
@@ -0,0 +1,95 @@
+import shutil
+import tempfile
+from unittest.mock import patch
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITransactionTestCase
+
+from interview.models import InterviewSession, ParsedResume
+
+from .utils import check_grammar, parse_resume
+
+PDF_CONTENT = b"%PDF-1.4\n1 0 obj\n<<\n/Type /Catalog\n>>\nendobj\ntrailer\n<<\n/Root 1 0 R\n>>\n%%EOF"
+
+
+class ParsedResumeReuseTests(APITransactionTestCase):
+    """Tests for skipping the parse pipeline on re-uploaded resumes"""
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.settings_override = override_settings(MEDIA_ROOT=self.media_root, JOB_QUEUE_EMBEDDED_WORKERS=0)
+        self.settings_override.enable()
+        self.url = reverse("upload-resume")
+
+    def tearDown(self):
+        self.settings_override.disable()
+        shutil.rmtree(self.media_root, ignore_errors=True)
+
+    def _upload(self):
+        pdf_file = SimpleUploadedFile("resume.pdf", PDF_CONTENT, content_type="application/pdf")
+        return self.client.post(self.url, {"file": pdf_file})
+
+    @patch("resume.utils.grammar_check", return_value={"matches": []})
+    @patch("resume.utils.get_keywords_using_openai", return_value=["python", "django"])
+    @patch("resume.utils.llamaparse_pdf_v1", return_value="Python developer")
+    @patch("resume.views.enqueue")
+    def test_reupload_is_complete_immediately(self, enqueue, llamaparse, keywords, grammar):
+        """Test that a second upload of the same bytes reuses the parse results"""
+        first = self._upload()
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(enqueue.call_count, 1)
+        parse_resume(first.data["id"])
+
+        parsed = ParsedResume.objects.get()
+        self.assertEqual(parsed.keywords, ["python", "django"])
+        first_used_at = parsed.last_used_at
+
+        second = self._upload()
+        self.assertEqual(second.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(enqueue.call_count, 1)  # No new parse job
+        session = InterviewSession.objects.get(id=second.data["id"])
+        self.assertEqual(session.resume_status, InterviewSession.Status.COMPLETE)
+        self.assertEqual(session.keywords, ["python", "django"])
+        self.assertEqual(session.grammar_results, {"matches": []})
+        self.assertEqual(llamaparse.call_count, 1)
+
+        parsed.refresh_from_db()
+        self.assertEqual(parsed.hit_count, 1)
+        self.assertGreater(parsed.last_used_at, first_used_at)
+
+    @patch("resume.utils.get_keywords_using_openai", return_value=["python", "django"])
+    @patch("resume.utils.llamaparse_pdf_v1", return_value="Python developer")
+    @patch("resume.views.enqueue")
+    def test_reupload_without_grammar_rechecks(self, enqueue, llamaparse, keywords):
+        """Test that a re-upload whose cached grammar check failed runs the check again"""
+        first = self._upload()
+        with patch("resume.utils.grammar_check", side_effect=RuntimeError("rate limited")):
+            parse_resume(first.data["id"])
+        self.assertIsNone(ParsedResume.objects.get().grammar_results)
+
+        second = self._upload()
+        session = InterviewSession.objects.get(id=second.data["id"])
+        self.assertEqual(session.resume_status, InterviewSession.Status.COMPLETE)
+        self.assertEqual(session.grammar_status, InterviewSession.Status.PROCESSING)
+        self.assertEqual(enqueue.call_args.args, ("check_grammar", second.data["id"], session.resume_hash))
+
+        with patch("resume.utils.grammar_check", return_value={"matches": []}):
+            check_grammar(session.id, session.resume_hash)
+        session.refresh_from_db()
+        self.assertEqual(session.grammar_status, InterviewSession.Status.COMPLETE)
+        self.assertEqual(session.grammar_results, {"matches": []})
+        self.assertEqual(ParsedResume.objects.get().grammar_results, {"matches": []})
+        self.assertEqual(llamaparse.call_count, 1)
+
+    @patch("resume.views.enqueue")
+    def test_first_upload_is_processing(self, enqueue):
+        """Test that an unseen PDF still goes through the parse pipeline"""
+        response = self._upload()
+
+        session = InterviewSession.objects.get(id=response.data["id"])
+        self.assertEqual(session.resume_status, InterviewSession.Status.PROCESSING)
+        self.assertEqual(len(session.resume_hash), 64)
+        enqueue.assert_called_once()
@@ -0,0 +1,73 @@
+import os
+import shutil
+import tempfile
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from django.test import SimpleTestCase
+from reportlab.lib.pagesizes import letter
+from reportlab.pdfgen import canvas
+
+from .utils import extract_resume_text, is_usable_text, llamaparse_pdf_v1
+
+RESUME_LINES = [
+    "Jane Doe - Senior Software Engineer",
+    "Experience building Django and PostgreSQL services for payments at scale.",
+    "Led a team of five engineers migrating a monolith to containerized services.",
+    "Designed REST APIs consumed by web and mobile clients across three regions.",
+    "Skills: Python, Django, PostgreSQL, Redis, Docker, Kubernetes, AWS, React.",
+]
+
+
+class PdfExtractionTests(SimpleTestCase):
+    """Tests for the local text layer tier in front of LlamaParse"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _pdf(self, pages):
+        path = os.path.join(self.directory, "resume.pdf")
+        pdf = canvas.Canvas(path, pagesize=letter)
+        for lines in pages:
+            for offset, line in enumerate(lines):
+                pdf.drawString(72, 720 - 18 * offset, line)
+            pdf.showPage()
+        pdf.save()
+        return path
+
+    @patch("resume.utils.llamaparse_pdf_v1")
+    def test_text_pdf_extracted_locally(self, llamaparse):
+        """Test that a digital resume is read in-process, all pages included"""
+        path = self._pdf([RESUME_LINES, ["Education: BSc Computer Science, 2015"]])
+
+        text = extract_resume_text(path)
+
+        llamaparse.assert_not_called()
+        self.assertIn("Senior Software Engineer", text)
+        self.assertIn("BSc Computer Science", text)
+
+    @patch("resume.utils.llamaparse_pdf_v1", return_value="OCR text")
+    def test_scanned_pdf_falls_back_to_llamaparse(self, llamaparse):
+        """Test that a PDF without a text layer goes to LlamaParse"""
+        path = self._pdf([[]])
+
+        self.assertEqual(extract_resume_text(path), "OCR text")
+        llamaparse.assert_called_once_with(path)
+
+    def test_garbled_text_is_rejected(self):
+        """Test that broken encodings and run-together words fail the heuristics"""
+        self.assertTrue(is_usable_text(" ".join(RESUME_LINES) * 2))
+        self.assertFalse(is_usable_text("�■ (cid:12) " * 100))
+        self.assertFalse(is_usable_text("SeniorSoftwareEngineerDjangoPostgreSQL " * 40))
+
+    @patch("resume.utils._llamaparse_client")
+    def test_llamaparse_concatenates_pages(self, client):
+        """Test that LlamaParse results include every page"""
+        client.return_value = MagicMock(
+            parse=MagicMock(return_value=SimpleNamespace(pages=[SimpleNamespace(text="one"), SimpleNamespace(text="two")]))
+        )
+
+        self.assertEqual(llamaparse_pdf_v1("/tmp/resume.pdf"), "one\n\ntwo")
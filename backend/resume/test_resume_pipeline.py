@@ -0,0 +1,95 @@
+import threading
+from unittest.mock import patch
+
+from django.test import TransactionTestCase, override_settings
+
+from interview.models import InterviewSession
+
+from .utils import parse_resume
+
+
+@override_settings(SPECULATIVE_QUESTION_TITLES=0)
+class ResumePipelineTests(TransactionTestCase):
+    """Tests for the parse -> {keywords, grammar} resume pipeline"""
+
+    def setUp(self):
+        self.session = InterviewSession.objects.create(resume_local_path="resume.pdf")
+
+    @patch("resume.utils.grammar_check", return_value={"matches": []})
+    @patch("resume.utils.get_keywords_using_openai", return_value=["python"])
+    @patch("resume.utils.llamaparse_pdf_v1", return_value="Python developer")
+    def test_stages_persist_results(self, llamaparse, keywords, grammar):
+        """Test that both stages store their results and statuses"""
+        parse_resume(self.session.id)
+
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.resume_status, InterviewSession.Status.COMPLETE)
+        self.assertEqual(self.session.keywords_status, InterviewSession.Status.COMPLETE)
+        self.assertEqual(self.session.grammar_status, InterviewSession.Status.COMPLETE)
+        self.assertEqual(self.session.keywords, ["python"])
+        self.assertEqual(self.session.grammar_results, {"matches": []})
+        self.assertIn("grammar", self.session.stage_timings)
+
+    @patch("resume.utils.enqueue_question_pregeneration")
+    @patch("resume.utils.grammar_check", return_value={"matches": []})
+    @patch("resume.utils.get_keywords_using_openai", return_value=["python"])
+    @patch("resume.utils.llamaparse_pdf_v1", return_value="Python developer")
+    def test_keywords_queue_question_pregeneration(self, llamaparse, keywords, grammar, pregenerate):
+        """Test that questions are pre-generated once keywords are extracted"""
+        parse_resume(self.session.id)
+
+        pregenerate.assert_called_once_with(self.session.id)
+
+    @patch("resume.utils.llamaparse_pdf_v1", return_value="Python developer")
+    def test_keywords_and_grammar_run_concurrently(self, llamaparse):
+        """Test that the two stages are in flight at the same time"""
+        # Each stage only returns once the other one has started
+        barrier = threading.Barrier(2, timeout=5)
+
+        def keywords(text):
+            barrier.wait()
+            return ["python"]
+
+        def grammar(text):
+            barrier.wait()
+            return {"matches": []}
+
+        with patch("resume.utils.get_keywords_using_openai", side_effect=keywords), \
+                patch("resume.utils.grammar_check", side_effect=grammar):
+            parse_resume(self.session.id)
+
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.resume_status, InterviewSession.Status.COMPLETE)
+
+    @patch("resume.utils.llamaparse_pdf_v1", return_value="Python developer")
+    def test_concurrent_stage_timings_all_recorded(self, llamaparse):
+        """Test that both stages' db_save time is recorded when they overlap"""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def stage(result):
+            def run(session_id, parsed_text, timings):
+                # Both stages read before either writes
+                seen = timings.get("db_save", 0)
+                barrier.wait()
+                timings["db_save"] = seen + 1
+                return result
+            return run
+
+        with patch("resume.utils._keywords_stage", new=stage(["python"])), \
+                patch("resume.utils._grammar_stage", new=stage({"matches": []})):
+            parse_resume(self.session.id)
+
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.stage_timings["db_save"], 2)
+
+    @patch("resume.utils.grammar_check", side_effect=ConnectionError("languagetool down"))
+    @patch("resume.utils.get_keywords_using_openai", return_value=["python"])
+    @patch("resume.utils.llamaparse_pdf_v1", return_value="Python developer")
+    def test_grammar_failure_keeps_keywords(self, llamaparse, keywords, grammar):
+        """Test that a failed grammar check does not fail the resume"""
+        parse_resume(self.session.id)
+
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.resume_status, InterviewSession.Status.COMPLETE)
+        self.assertEqual(self.session.keywords_status, InterviewSession.Status.COMPLETE)
+        self.assertEqual(self.session.grammar_status, InterviewSession.Status.FAILED)
@@ -0,0 +1,70 @@
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+
+from .skills import skill_matcher
+from .utils import extract_keywords
+
+RESUME = """Jane Doe
+Summary: Backend engineer. I like to go hiking and rest on weekends.
+Experience
+Built RESTful services with Django REST Framework and Python3 on AWS; shipped a React Native app.
+Skills: Python, Golang, C++, C#, PostgreSQL, Docker, K8s, CI/CD
+Education
+Took a course on JavaScript
+"""
+
+
+class SkillMatcherTests(SimpleTestCase):
+    """Tests for the skills taxonomy automaton"""
+
+    def test_aliases_normalize_to_canonical(self):
+        """Test that aliases map to lowercase canonical keywords"""
+        keywords = skill_matcher.extract("Python3, ReactJS, Postgres and K8s")
+        self.assertEqual(keywords, ["python", "react", "postgresql", "kubernetes"])
+
+    def test_distinct_products_kept_apart(self):
+        """Test that related but distinct technologies are not folded into one keyword"""
+        keywords = skill_matcher.extract("Vite, webpack, Celery, RabbitMQ, MariaDB, GitHub, Git, Grafana", limit=20)
+        self.assertEqual(keywords, ["vite", "webpack", "celery", "rabbitmq", "mariadb", "github", "git", "grafana"])
+
+    def test_word_boundaries_and_longest_match(self):
+        """Test that matches respect word boundaries and prefer the longest alias"""
+        matches = [canonical for _, _, canonical in skill_matcher.find("JavaScript, Java, React Native, C++")]
+        self.assertEqual(matches, ["javascript", "java", "react native", "c++"])
+        # Common words that are also skill names are not matched on their own
+        self.assertEqual(skill_matcher.find("go for a rest"), [])
+
+    def test_section_weighting(self):
+        """Test that skills sections outrank passing mentions"""
+        keywords = skill_matcher.extract(RESUME, limit=20)
+        self.assertEqual(keywords[:2], ["python", "go"])
+        self.assertEqual(keywords[-1], "javascript")
+        self.assertEqual(len(skill_matcher.extract(RESUME, limit=10)), 10)
+
+
+class ExtractKeywordsTests(SimpleTestCase):
+    """Tests for choosing between the local extractor and the LLM"""
+
+    @patch("resume.utils.get_keywords_using_openai")
+    def test_local_keywords_skip_llm(self, llm):
+        """Test that a resume the taxonomy covers never reaches the LLM"""
+        keywords = extract_keywords(RESUME)
+
+        llm.assert_not_called()
+        self.assertIn("postgresql", keywords)
+
+    @patch("resume.utils.get_keywords_using_openai", return_value=["nursing", "patient care"])
+    def test_few_matches_fall_back_to_llm(self, llm):
+        """Test that resumes outside the taxonomy use the LLM"""
+        self.assertEqual(extract_keywords("Registered nurse, patient care, Excel"), ["nursing", "patient care"])
+        llm.assert_called_once_with("Registered nurse, patient care, Excel")
+
+    @override_settings(KEYWORDS_LLM_REFINEMENT=True)
+    @patch("resume.utils.get_keywords_using_openai", side_effect=RuntimeError("down"))
+    def test_refinement_failure_keeps_local_keywords(self, llm):
+        """Test that the LLM tier is optional when local matches exist"""
+        keywords = extract_keywords(RESUME)
+
+        self.assertEqual(llm.call_args.kwargs["candidates"], keywords)
+        self.assertIn("python", keywords)
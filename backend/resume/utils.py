@@ -1,69 +1,180 @@
+import asyncio
 import json
 import os
-import re
 
-import requests
 from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.db.models import F
+from django.utils import timezone
 from interview.models.interview_session import InterviewSession
+from interview.models.parsed_resume import ParsedResume
+from interview.session_cache import cached_session, invalidate_session
+from interview.session_events import notify_session
+from interview.utils import enqueue_question_pregeneration
+from jobify_backend.db_connections import managed
+from jobify_backend.llm_client import llm_client, parse_json_array
+from jobify_backend.llm_engine import llm_engine
 from jobify_backend.logger import logger
+from jobify_backend.metrics import metrics
 from llama_cloud_services import LlamaParse
 
+from .grammar import grammar_check
+from .skills import skill_matcher
 
-def get_session_by_id(session_id: str):
+try:
+    from pypdf import PdfReader
+except ImportError:  # Local extraction is optional; LlamaParse handles every PDF
+    PdfReader = None
+
+_llama_parser = None
+
+
+def get_session_by_id(session_id: str, only=None):
     """
     Retrieve an interview session by id.
+    With ``only``, just those columns are loaded and the heavy JSON columns are
+    deferred until first accessed (e.g. in a "finished" branch); status columns
+    are served from the session cache (see interview/session_cache.py).
     Returns None if not found or if id is invalid.
     """
     try:
+        if only:
+            return cached_session(session_id, only)
         return InterviewSession.objects.get(id=session_id)
     except (InterviewSession.DoesNotExist, ValueError, ValidationError):
         logger.error(f"Error retrieving interview session with id {session_id}")
         return None
 
 
-def grammar_check(text: str) -> dict:
-    response = requests.post(
-        "https://api.languagetool.org/v2/check",
-        data={"text": text, "language": "en-US"},
-    )
-    return response.json()
-
-
-def parse_resume(session_id: str):
+def get_parsed_resume(content_hash: str):
     """
-    Parse a résumé asynchronously and update the database.
+    Retrieve stored parse results for a resume by the SHA-256 of its bytes.
+    Returns None if this PDF has not been processed before.
     """
-    try:
-        session = InterviewSession.objects.get(id=session_id)
+    if not content_hash:
+        return None
+    parsed = ParsedResume.objects.filter(content_hash=content_hash).first()
+    if parsed:
+        # update() skips auto_now, so last_used_at is set here
+        ParsedResume.objects.filter(content_hash=content_hash).update(
+            hit_count=F("hit_count") + 1, last_used_at=timezone.now()
+        )
+    return parsed
 
-        # Try to parse the résumé
-        try:
-            logger.info(f"Starting resume parsing for doc_id: {session_id}")
 
-            # Parse the résumé using LlamaParse
-            parsed_text = llamaparse_pdf_v1(session.resume_local_path)
+def _update_session(session_id, **fields):
+    """Update session columns, drop its cached statuses and wake its event streams."""
+    InterviewSession.objects.filter(id=session_id).update(**fields)
+    invalidate_session(session_id)
+    notify_session(session_id)
+
+
+def _keywords_stage(session_id, parsed_text: str, timings: dict):
+    """Extract keywords and persist them as soon as they arrive."""
+    try:
+        with metrics.timer("keywords", timings):
+            keywords = extract_keywords(parsed_text)
+        if not keywords:
+            raise ValueError("No keywords extracted")
+    except Exception:
+        _update_session(session_id, keywords_status=InterviewSession.Status.FAILED)
+        raise
+    with metrics.timer("db_save", timings):
+        _update_session(
+            session_id, keywords=keywords, keywords_status=InterviewSession.Status.COMPLETE
+        )
+    logger.info(f"Keywords ready for doc_id: {session_id}")
+    return keywords
 
-            # Generate keywords from parsed text
-            keywords = get_keywords_using_openai(parsed_text)
 
-            # Run grammar check
-            logger.info(f"Starting grammar check for doc_id: {session_id}")
+def _grammar_stage(session_id, parsed_text: str, timings: dict):
+    """Run the grammar check and persist its results as soon as they arrive."""
+    logger.info(f"Starting grammar check for doc_id: {session_id}")
+    try:
+        with metrics.timer("grammar", timings):
             grammar_results = grammar_check(parsed_text)
+    except Exception as grammar_error:
+        logger.error(f"Grammar check failed for doc_id: {session_id}, error: {grammar_error}")
+        # A failed grammar check does not fail the resume
+        _update_session(session_id, grammar_status=InterviewSession.Status.FAILED)
+        return None
+    with metrics.timer("db_save", timings):
+        _update_session(
+            session_id, grammar_results=grammar_results, grammar_status=InterviewSession.Status.COMPLETE
+        )
+    logger.info(f"Grammar results ready for doc_id: {session_id}")
+    return grammar_results
+
+
+def check_grammar(session_id, content_hash: str):
+    """
+    Run only the grammar stage for a session reusing parse results that have no
+    grammar results (the check failed on the first upload), and store them for
+    later uploads of the same PDF.
+    """
+    timings = {}
+    parsed_text = ParsedResume.objects.values_list("parsed_text", flat=True).get(content_hash=content_hash)
+    grammar_results = _grammar_stage(session_id, parsed_text, timings)
+    if grammar_results is not None:
+        ParsedResume.objects.filter(content_hash=content_hash, grammar_results__isnull=True).update(
+            grammar_results=grammar_results
+        )
+    InterviewSession.record_stage_timings(session_id, timings)
 
-            # Update resume with results
-            session.keywords = keywords
-            session.grammar_results = grammar_results
-            session.resume_status = InterviewSession.Status.COMPLETE
-            session.save()
 
-        except Exception as grammar_error:
-            logger.error(
-                f"Grammar check failed for doc_id: {session_id}, error: {grammar_error}"
+def parse_resume(session_id: str):
+    """
+    Parse a résumé asynchronously and update the database.
+
+    Stages: parse -> {keywords, grammar}. Keyword extraction and the grammar
+    check run concurrently and each persists its result (and status) as soon as
+    it finishes, so ``get_keywords`` can answer before the grammar check returns.
+    """
+    timings = {}
+    try:
+        session = InterviewSession.objects.get(id=session_id)
+        _update_session(
+            session_id,
+            keywords_status=InterviewSession.Status.PROCESSING,
+            grammar_status=InterviewSession.Status.PROCESSING,
+        )
+        logger.info(f"Starting resume parsing for doc_id: {session_id}")
+
+        # Read the text layer locally, falling back to LlamaParse for scans and odd layouts
+        parsed_text = extract_resume_text(session.resume_local_path, timings)
+
+        # Keywords and grammar only depend on the parsed text: run them side by side,
+        # and wait for both before deciding the resume status. Each thread times into
+        # its own dict, since both add to "db_save"
+        keyword_timings, grammar_timings = {}, {}
+        keywords, grammar_results = llm_engine.gather(
+            asyncio.to_thread(managed(_keywords_stage), session_id, parsed_text, keyword_timings),
+            asyncio.to_thread(managed(_grammar_stage), session_id, parsed_text, grammar_timings),
+            return_exceptions=True,
+        )
+        for stage_timings in (keyword_timings, grammar_timings):
+            for stage, seconds in stage_timings.items():
+                timings[stage] = round(timings.get(stage, 0) + seconds, 3)
+        if isinstance(keywords, Exception):
+            raise keywords
+        _update_session(session_id, resume_status=InterviewSession.Status.COMPLETE)
+
+        # Start on questions for the likeliest target titles while the user picks one
+        try:
+            enqueue_question_pregeneration(session_id)
+        except Exception as e:
+            logger.error(f"Failed to queue question pre-generation for {session_id}: {str(e)}")
+
+        # Remember the results so re-uploads of the same PDF skip the pipeline
+        if session.resume_hash and keywords:
+            ParsedResume.objects.update_or_create(
+                content_hash=session.resume_hash,
+                defaults={
+                    "parsed_text": parsed_text,
+                    "keywords": keywords,
+                    "grammar_results": grammar_results,
+                },
             )
-            # Still mark as complete even if the grammar check fails
-            session.resume_status = InterviewSession.Status.COMPLETE
-            session.save()
 
     except InterviewSession.DoesNotExist:
         logger.error(f"Interview session {session_id} not found in database")
@@ -72,31 +183,51 @@ def parse_resume(session_id: str):
         logger.error(f"Error parsing resume {session_id}: {str(e)}")
         # Mark resume as failed
         try:
-            session = InterviewSession.objects.get(id=session_id)
-            session.resume_status = InterviewSession.Status.FAILED
-            session.save()
+            _update_session(session_id, resume_status=InterviewSession.Status.FAILED)
         except Exception as e:
             logger.error(f"Error marking resume {session_id} as failed: {str(e)}")
 
+    try:
+        InterviewSession.record_stage_timings(session_id, timings)
+    except Exception as e:
+        logger.error(f"Error recording stage timings for {session_id}: {str(e)}")
+
+
+def extract_keywords(text) -> list:
+    """
+    Extract up to ``KEYWORD_LIMIT`` lowercase keywords from resume text.
+
+    The skills taxonomy matcher answers in milliseconds. The LLM runs only when
+    it finds fewer than ``LOCAL_KEYWORDS_MIN_MATCHES`` keywords (e.g. resumes
+    outside the taxonomy), or on every resume with ``KEYWORDS_LLM_REFINEMENT``.
+    """
+    local = skill_matcher.extract(text, limit=settings.KEYWORD_LIMIT) if settings.LOCAL_KEYWORDS else []
+    refine = settings.KEYWORDS_LLM_REFINEMENT and bool(local)
+    if len(local) >= settings.LOCAL_KEYWORDS_MIN_MATCHES and not refine:
+        return local
+
+    try:
+        keywords = get_keywords_using_openai(text, candidates=local) if refine else get_keywords_using_openai(text)
+    except Exception as e:
+        if not local:
+            raise
+        logger.error(f"LLM keyword extraction failed, using taxonomy matches: {e}")
+        return local
+    return keywords or local
+
+
+def get_keywords_using_openai(text, candidates: list = None) -> str:
+    hint = (
+        f"""
+
+    A skills taxonomy already found these keywords: {json.dumps(candidates)}
+    Keep the relevant ones, drop any that are misleading, and add important ones it missed."""
+        if candidates
+        else ""
+    )
+    prompt = f"""You are an expert resume analyzer.
 
-def get_keywords_using_openai(text) -> str:
-    response = requests.post(
-        "https://openrouter.ai/api/v1/chat/completions",
-        headers={
-            "Authorization": f"Bearer {os.getenv('OPEN_ROUTER_API_KEY')}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "jobify.com",  # Optional. Site URL for rankings on openrouter.ai.
-            "X-Title": "Jobify",  # Optional. Site title for rankings on openrouter.ai.
-        },
-        data=json.dumps(
-            {
-                "model": "openai/gpt-4o",
-                "messages": [
-                    {
-                        "role": "user",
-                        "content": f"""You are an expert resume analyzer.
-
-    Your task is to extract **up to 10 distinct English keywords** that best represent the skills, technologies, and important qualifications found in the following resume text.
+    Your task is to extract **up to 10 distinct English keywords** that best represent the skills, technologies, and important qualifications found in the following resume text.{hint}
 
     Please follow these strict rules:
 
@@ -109,18 +240,12 @@ def get_keywords_using_openai(text) -> str:
     \"\"\"
     {text}
     \"\"\"
-    """,
-                    }
-                ],
-            }
-        ),
-    )
-    response_text = response.json()["choices"][0]["message"]["content"]
-    match = re.search(r"\[.*?\]", response_text, re.DOTALL)
+    """
+    response_text = llm_client.chat_completion(prompt, call_type="keywords", validate=parse_json_array)
     try:
-        keywords = json.loads(match[0])
-    except json.JSONDecodeError:
-        print(f"Error parsing keywords: {response_text}")
+        keywords = parse_json_array(response_text)
+    except ValueError:
+        logger.error(f"Error parsing keywords: {response_text}")
         return ""
     return keywords
 
@@ -141,31 +266,81 @@ def check_file_size_with_message(file, max_size_mb=5):
     return True, None
 
 
-def llamaparse_pdf_v1(resume_path) -> str:
+def _resume_full_path(resume_path) -> str:
     if not os.path.isabs(resume_path):
-        full_path = os.path.join(settings.MEDIA_ROOT, resume_path)
-    else:
-        full_path = resume_path
-
-    parser = LlamaParse(
-        api_key=os.getenv("LLAMA_PARSE_API_KEY"),
-        num_workers=4,
-        verbose=True,
-        language="en",
-    )
+        return os.path.join(settings.MEDIA_ROOT, resume_path)
+    return resume_path
+
+
+def extract_pdf_text_locally(resume_path):
+    """
+    Read the text layer of every page with pypdf.
+    Returns None if pypdf is unavailable or the PDF can't be read.
+    """
+    if PdfReader is None:
+        return None
+    try:
+        reader = PdfReader(_resume_full_path(resume_path))
+        if reader.is_encrypted:
+            reader.decrypt("")
+        pages = [page.extract_text() or "" for page in reader.pages]
+    except Exception as e:
+        logger.warning(f"Local PDF extraction failed for {resume_path}: {e}")
+        return None
+    return "\n\n".join(page.strip() for page in pages if page.strip())
+
+
+def is_usable_text(text) -> bool:
+    """
+    Heuristics for whether a locally extracted text layer can replace LlamaParse:
+    enough text (scans have none), mostly letters (broken font encodings produce
+    symbols and U+FFFD), and few run-together "words" (layouts pypdf can't space).
+    """
+    if not text:
+        return False
+    characters = [char for char in text if not char.isspace()]
+    if len(characters) < settings.LOCAL_PDF_MIN_CHARS:
+        return False
+    letters = sum(char.isalpha() for char in characters)
+    if letters / len(characters) < settings.LOCAL_PDF_MIN_LETTER_RATIO:
+        return False
+    if text.count("\ufffd") > len(characters) * 0.01:
+        return False
+    words = text.split()
+    long_words = sum(len(word) >= 25 for word in words)
+    return long_words / len(words) <= settings.LOCAL_PDF_MAX_LONG_WORD_RATIO
+
+
+def extract_resume_text(resume_path, timings: dict = None) -> str:
+    """Extract resume text locally when the PDF has a good text layer, otherwise with LlamaParse."""
+    if settings.LOCAL_PDF_EXTRACTION:
+        with metrics.timer("local_pdf", timings):
+            text = extract_pdf_text_locally(resume_path)
+        if is_usable_text(text):
+            logger.info(f"Extracted resume text locally for {resume_path}")
+            return text
+        logger.info(f"Local text layer unusable for {resume_path}, falling back to LlamaParse")
+
+    with metrics.timer("llamaparse", timings):
+        return llamaparse_pdf_v1(resume_path)
+
+
+def _llamaparse_client() -> LlamaParse:
+    """One LlamaParse client per process instead of one per resume."""
+    global _llama_parser
+    if _llama_parser is None:
+        _llama_parser = LlamaParse(
+            api_key=os.getenv("LLAMA_PARSE_API_KEY"),
+            num_workers=4,
+            verbose=True,
+            language="en",
+        )
+    return _llama_parser
+
 
+def llamaparse_pdf_v1(resume_path) -> str:
     # sync
-    result = parser.parse(full_path)
-
-    # get the llama-index text documents
-    text_documents = result.get_text_documents(split_by_page=False)
-
-    # access the raw job result
-    # Items will vary based on the parser configuration
-    # for page in result.pages:
-    #     print(page.text)
-    #     print(page.md)
-    #     print(page.images)
-    #     print(page.layout)
-    #     print(page.structuredData)
-    return result.pages[0].text
+    result = _llamaparse_client().parse(_resume_full_path(resume_path))
+
+    # Concatenate every page; multi-page resumes used to lose everything after page one
+    return "\n\n".join(page.text for page in result.pages if page.text)
@@ -1,17 +1,27 @@
+import hashlib
 import os
-import threading
 import time
 import uuid
 
 from django.conf import settings
+from interview.job_queue import enqueue
 from interview.models.interview_session import InterviewSession
-from interview.utils import get_questions_using_openai
+from interview.utils import (
+    enqueue_question_pregeneration,
+    fill_questions_from_bank,
+    promote_speculative_questions,
+)
 from jobify_backend.logger import logger
 from rest_framework import status
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 
-from .utils import check_file_size_with_message, get_session_by_id, parse_resume
+from .grammar import page_grammar_results
+from .utils import (
+    check_file_size_with_message,
+    get_parsed_resume,
+    get_session_by_id,
+)
 
 
 @api_view(["POST"])
@@ -71,11 +81,13 @@ def upload_resume(request):
     # Make sure the directory exists
     os.makedirs(os.path.dirname(save_path), exist_ok=True)
 
-    # Save file to disk
+    # Save file to disk, hashing the bytes on the way through
+    content_hash = hashlib.sha256()
     try:
         with open(save_path, "wb") as destination:
             for chunk in file.chunks():
                 destination.write(chunk)
+                content_hash.update(chunk)
         logger.info(f"File saved successfully to: {save_path}")
     except IOError as e:
         logger.error(
@@ -91,12 +103,53 @@ def upload_resume(request):
             status=status.HTTP_500_INTERNAL_SERVER_ERROR,
         )
 
+    resume_hash = content_hash.hexdigest()
+    parsed_resume = get_parsed_resume(resume_hash)
+
     # Store file metadata in database
     try:
-        interview_session = InterviewSession.objects.create(
-            id=session_id, resume_local_path=save_path
-        )
-        logger.info(f"Interview session record created in database: {session_id}")
+        if parsed_resume:
+            # Same bytes as a resume we already processed: reuse its results.
+            # Without grammar results (the check failed that time), run the check again
+            has_grammar = parsed_resume.grammar_results is not None
+            interview_session = InterviewSession.objects.create(
+                id=session_id,
+                resume_local_path=save_path,
+                resume_hash=resume_hash,
+                keywords=parsed_resume.keywords,
+                grammar_results=parsed_resume.grammar_results,
+                resume_status=InterviewSession.Status.COMPLETE,
+                keywords_status=InterviewSession.Status.COMPLETE,
+                grammar_status=(
+                    InterviewSession.Status.COMPLETE if has_grammar else InterviewSession.Status.PROCESSING
+                ),
+            )
+            logger.info(
+                f"Interview session record created from parsed resume {resume_hash}: {session_id}"
+            )
+            try:
+                enqueue_question_pregeneration(interview_session.id)
+            except Exception as e:
+                logger.error(f"Failed to queue question pre-generation: {str(e)}")
+            if not has_grammar:
+                try:
+                    enqueue(
+                        "check_grammar",
+                        interview_session.id,
+                        resume_hash,
+                        session_id=interview_session.id,
+                        dedupe_key=f"check_grammar:{interview_session.id}",
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to queue grammar check: {str(e)}")
+                    InterviewSession.objects.filter(id=session_id).update(
+                        grammar_status=InterviewSession.Status.FAILED
+                    )
+        else:
+            interview_session = InterviewSession.objects.create(
+                id=session_id, resume_local_path=save_path, resume_hash=resume_hash
+            )
+            logger.info(f"Interview session record created in database: {session_id}")
     except Exception as e:
         logger.error(f"Failed to create resume record in database: {str(e)}")
         logger.info("=== UPLOAD RESUME REQUEST FAILED - DATABASE ERROR ===")
@@ -110,13 +163,20 @@ def upload_resume(request):
         f"Resume uploaded successfully: id={session_id}, filename={filename}, file_size={file.size} bytes"
     )
 
-    # Start background parsing
-    try:
-        threading.Thread(target=parse_resume, args=(interview_session.id,)).start()
-        logger.info(f"Background parsing thread started for id: {session_id}")
-    except Exception as e:
-        logger.error(f"Failed to start background parsing thread: {str(e)}")
-        # Don't fail the request, just log the error
+    # Queue background parsing
+    if interview_session.resume_status != InterviewSession.Status.COMPLETE:
+        try:
+            enqueue(
+                "parse_resume",
+                interview_session.id,
+                session_id=interview_session.id,
+                priority=2,
+                dedupe_key=f"parse_resume:{interview_session.id}",
+            )
+            logger.info(f"Background parsing job queued for id: {session_id}")
+        except Exception as e:
+            logger.error(f"Failed to queue background parsing job: {str(e)}")
+            # Don't fail the request, just log the error
 
     logger.info("=== UPLOAD RESUME REQUEST COMPLETED SUCCESSFULLY ===")
     return Response(
@@ -125,11 +185,38 @@ def upload_resume(request):
     )
 
 
+def restart_resume_parse(session):
+    """
+    Move a FAILED session back to PROCESSING and queue its parse again.
+    Concurrent polls attach to the same parse job instead of starting another;
+    a parse still running (it may have just marked the session FAILED) runs
+    once more when it finishes, so the session is not left in PROCESSING.
+    """
+    session.resume_status = InterviewSession.Status.PROCESSING
+    session.keywords_status = InterviewSession.Status.PROCESSING
+    session.grammar_status = InterviewSession.Status.PROCESSING
+    session.save(update_fields=["resume_status", "keywords_status", "grammar_status"])
+    enqueue(
+        "parse_resume",
+        session.id,
+        session_id=session.id,
+        priority=2,
+        dedupe_key=f"parse_resume:{session.id}",
+        rerun=True,
+    )
+
+
 @api_view(["POST"])
 def get_grammar_results(request):
     """
     Retrieve grammar check results for a given id.
-    Returns processing status and grammar check results.
+    Returns processing status and one page of grammar check results.
+
+    Optional body parameters:
+        - page: 1-based page number (default 1)
+        - page_size: matches per page (default GRAMMAR_PAGE_SIZE)
+        - category: category id(s) to keep, e.g. "TYPOS" or ["TYPOS", "GRAMMAR"]
+        - rule: rule id(s) to keep
     """
     logger.info("=== GET GRAMMAR RESULTS REQUEST STARTED ===")
     logger.info(f"Request data: {request.data}")
@@ -143,7 +230,7 @@ def get_grammar_results(request):
             status=status.HTTP_400_BAD_REQUEST,
         )
 
-    session = get_session_by_id(session_id)
+    session = get_session_by_id(session_id, only=InterviewSession.STATUS_FIELDS)
     if not session:
         logger.warning(f"Grammar results requested for non-existent id: {session_id}")
         logger.info("=== GET GRAMMAR RESULTS REQUEST FAILED - RESUME NOT FOUND ===")
@@ -155,7 +242,7 @@ def get_grammar_results(request):
     # Check processing status
     if session.resume_status == InterviewSession.Status.FAILED:
         logger.error(f"Resume processing failed for id: {session_id}, restarting parse")
-        threading.Thread(target=parse_resume, args=(session.id,)).start()
+        restart_resume_parse(session)
         logger.info(
             "=== GET GRAMMAR RESULTS REQUEST - PROCESSING FAILED, RESTARTING ==="
         )
@@ -168,22 +255,38 @@ def get_grammar_results(request):
             status=status.HTTP_500_INTERNAL_SERVER_ERROR,
         )
 
-    elif session.resume_status == InterviewSession.Status.PROCESSING:
-        logger.info(f"Resume still processing for id: {session_id}")
-        logger.info("=== GET GRAMMAR RESULTS REQUEST - STILL PROCESSING ===")
+    # The grammar check finishes independently of keyword extraction
+    elif session.resume_status == InterviewSession.Status.COMPLETE or session.grammar_status in (
+        InterviewSession.Status.COMPLETE,
+        InterviewSession.Status.FAILED,
+    ):
+        try:
+            grammar_check = page_grammar_results(
+                session.grammar_results,
+                page=request.data.get("page"),
+                page_size=request.data.get("page_size"),
+                categories=request.data.get("category"),
+                rules=request.data.get("rule"),
+            )
+        except (TypeError, ValueError) as e:
+            return Response(
+                {"finished": False, "grammar_check": None, "error": f"Invalid pagination: {e}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        logger.info(
+            f"Resume processing complete for id: {session_id}, grammar matches: {grammar_check['total']}"
+        )
+        logger.info("=== GET GRAMMAR RESULTS REQUEST COMPLETED SUCCESSFULLY ===")
         return Response(
-            {"finished": False, "grammar_check": None, "error": ""},
+            {"finished": True, "grammar_check": grammar_check, "error": ""},
             status=status.HTTP_200_OK,
         )
 
-    elif session.resume_status == InterviewSession.Status.COMPLETE:
-        grammar_results = session.grammar_results or {}
-        logger.info(
-            f"Resume processing complete for id: {session_id}, grammar results count: {len(grammar_results)}"
-        )
-        logger.info("=== GET GRAMMAR RESULTS REQUEST COMPLETED SUCCESSFULLY ===")
+    elif session.resume_status == InterviewSession.Status.PROCESSING:
+        logger.info(f"Resume still processing for id: {session_id}")
+        logger.info("=== GET GRAMMAR RESULTS REQUEST - STILL PROCESSING ===")
         return Response(
-            {"finished": True, "grammar_check": grammar_results, "error": ""},
+            {"finished": False, "grammar_check": None, "error": ""},
             status=status.HTTP_200_OK,
         )
 
@@ -217,7 +320,7 @@ def get_keywords(request):
         )
 
     logger.info(f"Looking up resume for id: {session_id}")
-    resume = get_session_by_id(session_id)
+    resume = get_session_by_id(session_id, only=InterviewSession.STATUS_FIELDS)
     if not resume:
         logger.warning(f"Keywords requested for non-existent id: {session_id}")
         logger.info("=== GET KEYWORDS REQUEST FAILED - RESUME NOT FOUND ===")
@@ -231,7 +334,7 @@ def get_keywords(request):
     # Check processing status
     if resume.resume_status == InterviewSession.Status.FAILED:
         logger.error(f"Resume processing failed for id: {session_id}, restarting parse")
-        threading.Thread(target=parse_resume, args=(resume.id,)).start()
+        restart_resume_parse(resume)
         logger.info("=== GET KEYWORDS REQUEST - PROCESSING FAILED, RESTARTING ===")
         return Response(
             {
@@ -241,13 +344,11 @@ def get_keywords(request):
             },
             status=status.HTTP_500_INTERNAL_SERVER_ERROR,
         )
-    elif resume.resume_status == InterviewSession.Status.PROCESSING:
-        logger.info(f"Resume still processing for id: {session_id}")
-        logger.info("=== GET KEYWORDS REQUEST - STILL PROCESSING ===")
-        return Response(
-            {"finished": False, "keywords": [], "error": ""}, status=status.HTTP_200_OK
-        )
-    elif resume.resume_status == InterviewSession.Status.COMPLETE:
+    # Keywords are ready as soon as their stage finishes, even if grammar is still running
+    elif (
+        resume.resume_status == InterviewSession.Status.COMPLETE
+        or resume.keywords_status == InterviewSession.Status.COMPLETE
+    ):
         keywords = resume.keywords or []
         logger.info(
             f"Resume processing complete for id: {session_id}, keywords count: {len(keywords)}"
@@ -258,6 +359,12 @@ def get_keywords(request):
             {"finished": True, "keywords": keywords, "error": ""},
             status=status.HTTP_200_OK,
         )
+    elif resume.resume_status == InterviewSession.Status.PROCESSING:
+        logger.info(f"Resume still processing for id: {session_id}")
+        logger.info("=== GET KEYWORDS REQUEST - STILL PROCESSING ===")
+        return Response(
+            {"finished": False, "keywords": [], "error": ""}, status=status.HTTP_200_OK
+        )
 
     # Unknown status
     logger.error(f"Unknown resume status: {resume.resume_status} for id: {session_id}")
@@ -314,15 +421,28 @@ def target_job(request):
         logger.info("=== TARGET JOB REQUEST FAILED - RESUME NOT FOUND ===")
         return Response({"error": "Resume not found"}, status=status.HTTP_404_NOT_FOUND)
 
-    # Save target job
+    # Save target job; only these fields, so pre-generated questions stored meanwhile survive
     resume.target_job = title
     resume.answer_type = answer_type
-    resume.save()
+    resume.question_status = InterviewSession.Status.PROCESSING
+    resume.save(update_fields=["target_job", "answer_type", "question_status"])
     logger.info(
         f"Target job updated for id: {session_id}, new: '{title}', answer_type: '{answer_type}'"
     )
+    if promote_speculative_questions(resume):
+        logger.info(f"Pre-generated questions promoted for id: {session_id}")
+    elif fill_questions_from_bank(resume):
+        logger.info(f"Questions filled from question bank for id: {session_id}")
+    else:
+        enqueue(
+            "generate_questions",
+            resume.id,
+            session_id=resume.id,
+            priority=1,
+            dedupe_key=f"generate_questions:{resume.id}",
+            rerun=True,  # a job still generating for the previous title runs again for this one
+        )
     logger.info("=== TARGET JOB REQUEST COMPLETED SUCCESSFULLY ===")
-    threading.Thread(target=get_questions_using_openai, args=(resume,)).start()
     return Response(
         {
             "id": session_id,